@@ -0,0 +1,305 @@
+"""
+Async BasePage module: the `pages/base_page.py` actions on
+`playwright.async_api`, for scenarios run by
+`helpers.async_runner.AsyncScenarioRunner`.
+All methods expect Locator objects for reliable interactions.
+"""
+
+import time
+from playwright.async_api import Locator, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from helpers.async_runner import step
+from pages.base_page import (
+    BULK_FILL_SCRIPT,
+    COLLECTION_STATE_SCRIPT,
+    COLLECTION_WAIT_ELEMENTS_SCRIPT,
+    COLLECTION_WAIT_SCRIPT,
+    FIELD_STATE_SCRIPT,
+    FORM_SNAPSHOT_SCRIPT,
+    Option,
+    Ready,
+    collection_expectations,
+    collection_size,
+    collection_mismatches,
+    css_chain,
+    css_selector,
+    ready_for,
+    register_ready,
+)
+
+
+class BasePage:
+    """
+    Base class for page objects with common actions.
+
+    By default every action waits for its element to be visible first.
+    With `auto_wait` set (--auto-wait) actions rely on the actionability
+    checks of the action itself instead, which saves one driver round
+    trip per action. Timeouts stay the same; reads wait for the element
+    to be attached rather than visible.
+
+    Locators, page paths and `Ready` conditions are declared as in the
+    sync page objects.
+    """
+
+    __slots__ = ("page", "base_url", "_locators")
+
+    path = None
+    ready = None
+    # Readiness conditions of the async pages, apart from the sync ones.
+    ready_by_path = {}
+    wait_until = "domcontentloaded"
+    auto_wait = False
+    strict_fill = False
+    click_timeout = 20000
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        """Initialize with Playwright page and optional base URL."""
+        self.page = page
+        self.base_url = base_url
+        self._locators = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        register_ready(cls)
+
+    def locator(self, selector: str, has_text: str = None) -> Locator:
+        """
+        Return a page locator for a selector built at run time, memoized
+        per page object like the `Element` declarations.
+        """
+        key = (selector, has_text)
+        try:
+            return self._locators[key]
+        except KeyError:
+            locator = self._locators[key] = self.page.locator(
+                selector, has_text=has_text
+            )
+            return locator
+
+    @step("Go to page: {path}", primitive=True)
+    async def goto(self, path: str = "/", timeout: int = 30000) -> None:
+        """Navigate to a URL path and wait until the page is ready."""
+        ready = ready_for(path, type(self))
+        if ready is not None and ready.response is not None:
+            async with self.page.expect_response(
+                ready.response, timeout=timeout
+            ):
+                await self.page.goto(
+                    self.base_url + path,
+                    wait_until=self.wait_until,
+                    timeout=timeout
+                )
+        else:
+            await self.page.goto(
+                self.base_url + path,
+                wait_until=self.wait_until,
+                timeout=timeout
+            )
+        if ready is not None:
+            await self.wait_until_ready(ready, timeout)
+
+    async def wait_until_ready(self, ready: Ready,
+                               timeout: int = 30000) -> None:
+        """Wait for the load state and key element of a condition."""
+        if ready.state is not None:
+            await self.page.wait_for_load_state(ready.state, timeout=timeout)
+        if ready.selector is not None:
+            await self.locator(ready.selector).wait_for(
+                state="visible", timeout=timeout
+            )
+
+    @step("Click element", primitive=True)
+    async def click(self, locator: Locator) -> None:
+        """Wait for element and click."""
+        if self.auto_wait:
+            await locator.click(timeout=self.click_timeout)
+            return
+        await locator.wait_for(state="visible", timeout=self.click_timeout)
+        await locator.click()
+
+    @step("Fill element with text: {text}", primitive=True)
+    async def fill(self, locator: Locator, text: str) -> None:
+        """Wait for element and fill text."""
+        if not self.auto_wait:
+            await locator.wait_for(state="visible")
+        await locator.fill(text)
+
+    @step("Get text from element", primitive=True)
+    async def get_text(self, locator: Locator) -> str:
+        """Return trimmed inner text of element."""
+        if not self.auto_wait:
+            await locator.wait_for(state="visible")
+        return (await locator.inner_text()).strip()
+
+    @step("Get value from input", primitive=True)
+    async def get_value(self, locator: Locator) -> str:
+        """Return value of input element."""
+        if not self.auto_wait:
+            await locator.wait_for(state="visible")
+        return await locator.input_value()
+
+    @step("Check visibility of element", primitive=True)
+    async def is_visible(self, locator: Locator) -> bool:
+        """Return True if element is visible."""
+        await locator.wait_for(state="visible")
+        if self.auto_wait:
+            return True
+        return await locator.is_visible()
+
+    @step("Check checkbox", primitive=True)
+    async def check(self, locator: Locator) -> None:
+        """Check checkbox if not checked."""
+        if self.auto_wait:
+            await locator.check()
+            return
+        await locator.wait_for(state="visible")
+        if not await locator.is_checked():
+            await locator.check()
+
+    @step("Uncheck checkbox", primitive=True)
+    async def uncheck(self, locator: Locator) -> None:
+        """Uncheck checkbox if checked."""
+        if self.auto_wait:
+            await locator.uncheck()
+            return
+        await locator.wait_for(state="visible")
+        if await locator.is_checked():
+            await locator.uncheck()
+
+    @step("Verify if checkbox is checked", primitive=True)
+    async def is_checked(self, locator: Locator) -> bool:
+        """Return True if checkbox is checked."""
+        if not self.auto_wait:
+            await locator.wait_for(state="visible")
+        return await locator.is_checked()
+
+    @step("Select option '{value}' from dropdown", primitive=True)
+    async def select_option(self, locator: Locator, value: str) -> None:
+        """Select a value from dropdown."""
+        if not self.auto_wait:
+            await locator.wait_for(state="visible")
+        await locator.select_option(value)
+
+    @step("Read form snapshot", primitive=True)
+    async def snapshot_form(self, fields: dict) -> dict:
+        """
+        Read the value, checked state and selected option texts of named
+        locators in one round trip. Returns
+        {name: {"value": ..., "checked": ..., "selected": [...]}}.
+        Locators without a plain CSS selector, and elements not in the
+        page yet, are read one by one with the usual wait.
+        """
+        selectors = {}
+        for name, locator in fields.items():
+            selector = css_selector(locator, self.page)
+            if selector:
+                selectors[name] = selector
+        snapshot = (
+            await self.page.evaluate(FORM_SNAPSHOT_SCRIPT, selectors)
+            if selectors else {}
+        )
+        return {
+            name: snapshot.get(name) or await self._read_field(locator)
+            for name, locator in fields.items()
+        }
+
+    async def _read_field(self, locator: Locator) -> dict:
+        """Return the snapshot state of a single element."""
+        if not self.auto_wait:
+            await locator.wait_for(state="visible")
+        return await locator.evaluate(FIELD_STATE_SCRIPT)
+
+    @step("Fill form", primitive=True)
+    async def fill_form(self, values: dict, strict: bool = None,
+                        timeout: float = None) -> None:
+        """
+        Fill several fields at once. `values` maps locators to a text,
+        an `Option` for dropdowns, or a bool for checkboxes.
+
+        The fields are filled in one browser-side batch as soon as all of
+        them are visible, firing input and change events. With `strict`
+        (default: --strict-fill), or when a locator is not plain CSS,
+        every field goes through its Playwright action instead.
+        `timeout` bounds the wait for the fields of the batch.
+        """
+        if strict is None:
+            strict = self.strict_fill
+        selectors = [css_selector(locator, self.page) for locator in values]
+        if strict or not all(selectors):
+            for locator, value in values.items():
+                await self._fill_field(locator, value)
+            return
+        await self.page.wait_for_function(
+            BULK_FILL_SCRIPT,
+            arg=[list(field) for field in zip(selectors, values.values())],
+            timeout=timeout
+        )
+
+    @step("Verify collection", primitive=True)
+    async def verify_collection(self, locator: Locator, count: int = None,
+                                visible: bool = None, texts=None,
+                                contains: bool = False,
+                                attributes: dict = None,
+                                timeout: float = 30000) -> list[dict]:
+        """
+        Verify every element matched by a locator at once, polling in
+        the browser until `timeout` ms; see the sync BasePage.
+        """
+        names = list(attributes or {})
+        expected = collection_expectations(
+            count, visible, texts, contains, attributes
+        )
+        chain = css_chain(locator, self.page)
+        if chain is not None:
+            try:
+                await self.page.wait_for_function(
+                    COLLECTION_WAIT_SCRIPT, arg=[chain, names, expected],
+                    timeout=timeout
+                )
+            except PlaywrightTimeoutError:
+                pass
+        else:
+            remaining = await self._wait_for_first(
+                locator, expected, timeout
+            )
+            if remaining:
+                await locator.evaluate_all(
+                    COLLECTION_WAIT_ELEMENTS_SCRIPT,
+                    [names, expected, remaining]
+                )
+        states = await locator.evaluate_all(COLLECTION_STATE_SCRIPT, names)
+        mismatches = collection_mismatches(
+            states, count, visible, texts, contains, attributes
+        )
+        if mismatches:
+            raise AssertionError("\n".join(mismatches))
+        return states
+
+    @staticmethod
+    async def _wait_for_first(locator: Locator, expected: dict,
+                              timeout: float) -> float:
+        """
+        Wait for the first element of a collection expected not to be
+        empty; see the sync BasePage.
+        """
+        if collection_size(expected) == 0:
+            return timeout
+        started = time.monotonic()
+        try:
+            await locator.first.wait_for(state="attached", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return 0
+        return max(timeout - (time.monotonic() - started) * 1000, 1)
+
+    async def _fill_field(self, locator: Locator, value) -> None:
+        """Fill one fill_form field with its Playwright action."""
+        if isinstance(value, bool):
+            if value:
+                await self.check(locator)
+            else:
+                await self.uncheck(locator)
+        elif isinstance(value, Option):
+            await self.select_option(locator, value)
+        else:
+            await self.fill(locator, value)
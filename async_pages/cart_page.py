@@ -0,0 +1,106 @@
+"""
+    Async page object for the Cart Page.
+"""
+from playwright.async_api import expect
+from helpers.async_runner import step
+from async_pages.base_page import BasePage
+from pages.base_page import Element, Ready
+
+
+class CartPage(BasePage):
+    """Cart class representing page objects with actions."""
+
+    __slots__ = ()
+
+    path = "/view_cart"
+    ready = Ready("#cart_info_table")
+
+    product_rows = Element("table#cart_info_table tbody tr")
+    quantity_button = Element("td.cart_quantity button")
+    proceed_to_checkout_button = Element('a.btn.btn-default.check_out')
+    register_login_link = Element(
+        'a[href="/login"]', has_text="Register / Login"
+    )
+
+    @step("Verify product in cart")
+    async def verify_product(
+       self,
+       product_id: str,
+       expected_price: str,
+       expected_qty: str,
+       expected_total: str
+    ):
+        """
+        Verify product details in cart
+        """
+        row = f"tr#{product_id}"
+        price = self.locator(f"{row} .cart_price p")
+        qty = self.locator(f"{row} .cart_quantity button")
+        total = self.locator(f"{row} .cart_total p")
+
+        await expect(price).to_have_text(expected_price)
+        await expect(qty).to_have_text(expected_qty)
+        await expect(total).to_have_text(expected_total)
+
+    @step("Get number of products in cart")
+    async def get_product_count(self):
+        """
+        Get number of products in cart
+        """
+        return await self.product_rows.count()
+
+    @step("Verify quantity of product is {expected_quantity}")
+    async def verify_quantity(self, expected_quantity: int):
+        """
+        Verify product quantity
+        """
+        quantity_text = await self.quantity_button.inner_text()
+        actual_quantity = int(quantity_text)
+        assert actual_quantity == expected_quantity, (
+         f"Expected quantity {expected_quantity}, "
+         f"but got {actual_quantity}"
+        )
+
+    @step("Click on 'Proceed to checkout' button in view cart page")
+    async def click_proceed_to_checkout_button(self):
+        """
+        Click on 'Proceed to checkout' button in view cart page
+        """
+        await self.proceed_to_checkout_button.wait_for(
+            state="visible", timeout=5000
+        )
+        await self.proceed_to_checkout_button.click()
+
+    @step("Click on 'Register/Login' link in Checkout")
+    async def click_register_login_link(self):
+        """
+        Click on 'Register/Login' link in Checkout
+        """
+        await self.register_login_link.wait_for(state="visible", timeout=5000)
+        await self.register_login_link.click()
+
+    async def delete_product_by_id(self, product_id: str):
+        """
+        Clicks the delete button for a specific product by data-product-id
+        """
+        selector = f"a.cart_quantity_delete[data-product-id='{product_id}']"
+        await self.page.click(selector)
+
+    async def delete_multiple_products(self, product_ids: list[str]):
+        """
+        Delete multiple products from the cart by their IDs
+        """
+        for product_id in product_ids:
+            self.delete_product_by_id(product_id)
+            selector = (
+               f"a.cart_quantity_delete"
+               f"[data-product-id='{product_id}']"
+            )
+            await expect(self.locator(selector)).not_to_be_visible()
+
+    async def verify_product_removed(self, product_id: str):
+        """
+        Verify the product is no longer visible in the cart
+        """
+        selector = f"a.cart_quantity_delete[data-product-id='{product_id}']"
+        await expect(self.locator(selector)).not_to_be_visible()
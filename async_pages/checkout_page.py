@@ -0,0 +1,94 @@
+"""
+    Async page object for the Checkout Page.
+"""
+import re
+from playwright.async_api import expect
+from helpers.async_runner import step
+from async_pages.base_page import BasePage
+from pages.base_page import Element, Ready
+
+
+class CheckoutPage(BasePage):
+    """Checkout class representing page objects with actions."""
+
+    __slots__ = ()
+
+    path = "/checkout"
+    ready = Ready("#address_delivery")
+
+    delivery_address = Element("#address_delivery")
+    billing_address = Element("#address_invoice")
+    product_name = Element(".cart_description h4 a")
+    category = Element(".cart_description p")
+    price = Element(".cart_price p")
+    quantity = Element(".cart_quantity button")
+    total = Element(".cart_total p")
+    comment_textarea = Element("textarea[name='message']")
+    place_order_button = Element('a[href="/payment"]', has_text="Place Order")
+
+    @step("Verify delivery and billing addresses")
+    async def verify_addresses(
+        self,
+        expected_delivery_components: dict,
+        expected_billing_components: dict
+    ):
+        """
+        Verify delivery and billing addresses.
+        """
+        await expect(self.delivery_address).to_be_visible()
+        await expect(self.billing_address).to_be_visible()
+
+        delivery_text = re.sub(
+            r"\s+",
+            " ",
+            await self.delivery_address.inner_text()
+        ).strip().lower()
+
+        billing_text = re.sub(
+            r"\s+",
+            " ",
+            await self.billing_address.inner_text()
+        ).strip().lower()
+
+        for key, value in expected_delivery_components.items():
+            assert str(value).lower() in delivery_text, (
+                f"{key} '{value}' not found in delivery address: "
+                f"'{delivery_text}'"
+            )
+
+        for key, value in expected_billing_components.items():
+            assert str(value).lower() in billing_text, (
+                f"{key} '{value}' not found in billing address: "
+                f"'{billing_text}'"
+            )
+
+    @step("Verify Review Your Order")
+    async def verify_product_details_visible(self):
+        """
+        Verify product details in the Review your order.
+        """
+        for locator, name in [
+            (self.product_name, "Product Name"),
+            (self.category, "Category"),
+            (self.price, "Price"),
+            (self.quantity, "Quantity"),
+            (self.total, "Total"),
+        ]:
+            await locator.wait_for(state="visible", timeout=5000)
+            text = (await locator.text_content()).strip()
+            assert text != "", f"{name} is not visible or empty"
+
+    @step("Fill comment in the checkout: comment: {comment}")
+    async def fill_comment_input_field(self, comment):
+        """
+        Fill comment in the input field in the checkout.
+        """
+        await self.comment_textarea.fill(comment)
+
+    @step("Click on 'Place Order' button")
+    async def click_place_order_button(self):
+        """
+        Click on 'Place Order' button
+        """
+        await self.place_order_button.wait_for(state="visible", timeout=5000)
+        await self.place_order_button.click()
@@ -0,0 +1,79 @@
+"""
+    Async page object for the Contact us Page.
+"""
+import logging
+from helpers.async_runner import step
+from async_pages.base_page import BasePage
+from pages.base_page import Element, Ready
+
+logger = logging.getLogger(__name__)
+
+
+class ContactUsPage(BasePage):
+    """
+    Provides methods to interact with Contact us form fields.
+    """
+    __slots__ = ()
+
+    path = "/contact_us"
+    ready = Ready("div.contact-form")
+
+    get_in_touch_text = Element('div.contact-form h2.title')
+    name_input_field = Element('[data-qa="name"]')
+    email_input_field = Element('[data-qa="email"]')
+    subject_input_field = Element('[data-qa="subject"]')
+    message_input_field = Element('[data-qa="message"]')
+    upload_input = Element('input[name="upload_file"]')
+    submit_button = Element('input[data-qa="submit-button"]')
+    success_message = Element('div.status.alert.alert-success')
+    home_link = Element('a.btn-success')
+
+    @step("Verify 'GET IN TOUCH' text is visible")
+    async def verify_get_in_touch_text(self, expected_text):
+        """
+        Verify 'GET IN TOUCH' text is visible.
+        """
+        await self.get_in_touch_text.wait_for(state="visible", timeout=5000)
+        actual_text = await self.get_in_touch_text.text_content()
+        assert actual_text.strip() == expected_text, (
+          f"Expected '{expected_text}' "
+          f"but got '{actual_text.strip()}'"
+        )
+
+    @step("Fill Contact Us form")
+    async def fill_contact_us_form(
+        self,
+        name: str,
+        email: str,
+        subject: str,
+        message: str
+       ):
+        """
+        Fill Contact us input fields.
+        """
+        await self.fill_form({
+            self.name_input_field: name,
+            self.email_input_field: email,
+            self.subject_input_field: subject,
+            self.message_input_field: message,
+        }, timeout=5000)
+
+    @step("Click Submit button")
+    async def click_submit_button(self):
+        """
+        Click on the Submit button.
+        """
+        await self.submit_button.wait_for(state="attached", timeout=10000)
+        await self.submit_button.scroll_into_view_if_needed()
+        await self.submit_button.click(force=True)
+
+    @step("Verify form after submit")
+    async def verify_form_after_submit(self):
+        """
+        Verify form after submit.
+        """
+        await self.name_input_field.wait_for(state="visible", timeout=10000)
+        assert (await self.name_input_field.input_value()) == ""
+        assert (await self.email_input_field.input_value()) == ""
+        assert (await self.subject_input_field.input_value()) == ""
+        assert (await self.message_input_field.input_value()) == ""
@@ -0,0 +1,198 @@
+"""
+    Async page object for the Home Page.
+"""
+from playwright.async_api import expect
+from helpers.async_runner import step
+from async_pages.base_page import BasePage
+from pages.base_page import Element, Ready
+
+
+class HomePage(BasePage):
+    __slots__ = ()
+
+    path = "/"
+    ready = Ready("div.carousel-inner")
+
+    signup_login_btn = Element('a[href="/login"]')
+    logged_in_user = Element('a:has-text("Logged in as")')
+    home_slider = Element('div.carousel-inner')
+    contact_us_link = Element('a:has-text("Contact us")')
+    test_cases_link = Element(role="link", name="Test Cases", exact=True)
+    products_link = Element('a[href="/products"]', has_text="Products")
+    cart_link = Element("ul.nav li a[href='/view_cart']")
+
+    footer = Element('#footer')
+    subscription_text = Element('div.single-widget h2')
+    subscription_email_input_field = Element('#susbscribe_email')
+    subscribe_button = Element('#subscribe')
+    success_subscription_message = Element('div.alert-success.alert')
+    recommended_items_title = Element(
+        'div.recommended_items h2.title.text-center'
+    )
+    add_to_cart_buttons_in_recommended = Element(
+        'div.carousel-inner .btn.btn-default.add-to-cart'
+    )
+    scroll_up_arrow_button = Element('a#scrollUp')
+    header_carousel_text = Element('div#slider-carousel h2')
+
+    @step("Go to Home Page")
+    async def go_to_home(self):
+        """
+        Navigate to the Home page and wait until the home slider is visible.
+        """
+        await self.goto("/")
+        await self.home_slider.wait_for(state="visible")
+
+    @step("Click on Signup / Login button")
+    async def go_to_signup_or_login(self):
+        """
+        Navigate to the Sign up/Login forms.
+        """
+        await self.signup_login_btn.click()
+
+    @step("Verify user logged in as {username}")
+    async def verify_logged_in_user(self, username: str):
+        """
+        Verify that the logged-in user text contains the given username.
+        """
+        text = (await self.logged_in_user.inner_text()).strip()
+        assert username in text, (
+          f"Expected username '{username}' "
+          f"to appear in '{text}'"
+        )
+
+    @step("Click on Contact us link in the header")
+    async def go_to_contact_us_form(self):
+        """
+        Navigate to the Contact us form.
+        """
+        await self.contact_us_link.click()
+
+    @step("Click on Test Cases link in the header")
+    async def go_to_test_cases_page(self):
+        """
+        Navigate to the Test cases page.
+        """
+        await self.test_cases_link.wait_for(state="visible")
+        await self.test_cases_link.click()
+
+    @step("Click on Products link in the header")
+    async def go_to_products_page(self):
+        """
+        Navigate to the Products page.
+        """
+        await self.products_link.wait_for(state="visible")
+        await self.products_link.click()
+
+    @step("Click on Cart link in the header")
+    async def go_to_cart_page(self):
+        """
+        Navigate to the Cart page.
+        """
+        await self.cart_link.wait_for(state="visible", timeout=10000)
+        await self.cart_link.click()
+
+    @step("Scroll down to footer")
+    async def scroll_to_footer(self):
+        """
+        Scroll to the footer.
+        """
+        await self.footer.wait_for(state="visible")
+        await self.footer.scroll_into_view_if_needed()
+
+    @step("Verify 'Subscription' text is visible")
+    async def verify_subscription_text(self, expected_text: str):
+        """
+        Verify 'Subscription' text is visible.
+        """
+        await self.subscription_text.wait_for(state="visible", timeout=10000)
+        actual_text = (await self.subscription_text.text_content()).strip()
+        assert actual_text == expected_text, (
+          f"Expected '{expected_text}' "
+          f"but got '{actual_text}'"
+        )
+
+    @step("Fill subscription form: email: {email}")
+    async def fill_subscription_form(self, email: str):
+        """
+        Fill subscription form.
+        """
+        await self.subscription_email_input_field.wait_for(
+         state="visible",
+         timeout=10000
+        )
+
+        await self.subscription_email_input_field.fill(email)
+
+    @step("Click on subscribe button")
+    async def click_subscribe_button(self):
+        """
+        Click on subscribe button after the button becomes visible.
+        """
+        await self.subscribe_button.wait_for(state="visible")
+        await self.subscribe_button.click()
+
+    @step("Verify success message after subscription")
+    async def verify_success_message(self, expected_message: str):
+        """
+        Verify success message text after subscription.
+        """
+        await self.success_subscription_message.wait_for(
+            state="visible", timeout=5000
+            )
+        actual = (
+            await self.success_subscription_message.text_content()
+        ).strip()
+        assert expected_message in actual, (
+          f"Expected '{expected_message}', "
+          f"but got '{actual}'"
+        )
+
+    @step("Verify Recommended items titles")
+    async def verify_recommended_items_text(self, expected_text: str):
+        """
+        Verify Recommended items titles text.
+        """
+        recommended_items_title = self.recommended_items_title
+        await self.recommended_items_title.wait_for(
+            state="visible",
+            timeout=5000
+        )
+        await expect(recommended_items_title).to_contain_text(expected_text)
+
+    @step(
+        "Click on the first 'Add to cart' button "
+        "in the Recommended items"
+    )
+    async def click_first_add_to_cart(self):
+        """
+        Click on the first 'Add to cart' button in the Recommended items list.
+        """
+        first_add_to_cart = self.add_to_cart_buttons_in_recommended.first
+        await first_add_to_cart.wait_for(state="visible", timeout=40000)
+        await first_add_to_cart.click()
+
+    @step("Click on scroll up arrow button")
+    async def click_scroll_up_arrow_button(self):
+        """
+        Click on the croll up arrow button.
+        """
+        await self.scroll_up_arrow_button.wait_for(state="visible")
+        await self.scroll_up_arrow_button.click()
+
+    @step("Verify all header carousel texts are the same")
+    async def verify_header_carousel_texts(self, expected_text: str):
+        """
+        Verify all header carousel elements display the same text.
+        Only the texts are checked: the slides take turns being visible.
+        """
+        await self.verify_collection(
+            self.header_carousel_text, texts=expected_text, timeout=20000
+        )
+
+    @step("Scroll page to the top with keyboard")
+    async def scroll_to_top_with_keyboard(self):
+        """
+        Scroll the page to the top by pressing the Home key.
+        """
+        await self.page.keyboard.press("Home")
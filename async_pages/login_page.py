@@ -0,0 +1,405 @@
+"""
+    Async page object for the Login Page.
+"""
+from playwright.async_api import Page
+from helpers.async_runner import step
+from async_pages.base_page import BasePage, Option
+from pages.base_page import Element, Ready
+
+
+class LoginPage(BasePage):
+    """
+    Provides methods to interact with login form fields,
+    submit form.
+
+    Accounts signed up through the form are recorded in
+    `account_registry` when it is set, so the session sweeper deletes
+    them even if the test fails before deleting them itself.
+    """
+
+    __slots__ = ("_signup_email", "_signup_password")
+
+    path = "/login"
+    ready = Ready('[data-qa="login-button"]')
+
+    account_registry = None
+    ui_account_deletion = True
+
+    new_user_signup_text = Element("div.signup-form h2")
+    name_input_field = Element('[data-qa="signup-name"]')
+    sign_up_email_input_field = Element('[data-qa="signup-email"]')
+    sign_up_button = Element('[data-qa="signup-button"]')
+    mrs_title_radio = Element('#id_gender2')
+    account_info_title = Element("h2.title", nth=0)
+    name_field = Element("#name")
+    email_field = Element("#email")
+    password_field = Element('input[name="password"]')
+    day_dropdown = Element('select[name="days"]')
+    month_dropdown = Element('select[name="months"]')
+    year_dropdown = Element('select[name="years"]')
+    newsletter_checkbox = Element("#newsletter")
+    special_offer_checkbox = Element("#optin")
+    first_name = Element('#first_name')
+    last_name = Element('#last_name')
+    company = Element('#company')
+    address_first = Element('#address1')
+    address_second = Element('#address2')
+    country = Element('#country')
+    state = Element('#state')
+    city = Element('#city')
+    zipcode = Element("#zipcode")
+    mobile_number = Element('#mobile_number')
+    create_account_button = Element('[data-qa="create-account"]')
+    account_created_text = Element('[data-qa="account-created"]')
+    continue_button = Element('[data-qa="continue-button"]')
+    logged_in_user_navbar_item = Element(
+        "ul.nav li a:has-text('Logged in as')"
+    )
+    delete_account_navbar_item = Element(
+        "ul.nav li a:has-text('Delete Account')"
+    )
+    verify_login_to_account_text = Element('div.login-form h2')
+    login_email_input_field = Element('[data-qa="login-email"]')
+    login_password_input_field = Element('[data-qa="login-password"]')
+    login_button = Element('[data-qa="login-button"]')
+    logout_navbar_item = Element("ul.nav li a:has-text('Logout')")
+    name_on_card_input_field = Element('[data-qa="name-on-card"]')
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        super().__init__(page, base_url)
+        self._signup_email = None
+        self._signup_password = None
+
+    @step("Verify 'New User Signup!' text is visible")
+    async def verify_new_user_signup_text(self, expected_text):
+        """
+        Verify 'New User Signup!' text is visible.
+        """
+        actual_text = (await self.new_user_signup_text.inner_text()).strip()
+        assert actual_text == expected_text, (
+          f"Expected '{expected_text}' "
+          f"but got '{actual_text}'"
+        )
+
+    @step("Fill signup name: {name} and email: {email}")
+    async def fill_name_email(self, name, email):
+        """
+        Fill signup form.
+        """
+        await self.fill_form({
+            self.name_input_field: name,
+            self.sign_up_email_input_field: email,
+        })
+        self._signup_email = email
+
+    @step("Click Signup button")
+    async def click_signup_button(self):
+        """
+        Click Signup button.
+        """
+        await self.click(self.sign_up_button)
+
+    @step("Verify account information title text")
+    async def verify_account_info_title_text(self, expected_text):
+        """
+        Verify account information title.
+        """
+        await self.account_info_title.wait_for(state="visible")
+        actual_text = (await self.account_info_title.inner_text()).strip()
+        selector_info = getattr(
+           self.account_info_title,
+           "_selector",
+           "<unknown selector>"
+        )
+
+        assert actual_text == expected_text, (
+            f"Expected '{expected_text}' but got '{actual_text}' "
+            f"for locator '{selector_info}'"
+        )
+
+    @step("Select title 'Mrs.'")
+    async def select_mrs_title(self):
+        """
+        Select title 'Mrs.'
+        """
+        await self.click(self.mrs_title_radio)
+
+    @step("Fill account information")
+    async def fill_account_information(
+        self,
+        password,
+        day,
+        month,
+        year,
+        newsletter=True,
+        special_offer=True
+     ):
+        """
+        Fill account information.
+        """
+        fields = {
+            self.password_field: password,
+            self.day_dropdown: Option(day),
+            self.month_dropdown: Option(month),
+            self.year_dropdown: Option(year),
+        }
+        if newsletter:
+            fields[self.newsletter_checkbox] = True
+        if special_offer:
+            fields[self.special_offer_checkbox] = True
+        await self.fill_form(fields)
+        self._signup_password = password
+
+    @step("Verify account information is filled correctly")
+    async def verify_account_information(
+        self,
+        name,
+        email,
+        password,
+        day,
+        month,
+        year,
+        newsletter=True,
+        special_offer=True
+    ):
+        """
+        Verify account information is filled correctly.
+        All fields are read in one round trip.
+        """
+        form = await self.snapshot_form({
+            "name": self.name_field,
+            "email": self.email_field,
+            "password": self.password_field,
+            "day": self.day_dropdown,
+            "month": self.month_dropdown,
+            "year": self.year_dropdown,
+            "newsletter": self.newsletter_checkbox,
+            "special_offer": self.special_offer_checkbox,
+        })
+        assert form["name"]["value"] == name, (
+          f"Expected name '{name}' "
+          f"but got '{form['name']['value']}'"
+        )
+        assert form["email"]["value"] == email, (
+          f"Expected email '{email}' "
+          f"but got '{form['email']['value']}'"
+        )
+        assert form["password"]["value"] != "", (
+          "Password field is empty"
+        )
+        assert form["day"]["value"] == str(day)
+        assert form["month"]["value"] == str(month)
+        assert form["year"]["value"] == str(year)
+        assert form["newsletter"]["checked"] == newsletter
+        assert form["special_offer"]["checked"] == special_offer
+
+    @step("Fill address information")
+    async def fill_address_information(
+        self,
+        first_name,
+        last_name,
+        company,
+        address1,
+        address2,
+        country,
+        state,
+        city,
+        zipcode,
+        mobile_number
+    ):
+        """
+        Fill address information.
+        """
+        await self.fill_form({
+            self.first_name: first_name,
+            self.last_name: last_name,
+            self.company: company,
+            self.address_first: address1,
+            self.address_second: address2,
+            self.country: Option(country),
+            self.state: state,
+            self.city: city,
+            self.zipcode: zipcode,
+            self.mobile_number: mobile_number,
+        })
+
+    @step("Verify address information")
+    async def verify_address_information(
+        self,
+        first_name,
+        last_name,
+        company,
+        address1,
+        address2,
+        country,
+        state,
+        city,
+        zipcode,
+        mobile_number
+    ):
+        """
+        Verify address information.
+        All fields are read in one round trip.
+        """
+        expected = {
+            "first_name": first_name,
+            "last_name": last_name,
+            "company": company,
+            "address1": address1,
+            "address2": address2,
+            "country": country,
+            "state": state,
+            "city": city,
+            "zipcode": zipcode,
+            "mobile_number": mobile_number,
+        }
+        form = await self.snapshot_form({
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "company": self.company,
+            "address1": self.address_first,
+            "address2": self.address_second,
+            "country": self.country,
+            "state": self.state,
+            "city": self.city,
+            "zipcode": self.zipcode,
+            "mobile_number": self.mobile_number,
+        })
+        for field, value in expected.items():
+            assert form[field]["value"] == value, (
+                f"Expected {field} '{value}' "
+                f"but got '{form[field]['value']}'"
+            )
+
+    @step("Click Create Account button")
+    async def click_create_account_button(self):
+        """
+        Click Create Account button and record the account.
+        """
+        await self.click(self.create_account_button)
+        if (self.account_registry is not None
+                and self._signup_email and self._signup_password):
+            self.account_registry.add(
+                self._signup_email, self._signup_password
+            )
+
+    @step("Wait for Account Created text to be visible")
+    async def wait_for_account_created(self, timeout=10000):
+        """
+        Wait for Account Created text to be visible.
+        """
+        await self.account_created_text.wait_for(
+            state="visible", timeout=timeout
+        )
+
+    @step("Click Continue button")
+    async def click_continue_button(self):
+        """
+        Click Continue button.
+        """
+        await self.click(self.continue_button)
+
+    @step("Verify user logged in as {username}")
+    async def verify_logged_in_user(self, username: str):
+        """
+        Verify user logged in.
+        """
+        text = await self.get_text(self.logged_in_user_navbar_item)
+        assert username in text, f"Expected username '{username}' in '{text}'"
+
+    @step("Check whether user is logged in as {username}")
+    async def is_logged_in_as(self, username: str) -> bool:
+        """
+        Return True if the navbar shows the user as logged in.
+        Does not wait for the navbar item to appear.
+        """
+        if not await self.logged_in_user_navbar_item.is_visible():
+            return False
+        return username in (await self.logged_in_user_navbar_item.inner_text())
+
+    @step("Click on Delete Account in the navbar")
+    async def click_delete_account_in_navbar(self):
+        """
+        Click on Delete Account in the navbar.
+        """
+        await self.click(self.delete_account_navbar_item)
+
+    @step("Delete account")
+    async def delete_account(self):
+        """
+        Delete the logged in account through the navbar.
+        Skipped with --skip-ui-account-deletion: the session sweeper
+        deletes the account over HTTP instead.
+        """
+        if not self.ui_account_deletion:
+            return
+        await self.click_delete_account_in_navbar()
+        await self.click_continue_button()
+        if self.account_registry is not None and self._signup_email:
+            self.account_registry.discard(self._signup_email)
+
+    @step("Verify existing email error in the Sign up form")
+    async def verify_existing_email_error(self, expected_text):
+        """
+        Verify existing email error in the Sign up form.
+        """
+        error_message = self.locator("p", has_text=expected_text)
+        await error_message.wait_for(state="visible", timeout=5000)
+        assert await error_message.is_visible(), (
+          f"Expected error message '{expected_text}' not visible"
+        )
+
+    @step("Verify 'Login to your account' text is visible")
+    async def verify_login_to_your_account_text(self, expected_text: str):
+        """
+        Verify 'Login to your account' text is visible.
+        """
+        locator = self.verify_login_to_account_text
+        await locator.wait_for(state="visible", timeout=5000)
+        actual_text = (await locator.text_content()).strip()
+        selector_info = getattr(locator, "_selector", "<unknown selector>")
+        assert actual_text == expected_text, (
+            f"Expected '{expected_text}' but got '{actual_text}' "
+            f"for locator '{selector_info}'"
+        )
+
+    @step("Fill login form: email: {email} and password: {password}")
+    async def fill_login_form(self, email, password):
+        """
+        Fill login form.
+        """
+        await self.fill_form({
+            self.login_email_input_field: email,
+            self.login_password_input_field: password,
+        })
+
+    @step("Click Login button")
+    async def click_login_button(self):
+        """
+        Click Login button.
+        """
+        await self.click(self.login_button)
+
+    @step("Verify incorrect email or password error in the Login form")
+    async def verify_incorrect_email_or_password_error(self, expected_text):
+        """
+        Verify incorrect email or password error in the Login form.
+        """
+        error_message = self.locator(
+           '[action="/login"] p',
+           has_text=expected_text
+        )
+
+        await error_message.wait_for(state="visible", timeout=5000)
+        actual_text = (await error_message.text_content()).strip()
+        print(f"Error message displayed: {actual_text}")
+        assert actual_text == expected_text, (
+            f"Expected error message '{expected_text}' but got '{actual_text}'"
+        )
+
+    @step("Click Logout button")
+    async def click_logout_button(self):
+        """
+        Click Logout button.
+        """
+        await self.click(self.logout_navbar_item)
@@ -0,0 +1,101 @@
+"""
+    Async page object for the Payment Page.
+"""
+from urllib.parse import urljoin
+from playwright.async_api import expect
+from helpers.async_runner import step
+from helpers.invoices import (
+    Invoice, download_path, parse_invoice, parse_invoice_file
+)
+from async_pages.base_page import BasePage
+from pages.base_page import Element, Ready
+
+
+class PaymentPage(BasePage):
+    """
+    Provides methods to interact with payment form fields,
+    submit payment, and verify order placement.
+    """
+
+    __slots__ = ()
+
+    path = "/payment"
+    ready = Ready('[data-qa="name-on-card"]')
+
+    name_on_card_input_field = Element('[data-qa="name-on-card"]')
+    card_number_input_field = Element('[data-qa="card-number"]')
+    cvc_input_field = Element('[data-qa="cvc"]')
+    expiration_input_field = Element('[data-qa="expiry-month"]')
+    year_input_field = Element('[data-qa="expiry-year"]')
+    pay_button = Element('button.submit-button')
+    order_plasced_text = Element('[data-qa="order-placed"]')
+    download_invoice_button = Element('a:has-text("Download Invoice")')
+
+    @step("Fill payment information")
+    async def fill_payment(self, name: str, card_number: str, cvc: str,
+                           expiration: str, year: str):
+        """
+        Fill all payment fields in the payment form.
+        """
+        await self.fill_form({
+            self.name_on_card_input_field: name,
+            self.card_number_input_field: card_number,
+            self.cvc_input_field: cvc,
+            self.expiration_input_field: expiration,
+            self.year_input_field: year,
+        }, timeout=5000)
+
+    @step("Click on 'Pay' button")
+    async def click_pay_button(self):
+        """
+        Click the 'Pay' button to submit the payment.
+
+        Waits until the button is visible before clicking.
+        """
+        await self.pay_button.wait_for(state="visible", timeout=5000)
+        await self.pay_button.click()
+
+    @step("Verify order placed message text")
+    async def verify_order_placed_text(self, expected_text: str):
+        """
+        Verify that the order placed confirmation text is visible and correct.
+        """
+        await expect(self.order_plasced_text).to_be_visible(timeout=10000)
+        actual_text = (await self.order_plasced_text.inner_text()).strip()
+        assert expected_text in actual_text, (
+           f"Expected text '{expected_text}', "
+           f"but got '{actual_text}'"
+        )
+
+    @step("Download invoice")
+    async def download_invoice(self, to_disk: bool = False,
+                               name: str = None,
+                               total: int = None) -> Invoice:
+        """
+        Download the invoice and return it parsed, checking the customer
+        name and total when given. The invoice is fetched into memory
+        with the page's cookies; with `to_disk` it is downloaded through
+        the browser into the worker's download directory instead.
+        """
+        await self.download_invoice_button.wait_for(
+            state="visible", timeout=5000
+        )
+        if to_disk:
+            async with self.page.expect_download() as download_info:
+                await self.download_invoice_button.click()
+            download = await download_info.value
+            path = download_path(download.suggested_filename)
+            await download.save_as(path)
+            invoice = parse_invoice_file(path)
+        else:
+            href = await self.download_invoice_button.get_attribute("href")
+            url = urljoin(self.page.url, href)
+            response = await self.page.request.get(url)
+            assert response.ok, (
+                f"Invoice download '{url}' failed: {response.status}"
+            )
+            invoice = parse_invoice(await response.body())
+
+        errors = invoice.mismatches(name, total)
+        assert not errors, f"Unexpected invoice: {', '.join(errors)}"
+        return invoice
@@ -0,0 +1,84 @@
+"""
+  Async page object for the Product Detail Page.
+"""
+from playwright.async_api import expect
+from helpers.async_runner import step
+from async_pages.base_page import BasePage
+from pages.base_page import Element, Ready
+
+
+class ProductDetailPage(BasePage):
+    """
+    Provides methods to interact with the product detail page elements
+    """
+    __slots__ = ()
+
+    path = r"/product_details/\d+"
+    ready = Ready("div.product-information")
+
+    quantity_input_field = Element('input#quantity')
+    add_to_cart_button = Element('button.btn.btn-default.cart')
+    active_tab = Element('li.active > a')
+    your_name_input_field = Element('[id="name"]')
+    email_address_input_field = Element('[id="email"]')
+    review_input_field = Element('[id="review"]')
+    review_button = Element('[id="button-review"]')
+    success_review_send_message = Element('div.alert-success.alert span')
+
+    @step("Fill quantity input field: quantity: {quantity}")
+    async def fill_quantity_field(self, quantity):
+        """
+        Fill the quantity input field with the specified number.
+        """
+        await self.quantity_input_field.wait_for(state="visible", timeout=5000)
+        await self.quantity_input_field.click()
+        await self.quantity_input_field.press("Control+A")
+        await self.quantity_input_field.press("Backspace")
+        await self.quantity_input_field.type(str(quantity))
+
+    @step("Click on 'Add to Cart' button")
+    async def click_continue_shopping_button(self):
+        """
+        Click the 'Add to Cart' button to add the selected product
+        to the shopping cart.
+        """
+        await self.add_to_cart_button.wait_for(state="visible", timeout=5000)
+        await self.add_to_cart_button.click()
+
+    @step("Verify active tab contains text: {expected_text}")
+    async def verify_active_tab_text(self, expected_text: str):
+        """
+        Verify that the currently active tab contains the expected text.
+        """
+        await expect(self.active_tab).to_contain_text(expected_text)
+
+    @step("Fill review product form")
+    async def fill_review_product_form(self, name, email, review):
+        """
+        Fill the review product forn.
+        """
+        await self.fill_form({
+            self.your_name_input_field: name,
+            self.email_address_input_field: email,
+            self.review_input_field: review,
+        }, timeout=5000)
+
+    @step("Click on Submit button")
+    async def click_submit_button(self):
+        """
+        Click the Submit button.
+        """
+        await self.review_button.wait_for(state="visible", timeout=5000)
+        await self.review_button.click()
+
+    @step("Verify success message after submitting review")
+    async def verify_review_success_message(self, expected_text: str):
+        """
+        Verify that the success message is displayed with the expected text.
+        """
+        success_message = self.success_review_send_message
+        await self.success_review_send_message.wait_for(
+            state="visible",
+            timeout=5000
+        )
+        await expect(success_message).to_contain_text(expected_text)
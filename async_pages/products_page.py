@@ -0,0 +1,229 @@
+"""
+    Async page object for the Products Page.
+"""
+from playwright.async_api import expect
+from helpers.async_runner import step
+from async_pages.base_page import BasePage
+from pages.base_page import Element, Ready
+
+
+class ProductsPage(BasePage):
+    """
+    Provides methods to interact with payment form fields,
+    submit payment, and verify order placement.
+    """
+    __slots__ = ()
+
+    path = "/products"
+    ready = Ready("div.features_items")
+
+    all_products_text = Element('h2.title.text-center')
+    products_list = Element('div.features_items div.col-sm-4')
+    first_product = Element(within="products_list", nth=0)
+    second_product = Element(within="products_list", nth=1)
+    first_product_view_button = Element(
+        'a:has-text("View Product")', within="first_product"
+    )
+    product_name = Element('div.product-information h2')
+    category = Element('div.product-information p:has-text("Category")')
+    price = Element('div.product-information span span')
+    availability = Element(
+        'div.product-information p:has-text("Availability")'
+    )
+    condition = Element('div.product-information p:has-text("Condition")')
+    brand = Element('div.product-information p:has-text("Brand")')
+    first_product_add_to_cart = Element(
+        'a.btn.btn-default.add-to-cart', within="first_product", nth=1
+    )
+    cart_modal_continue_button = Element(
+        'button:has-text("Continue Shopping")'
+    )
+    second_product_add_to_cart = Element(
+        'a.btn.btn-default.add-to-cart', within="second_product", nth=1
+    )
+    view_cart_link = Element("a:has-text('View Cart')")
+    sidebar_selector = Element("div.left-sidebar")
+    brands_section = Element("div.brands_products")
+
+    @step("Verify 'All Products' text is visible")
+    async def verify_all_products_text(self, expected_text):
+        """
+        Verify All Products text is visible.
+        """
+        await self.all_products_text.wait_for(state="visible", timeout=10000)
+        actual_text = await self.all_products_text.text_content()
+        assert actual_text.strip() == expected_text, (
+           f"Expected '{expected_text}' "
+           f"but got '{actual_text}'"
+        )
+
+    @step("Verify that products list is visible")
+    async def verify_products_list_visible(self):
+        """
+        Verifyproducts list is visible.
+        """
+        await self.verify_collection(self.products_list, visible=True)
+
+    @step("Click on 'View Product' of the first product")
+    async def click_first_product_view(self):
+        """
+        Click on the View product buttonn for first product.
+        """
+        await self.first_product_view_button.wait_for(
+            state="visible", timeout=5000
+        )
+        await self.first_product_view_button.click()
+
+    @step("Verify product details are visible")
+    async def verify_product_details_visible(self):
+        """
+        Verify product details are visible.
+        """
+        for locator, name in [
+            (self.product_name, "Product Name"),
+            (self.category, "Category"),
+            (self.price, "Price"),
+            (self.availability, "Availability"),
+            (self.condition, "Condition"),
+            (self.brand, "Brand"),
+        ]:
+            await locator.wait_for(state="visible", timeout=5000)
+            text = (await locator.text_content()).strip()
+            assert text != "", f"{name} is not visible or empty"
+
+    @step("Hover over and click on 'Add to Cart' of the first product")
+    async def add_first_product_to_cart(self):
+        """
+        Add first prodcut to cart.
+        """
+        await self.products_list.first.wait_for(state="visible", timeout=5000)
+        await self.products_list.first.hover()
+        await self.first_product_add_to_cart.click()
+
+    @step("Click on 'Continue Shopping' button in cart modal")
+    async def click_continue_shopping_button(self):
+        """
+        Click Continue shopping button.
+        """
+        await self.cart_modal_continue_button.wait_for(
+            state="visible", timeout=5000
+        )
+        await self.cart_modal_continue_button.click()
+
+    @step("Hover over and click on 'Add to Cart' of the second product")
+    async def add_second_product_to_cart(self):
+        """
+        Add second product to cart.
+        """
+        await self.second_product.wait_for(state="visible", timeout=5000)
+        await self.second_product.hover()
+        await self.second_product_add_to_cart.click()
+
+    @step("Click on 'View Cart' button in cart modal")
+    async def click_view_cart_button(self):
+        """
+        Click View cart button.
+        """
+        await self.view_cart_link.wait_for(state="visible", timeout=5000)
+        await self.view_cart_link.click()
+
+    @step("Verify category are visible")
+    async def verify_categories_visible(
+        self,
+        expected_header: str,
+        expected_categories: list[str]
+    ):
+        """
+        Verify category are visible.
+        """
+        await expect(
+           self.locator("div.left-sidebar h2").nth(0)
+        ).to_have_text(expected_header)
+
+        categories = self.locator("div.left-sidebar .panel-title a")
+        await self.verify_collection(
+            categories, visible=True, texts=expected_categories
+        )
+
+    @step("Click on the category: {category_name}")
+    async def click_category(self, category_name: str):
+        """
+        Click on the category.
+        """
+        category_locator = self.sidebar_selector.locator(
+            ".panel-title a", has_text=category_name
+        )
+        await category_locator.wait_for(state="visible")
+        await category_locator.click()
+
+    @step(
+        "Click on subcategory: {subcategory_name} "
+        "under main category: {main_category}"
+    )
+    async def click_subcategory(
+        self,
+        main_category: str,
+        subcategory_name: str
+    ):
+        """
+        Click on the subcategory.
+        """
+        main_category_locator = self.sidebar_selector.locator(
+            "h4.panel-title a", has_text=main_category
+        )
+
+        panel = self.locator(f"#{main_category}")
+        panel_classes = (await panel.get_attribute("class")) or ""
+        if "collapse" in panel_classes:
+            await main_category_locator.click()
+
+        subcategory_locator = panel.locator(
+            ".panel-body ul li a",
+            has_text=subcategory_name
+        )
+
+        await subcategory_locator.wait_for(state="visible")
+        await subcategory_locator.click()
+
+    @step("Verify category page header contains: {expected_text}")
+    async def verify_category_page_header(self, expected_text: str):
+        """
+        Verify category page header.
+        """
+        header_locator = self.locator("h2.title")
+        await expect(
+            header_locator).to_contain_text(expected_text, timeout=5000
+        )
+
+    @step("Verify brands are visible on left sidebar")
+    async def verify_brands_visible(self, expected_brands: list[str]):
+        """
+        Verify that all brands in the left sidebar are visible.
+        """
+        await expect(self.brands_section).to_be_visible()
+
+        brand_links = self.brands_section.locator("ul.nav li a")
+        await self.verify_collection(
+            brand_links, visible=True, texts=expected_brands, contains=True
+        )
+
+    @step("Click on brand: {brand_name}")
+    async def click_brand(self, brand_name: str):
+        """
+        Click on the brand.
+        """
+        brand_locator = self.brands_section.locator(
+           f"ul.nav li a:has-text('{brand_name}')"
+        )
+        await brand_locator.wait_for(state="visible")
+        await brand_locator.click()
+
+    @step("Verify brand page header contains: {expected_text}")
+    async def verify_brand_page_header(self, expected_text: str):
+        """
+        Verify brand page container.
+        """
+        header_locator = self.locator("h2.title")
+        await expect(
+            header_locator).to_contain_text(expected_text, timeout=5000
+        )
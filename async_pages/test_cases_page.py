@@ -0,0 +1,34 @@
+"""
+    Async page object for the Test cases Page.
+"""
+from helpers.async_runner import step
+from async_pages.base_page import BasePage
+from pages.base_page import Element, Ready
+
+
+class CasesPage(BasePage):
+    """
+    Provides methods to interact with the Test cases page elements.
+    """
+
+    __slots__ = ()
+
+    path = "/test_cases"
+    ready = Ready("h2.title.text-center b")
+
+    verify_login_to_account_text = Element('h2.title.text-center b')
+
+    @step("Verify 'Test Cases' text is visible")
+    async def verify_test_cases_text(self, expected_text: str):
+        """
+        Verify 'Test Cases' text is visible.
+        """
+        await self.verify_login_to_account_text.wait_for(
+            state="visible",
+            timeout=10000
+        )
+        actual_text = await self.verify_login_to_account_text.text_content()
+        assert actual_text.strip() == expected_text, (
+            f"Expected '{expected_text}' "
+            f"but got '{actual_text}'"
+        )
@@ -0,0 +1,118 @@
+"""
+Benchmark: harness overhead of the page object steps per reporting mode.
+
+Simulates tests that call a page object method made of ten BasePage
+primitives, with an Allure lifecycle active as under allure-pytest, and
+reports the overhead per step call against undecorated functions.
+
+Run:
+    python -m benchmarks.bench_allure_steps -n 200
+"""
+import argparse
+import tempfile
+import time
+from uuid import uuid4
+import allure
+import allure_commons
+from allure_commons.logger import AllureFileLogger
+from allure_commons.model2 import Status, TestResult, TestStepResult
+from allure_commons.reporter import AllureReporter
+from allure_commons.utils import now
+from helpers import reporting
+from helpers.reporting import step
+
+PRIMITIVES_PER_CALL = 10
+
+CALLS_PER_TEST = 20
+
+
+class StepListener:
+    """
+    Minimal allure-pytest listener: records steps into the running test.
+    """
+
+    def __init__(self):
+        self.reporter = AllureReporter()
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self.reporter.start_step(
+            None, uuid, TestStepResult(name=title, start=now())
+        )
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        self.reporter.stop_step(uuid, stop=now(), status=Status.PASSED)
+
+    @allure_commons.hookimpl
+    def attach_data(self, body, name, attachment_type, extension):
+        self.reporter.attach_data(
+            str(uuid4()), body, name=name, attachment_type=attachment_type,
+            extension=extension
+        )
+
+
+def fill(text):
+    return text
+
+
+def fill_form(text):
+    for _ in range(PRIMITIVES_PER_CALL):
+        fill(text)
+
+
+@step("Fill element with text: {text}", primitive=True)
+def fill_step(text):
+    return text
+
+
+@step("Fill form with: {text}")
+def fill_form_step(text):
+    for _ in range(PRIMITIVES_PER_CALL):
+        fill_step(text)
+
+
+def run_tests(listener, tests: int, form) -> float:
+    """
+    Run `tests` simulated tests calling `form` and return the seconds.
+    """
+    start = time.perf_counter()
+    for index in range(tests):
+        uuid = str(uuid4())
+        listener.reporter.schedule_test(
+            uuid, TestResult(name=f"test_{index}", uuid=uuid, start=now())
+        )
+        for _ in range(CALLS_PER_TEST):
+            form("text")
+        allure.attach("log", name="log")
+        listener.reporter.get_test(uuid).status = Status.PASSED
+        listener.reporter.close_test(uuid)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-n", "--tests", type=int, default=200)
+    args = parser.parse_args()
+
+    listener = StepListener()
+    allure_commons.plugin_manager.register(listener)
+    steps = args.tests * CALLS_PER_TEST * (PRIMITIVES_PER_CALL + 1)
+    print(f"tests: {args.tests}, step calls: {steps}")
+
+    with tempfile.TemporaryDirectory() as report_dir:
+        logger = AllureFileLogger(report_dir)
+        allure_commons.plugin_manager.register(logger)
+        baseline = run_tests(listener, args.tests, fill_form)
+        for mode in reporting.MODES:
+            reporting.set_mode(mode)
+            seconds = run_tests(listener, args.tests, fill_form_step)
+            overhead = (seconds - baseline) / steps * 1e6
+            print(f"{mode:<8} {overhead:6.1f} us/step, "
+                  f"{seconds / args.tests * 1000:.2f} ms/test")
+        allure_commons.plugin_manager.unregister(logger)
+    reporting.set_mode("full")
+
+
+if __name__ == "__main__":
+    main()
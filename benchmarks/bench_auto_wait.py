@@ -0,0 +1,87 @@
+"""
+Benchmark: BasePage form filling with visibility pre-waits, auto-wait
+and the bulk fill.
+
+Fills the address form of the sign-up page with
+`LoginPage.fill_address_information` in every mode and reports the
+driver round trips and the time per call.
+
+Run:
+    python -m benchmarks.bench_auto_wait --browser chromium -n 20
+"""
+import argparse
+import time
+from playwright.sync_api import sync_playwright
+from helpers.data_helpers import generate_random_user
+from helpers.round_trips import RoundTripCounter
+from helpers.storefront.templates import signup_page
+from pages.base_page import BasePage
+from pages.login_page import LoginPage
+
+ORIGIN = "http://bench.local"
+
+VIEWPORT = {"width": 1920, "height": 1080}
+
+
+def fill_address_form(page, iterations: int, auto_wait: bool,
+                      strict_fill: bool):
+    """
+    Fill the address form `iterations` times and return the round trips
+    and seconds spent in `fill_address_information`.
+    """
+    BasePage.auto_wait = auto_wait
+    BasePage.strict_fill = strict_fill
+    login_page = LoginPage(page, ORIGIN)
+    address = generate_random_user()["address"]
+    counter = RoundTripCounter()
+    seconds = 0.0
+    for _ in range(iterations):
+        login_page.goto("/signup")
+        counter.start()
+        start = time.perf_counter()
+        login_page.fill_address_information(**address)
+        seconds += time.perf_counter() - start
+        counter.stop()
+    return counter, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--browser", default="chromium",
+                        choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("-n", "--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    html = signup_page("Bench User", "bench.user@example.com")
+    with sync_playwright() as p:
+        browser = getattr(p, args.browser).launch(headless=True)
+        page = browser.new_page(viewport=VIEWPORT)
+        page.route(
+            "**/*",
+            lambda route: route.fulfill(body=html, content_type="text/html")
+        )
+
+        results = {
+            "pre-wait": fill_address_form(
+                page, args.iterations, auto_wait=False, strict_fill=True
+            ),
+            "auto-wait": fill_address_form(
+                page, args.iterations, auto_wait=True, strict_fill=True
+            ),
+            "bulk fill": fill_address_form(
+                page, args.iterations, auto_wait=True, strict_fill=False
+            ),
+        }
+        browser.close()
+
+    print(f"browser: {args.browser}, calls: {args.iterations}")
+    for mode, (counter, seconds) in results.items():
+        calls = args.iterations
+        waits = counter.by_method["waitForSelector"] / calls
+        print(f"{mode:<10} {counter.total / calls:.0f} round trips/call "
+              f"({waits:.0f} waitForSelector), "
+              f"{seconds / calls * 1000:.1f} ms/call")
+
+
+if __name__ == "__main__":
+    main()
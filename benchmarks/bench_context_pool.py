@@ -0,0 +1,96 @@
+"""
+Benchmark: context pool versus a new browser context per test.
+
+Every simulated test opens a page on a routed origin, writes a cookie
+and localStorage, and checks that it started from a clean context.
+
+Run:
+    python -m benchmarks.bench_context_pool --browser webkit -n 100
+"""
+import argparse
+import time
+from playwright.sync_api import sync_playwright
+from helpers.context_pool import ContextPool
+
+ORIGIN = "http://bench.local/"
+
+VIEWPORT = {"width": 1920, "height": 1080}
+
+
+def simulate_test(context):
+    """
+    Run a short test in the context and fail if it sees leaked state.
+    """
+    page = context.new_page()
+    page.route(
+        "**/*",
+        lambda route: route.fulfill(
+            body="<html><body><h2>Test Cases</h2></body></html>",
+            content_type="text/html"
+        )
+    )
+    page.goto(ORIGIN)
+    leaked = page.evaluate(
+        "() => document.cookie || localStorage.getItem('visited')"
+    )
+    assert not leaked, f"State leaked between tests: {leaked!r}"
+    page.evaluate(
+        "() => { document.cookie = 'session=1';"
+        " localStorage.setItem('visited', '1'); }"
+    )
+
+
+def run_new_context(browser, iterations):
+    """
+    Create and close a context for every test, like the page fixture.
+    """
+    for _ in range(iterations):
+        context = browser.new_context(viewport=VIEWPORT)
+        simulate_test(context)
+        context.close()
+
+
+def run_pool(browser, iterations, max_uses):
+    """
+    Take every context from the pool.
+    """
+    pool = ContextPool(browser, max_uses=max_uses, viewport=VIEWPORT)
+    for _ in range(iterations):
+        context = pool.acquire()
+        simulate_test(context)
+        pool.release(context)
+    pool.close()
+    return pool
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--browser", default="chromium",
+                        choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("-n", "--iterations", type=int, default=50)
+    parser.add_argument("--max-uses", type=int, default=20)
+    args = parser.parse_args()
+
+    with sync_playwright() as p:
+        browser = getattr(p, args.browser).launch(headless=True)
+
+        start = time.perf_counter()
+        run_new_context(browser, args.iterations)
+        baseline = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pool = run_pool(browser, args.iterations, args.max_uses)
+        pooled = time.perf_counter() - start
+
+        browser.close()
+
+    print(f"browser: {args.browser}, tests: {args.iterations}")
+    print(f"new context per test: {baseline:.2f}s "
+          f"({args.iterations / baseline:.1f} tests/s)")
+    print(f"context pool:         {pooled:.2f}s "
+          f"({args.iterations / pooled:.1f} tests/s, "
+          f"{pool.created} created, {pool.reused} reused)")
+
+
+if __name__ == "__main__":
+    main()
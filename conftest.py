@@ -1,84 +1,751 @@
+import random
+import warnings
+from urllib.parse import urlsplit
+import allure
 import pytest
 from playwright.sync_api import sync_playwright
-from pages.home_page import HomePage
+from async_pages.base_page import BasePage as AsyncBasePage
+from async_pages.login_page import LoginPage as AsyncLoginPage
+from pages.base_page import BasePage
 from pages.login_page import LoginPage
-from pages.products_page import ProductsPage
+from pages.page_objects import PageObjects
+from helpers.accounts import AccountFactory
+from helpers.async_runner import AsyncScenarioRunner
+from helpers.auth_state import StorageStateCache
+from helpers.checkpoints import CheckpointStore
+from helpers.browser_server import BrowserServerPool, worker_endpoint
+from helpers.context_pool import ContextPool
+from helpers.data_helpers import (
+    DataPool,
+    default_pool,
+    generate_random_user,
+    set_default_pool,
+)
+from helpers.har import HarReplayer, data_seed, har_path, record
+from helpers.identity import allocator
+from helpers.invoices import InvoiceLedger
+from helpers.impact import ALL, DependencyGraph, changed_lines
+from helpers import reporting
+from helpers.resource_blocking import PROFILES, build_blocker
+from helpers.round_trip_budget import (
+    BUDGET_FILE, DEFAULT_MARGIN, SUMMARY_FILE, RoundTripBudgetPlugin,
+    RoundTripBudgets
+)
+from helpers.scheduling import (
+    HISTORY_FILE, DurationHistory, LPTSchedulerPlugin
+)
+from helpers.storefront import Storefront
+from helpers.tabs import MultiTab
+from test_data.endpoints_data import BASE_URL, route_path, set_base_url
+from test_data.login_data import TEST_USER
+from test_data.register_data import EXIST_USER
+
+VIEWPORT = {"width": 1920, "height": 1080}
+
+BROWSER_SERVER_POOL = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    """
+    Register command line options of the test suite.
+    """
+    parser.addoption(
+        "--context-pool",
+        action="store_true",
+        default=False,
+        help="Reuse reset browser contexts between tests of a worker."
+    )
+    parser.addoption(
+        "--context-pool-max-uses",
+        type=int,
+        default=20,
+        help="Number of tests a pooled context serves before recycling."
+    )
+    parser.addoption(
+        "--browser-servers",
+        type=int,
+        default=0,
+        help="Start this many shared browser servers per browser in the "
+             "controller and connect workers to them (0 disables)."
+    )
+    parser.addoption(
+        "--block-resources",
+        default="off",
+        choices=sorted(PROFILES),
+        help="Request blocking profile installed in every context."
+    )
+    parser.addoption(
+        "--block-domains",
+        default="",
+        help="Comma separated domains to block in addition to the profile."
+    )
+    parser.addoption(
+        "--allow-domains",
+        default="",
+        help="Comma separated domains that are never blocked."
+    )
+    parser.addoption(
+        "--har-record",
+        action="store_true",
+        default=False,
+        help="Record the traffic of every test into a HAR archive."
+    )
+    parser.addoption(
+        "--har-replay",
+        action="store_true",
+        default=False,
+        help="Serve the traffic of every test from its HAR archive."
+    )
+    parser.addoption(
+        "--har-dir",
+        default="har",
+        help="Directory of the HAR archives."
+    )
+    parser.addoption(
+        "--har-not-found",
+        default="abort",
+        choices=["abort", "fallback"],
+        help="What to do with requests missing from the HAR archive."
+    )
+    parser.addoption(
+        "--local-storefront",
+        action="store_true",
+        default=False,
+        help="Run the tests against a local stand-in of the site started "
+             "in every worker instead of the public site."
+    )
+    parser.addoption(
+        "--auto-wait",
+        action="store_true",
+        default=False,
+        help="Let page object actions rely on Playwright's actionability "
+             "checks instead of waiting for visibility first."
+    )
+    parser.addoption(
+        "--goto-wait-until",
+        choices=("commit", "domcontentloaded", "load"),
+        default="domcontentloaded",
+        help="Navigation event goto() waits for before the readiness "
+             "condition of the page object."
+    )
+    parser.addoption(
+        "--strict-fill",
+        action="store_true",
+        default=False,
+        help="Fill multi-field forms field by field with Playwright actions "
+             "instead of one browser-side batch."
+    )
+    parser.addoption(
+        "--allure-steps",
+        choices=reporting.MODES,
+        default="full",
+        help="Page object steps in the Allure report: full (every step), "
+             "summary (outermost page object steps only) or off."
+    )
+    parser.addoption(
+        "--skip-ui-account-deletion",
+        action="store_true",
+        default=False,
+        help="Leave accounts signed up through the UI to the session "
+             "sweeper instead of deleting them through the navbar."
+    )
+    parser.addoption(
+        "--lpt",
+        action="store_true",
+        default=False,
+        help="With pytest-xdist, run the longest tests first, using the "
+             "durations of earlier runs."
+    )
+    parser.addoption(
+        "--lpt-history",
+        default=HISTORY_FILE,
+        help="JSON file of the test durations read and updated by --lpt, "
+             "relative to the root directory."
+    )
+    parser.addoption(
+        "--impacted-since",
+        metavar="REF",
+        default=None,
+        help="Run only the tests affected by the changes since a git ref, "
+             "e.g. origin/main."
+    )
+    parser.addoption(
+        "--impact-smoke",
+        action="store_true",
+        default=False,
+        help="With --impacted-since, always run the tests marked smoke."
+    )
+    parser.addoption(
+        "--round-trip-budget",
+        action="store_true",
+        default=False,
+        help="Count the driver round trips of every test and page object "
+             "method and fail tests over their budget."
+    )
+    parser.addoption(
+        "--round-trip-margin",
+        type=float,
+        default=DEFAULT_MARGIN,
+        help="Fraction a test may exceed its round-trip budget by."
+    )
+    parser.addoption(
+        "--round-trip-budget-file",
+        default=BUDGET_FILE,
+        help="JSON file of the round-trip budgets, relative to the root "
+             "directory."
+    )
+    parser.addoption(
+        "--round-trip-summary",
+        default=SUMMARY_FILE,
+        help="JSON file the round-trip counts of the run are written to, "
+             "relative to the root directory."
+    )
+    parser.addoption(
+        "--update-round-trip-budgets",
+        action="store_true",
+        default=False,
+        help="Record the round trips of the passed tests as their budget "
+             "instead of checking them."
+    )
+    parser.addoption(
+        "--async-concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of concurrent contexts of the async "
+             "scenario runner. The default runs the scenario set once; "
+             "raise it for load runs, preferably with --local-storefront."
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    """
+    Set the wait, fill, account deletion and reporting modes of the
+    page objects, start the shared browser servers and the longest-first
+    scheduler in the controller process, and the round-trip budget
+    profiler. Runs after allure-pytest is configured.
+    """
+    for page_class in (BasePage, AsyncBasePage):
+        page_class.auto_wait = config.getoption("auto_wait")
+        page_class.strict_fill = config.getoption("strict_fill")
+        page_class.wait_until = config.getoption("goto_wait_until")
+    for page_class in (LoginPage, AsyncLoginPage):
+        page_class.ui_account_deletion = not config.getoption(
+            "skip_ui_account_deletion"
+        )
+    reporting.set_mode(config.getoption("allure_steps"))
+
+    count = config.getoption("browser_servers")
+    if count and not hasattr(config, "workerinput"):
+        pool = BrowserServerPool(config.option.browser or ["chromium"], count)
+        config.stash[BROWSER_SERVER_POOL] = pool
+        config.pluginmanager.register(pool, "browser_server_pool")
+        pool.start()
+
+    if config.getoption("lpt") and not hasattr(config, "workerinput"):
+        if config.getoption("dist", "no") not in ("no", "load"):
+            raise pytest.UsageError(
+                "--lpt replaces the 'load' distribution and cannot be "
+                f"combined with --dist {config.getoption('dist')}"
+            )
+        history = DurationHistory(
+            config.rootpath / config.getoption("lpt_history")
+        )
+        config.pluginmanager.register(
+            LPTSchedulerPlugin(history), "lpt_scheduler"
+        )
+
+    if (config.getoption("round_trip_budget")
+            or config.getoption("update_round_trip_budgets")):
+        budgets = RoundTripBudgets(
+            config.rootpath / config.getoption("round_trip_budget_file")
+        )
+        config.pluginmanager.register(
+            RoundTripBudgetPlugin(
+                budgets,
+                config.rootpath / config.getoption("round_trip_summary"),
+                margin=config.getoption("round_trip_margin"),
+                update=config.getoption("update_round_trip_budgets"),
+                controller=not hasattr(config, "workerinput"),
+            ),
+            "round_trip_budget"
+        )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    With --impacted-since, deselect the tests the changes do not affect.
+    """
+    ref = config.getoption("impacted_since")
+    if not ref:
+        return
+    graph = DependencyGraph(config.rootpath, getattr(config, "cache", None))
+    impacted = graph.impacted(changed_lines(ref, config.rootpath))
+    if impacted == ALL:
+        return
+    smoke = config.getoption("impact_smoke")
+    selected, deselected = [], []
+    for item in items:
+        function = getattr(item, "function", None)
+        key = (
+            item.path.relative_to(config.rootpath).as_posix(),
+            function.__qualname__ if function else None,
+        )
+        if (function is None or key in impacted
+                or smoke and item.get_closest_marker("smoke")):
+            selected.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+def pytest_unconfigure(config):
+    """
+    Stop the shared browser servers.
+    """
+    pool = config.stash.get(BROWSER_SERVER_POOL, None)
+    if pool is not None:
+        pool.stop()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """
+    Pass the browser server endpoints to an xdist worker.
+    """
+    pool = node.config.stash.get(BROWSER_SERVER_POOL, None)
+    if pool is not None:
+        node.workerinput["browser_ws_endpoints"] = pool.endpoints()
+
+
+def request_blocker(request, base_url):
+    """
+    Build the request blocker of a test from the command line options
+    and its `block_resources` marker. Returns None when nothing is blocked.
+    """
+    config = request.config
+    profile = config.getoption("block_resources")
+    overrides = {}
+    marker = request.node.get_closest_marker("block_resources")
+    if marker is not None:
+        profile = marker.args[0] if marker.args else profile
+        overrides = dict(marker.kwargs)
+
+    for key, option in (
+        ("allow_domains", "allow_domains"),
+        ("deny_domains", "block_domains"),
+    ):
+        domains = [
+            domain for domain in config.getoption(option).split(",")
+            if domain
+        ]
+        if domains:
+            overrides[key] = tuple(overrides.get(key, ())) + tuple(domains)
+    return build_blocker(profile, base_url, **overrides)
+
+
+def install_har(request, context):
+    """
+    Record or replay the traffic of the context, depending on the
+    --har-record and --har-replay options. Returns the replayer or None.
+    """
+    config = request.config
+    path = har_path(config.getoption("har_dir"), request.node.nodeid)
+    if config.getoption("har_record"):
+        record(context, path)
+        return None
+    if not config.getoption("har_replay"):
+        return None
+
+    not_found = config.getoption("har_not_found")
+    if not path.exists():
+        if not_found == "abort":
+            pytest.fail(f"No HAR archive recorded at '{path}'")
+        return None
+    replayer = HarReplayer(path, not_found=not_found)
+    replayer.install(context)
+    return replayer
+
+
+def browser_server_endpoints(config):
+    """
+    Return the shared browser server endpoints by browser name, or None.
+    """
+    if hasattr(config, "workerinput"):
+        return config.workerinput.get("browser_ws_endpoints")
+    pool = config.stash.get(BROWSER_SERVER_POOL, None)
+    return pool.endpoints() if pool is not None else None
 
 
 @pytest.fixture(scope="session")
-def base_url():
+def base_url(pytestconfig):
     """
-    Base URL for the application under test.
+    Base URL for the application under test: the local storefront with
+    --local-storefront, --base-url when given, the public site otherwise.
     """
-    return "https://automationexercise.com"
+    if not pytestconfig.getoption("local_storefront"):
+        url = pytestconfig.getoption("base_url") or BASE_URL
+        set_base_url(url)
+        yield url
+        return
+
+    storefront = Storefront()
+    storefront.seed_account(
+        TEST_USER["username"], TEST_USER["email"], TEST_USER["password"]
+    )
+    storefront.seed_account(
+        EXIST_USER["name"], EXIST_USER["email"], "existing-user"
+    )
+    url = storefront.start()
+    set_base_url(url)
+    yield url
+    storefront.stop()
 
 
 @pytest.fixture(scope="session")
-def browser(browser_name):
+def browser(browser_name, pytestconfig):
     """
     Launches the Playwright browser based on the selected browser name.
+    With --browser-servers it connects to the shared browser server
+    assigned to this worker instead.
     """
+    endpoint = worker_endpoint(
+        browser_server_endpoints(pytestconfig),
+        browser_name
+    )
     with sync_playwright() as p:
         if browser_name == "chromium":
-            browser = p.chromium.launch(headless=True)
+            browser_type = p.chromium
         elif browser_name == "firefox":
-            browser = p.firefox.launch(headless=True)
+            browser_type = p.firefox
         else:
-            browser = p.webkit.launch(headless=True)
+            browser_type = p.webkit
+
+        if endpoint:
+            browser = browser_type.connect(endpoint)
+        else:
+            browser = browser_type.launch(headless=True)
 
         yield browser
         browser.close()
 
 
+@pytest.fixture
+def async_runner(browser_name, base_url, pytestconfig):
+    """
+    Runner of concurrent async scenarios in one event loop and one
+    browser. Connects to the worker's browser server when there is one.
+    """
+    return AsyncScenarioRunner(
+        browser_name,
+        base_url,
+        concurrency=pytestconfig.getoption("async_concurrency"),
+        ws_endpoint=worker_endpoint(
+            browser_server_endpoints(pytestconfig),
+            browser_name
+        ),
+        context_options={"viewport": VIEWPORT}
+    )
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, pytestconfig):
+    """
+    Per-worker pool of browser contexts, enabled with --context-pool.
+    Returns None when the pool is disabled. HAR recording needs the
+    context to be closed after the test, so it disables the pool.
+    """
+    if (not pytestconfig.getoption("context_pool")
+            or pytestconfig.getoption("har_record")):
+        yield None
+        return
+
+    pool = ContextPool(
+        browser,
+        max_uses=pytestconfig.getoption("context_pool_max_uses"),
+        viewport=VIEWPORT
+    )
+    yield pool
+    pool.close()
+
+
 @pytest.fixture(scope="function")
-def page(browser):
+def page(browser, context_pool, request, base_url):
     """
     Creates a new browser context and page for each test function.
+    With --context-pool the context is taken from the pool instead.
+    HAR recording or replay is installed on the context, then the
+    request blocking profile of the test, so blocking runs first.
     """
-    context = browser.new_context(
-        viewport={"width": 1920, "height": 1080}
-    )
+    if context_pool is None:
+        context = browser.new_context(viewport=VIEWPORT)
+    else:
+        context = context_pool.acquire()
+    replayer = install_har(request, context)
+    blocker = request_blocker(request, base_url)
+    if blocker is not None:
+        blocker.install(context)
+
     page = context.new_page()
     yield page
-    context.close()
+
+    if replayer is not None:
+        request.node.user_properties.append(
+            ("har_misses", len(replayer.misses))
+        )
+
+    if blocker is not None:
+        request.node.user_properties.append(
+            ("requests_blocked", blocker.blocked)
+        )
+        request.node.user_properties.append(
+            ("requests_passed", blocker.passed)
+        )
+        allure.attach(
+            blocker.summary(),
+            name="Blocked requests",
+            attachment_type=allure.attachment_type.TEXT
+        )
+    if context_pool is None:
+        context.close()
+    else:
+        context_pool.release(context)
+
+
+@pytest.fixture(autouse=True)
+def seed_test_data(request):
+    """
+    Seed the random test data with the test id in HAR modes, so the data
+    sent during a replay matches the recorded traffic. The test draws
+    from a data pool of its own seed meanwhile, kept in memory only:
+    a cache file per test would never be reused by another test.
+    """
+    config = request.config
+    if not (config.getoption("har_record") or config.getoption("har_replay")):
+        yield
+        return
+    seed = data_seed(request.node.nodeid)
+    random.seed(seed)
+    previous = set_default_pool(DataPool(seed, batch_size=5, cache_dir=None))
+    yield
+    set_default_pool(previous)
 
 
 @pytest.fixture
-def login_signup_page(page, base_url):
+def data_pool():
     """
-    Fixture to navigate to the Signup/Login page.
-    Returns a tuple of (HomePage, LoginPage) objects.
+    Fixture to return the seeded test data pool of the worker.
     """
-    home = HomePage(page, base_url)
+    return default_pool()
 
-    home.goto("/")
 
-    home.go_to_signup_or_login()
+@pytest.fixture(scope="session")
+def identity():
+    """
+    Fixture to return the identity allocator of the worker, which builds
+    emails and usernames unique across workers and runs.
+    """
+    return allocator()
+
+
+@pytest.fixture
+def new_user(data_pool, account_sweeper):
+    """
+    Fixture to return a user from the data pool that has no account yet.
+    The account the test signs up for is left to the account sweeper.
+    """
+    return data_pool.user().as_dict()
+
 
-    return LoginPage(page, base_url)
+@pytest.fixture
+def payment_data(data_pool):
+    """
+    Fixture to return payment card details from the data pool.
+    """
+    return data_pool.payment().as_dict()
+
+
+@pytest.fixture
+def pages(page, base_url):
+    """
+    Fixture to return one memoized instance of each page object
+    for the test's page, e.g. `pages.login` or `pages.cart`.
+    """
+    return PageObjects(page, base_url)
+
+
+@pytest.fixture
+def tabs(page, base_url):
+    """
+    Fixture to run independent read-only checks concurrently in tabs
+    of the test's browser context.
+    """
+    multi_tab = MultiTab(page.context, base_url)
+    yield multi_tab
+    multi_tab.close()
+
+
+@pytest.fixture
+def login_signup_page(pages, account_sweeper):
+    """
+    Fixture to open the Signup/Login page directly, recording the
+    accounts signed up on it for the account sweeper.
+    Returns the LoginPage object.
+    """
+    return pages.open("login")
+
+
+@pytest.fixture
+def products_page(pages):
+    """
+    Fixture to open the Products page directly.
+    """
+    return pages.open("products")
 
 
 @pytest.fixture
-def products_page(page, base_url):
+def cart_page(pages):
+    """
+    Fixture to open the Cart page directly.
+    """
+    return pages.open("view_cart")
+
+
+@pytest.fixture(scope="session")
+def storage_state_cache():
     """
-    Fixture to navigate to the Products page
+    Per-worker cache of the storage state of logged in users.
     """
-    home = HomePage(page, base_url)
-    home.goto("/")
-    home.go_to_products_page()
-    return ProductsPage(page, base_url)
+    return StorageStateCache()
 
 
 @pytest.fixture
-def login_user(login_signup_page):
+def login_user(pages, storage_state_cache):
     """
     Fixture to log in a user and verify successful login.
 
+    The first login of a user in a worker goes through the UI and saves
+    the storage state. Later logins apply the saved state and open the
+    home page directly, falling back to the UI login when the session is
+    no longer valid. Tests about login itself pass `use_cache=False`.
     """
-    def _login(email: str, password: str, username: str):
-        login_signup_page.fill_login_form(email, password)
-        login_signup_page.click_login_button()
-        login_signup_page.verify_logged_in_user(username)
-        return login_signup_page
+    def _login(email: str, password: str, username: str,
+               use_cache: bool = True):
+        login = pages.login
+        context = login.page.context
+        if use_cache and storage_state_cache.apply(context, email):
+            pages.open("home")
+            if login.is_logged_in_as(username):
+                return login
+            storage_state_cache.discard(email)
+            context.clear_cookies()
+
+        if urlsplit(login.page.url).path != route_path("login"):
+            pages.open("login")
+        login.fill_login_form(email, password)
+        login.click_login_button()
+        login.verify_logged_in_user(username)
+        storage_state_cache.save(email, context)
+        return login
 
     return _login
+
+
+@pytest.fixture(scope="session")
+def account_factory(base_url):
+    """
+    Per-worker factory that creates and deletes accounts over HTTP.
+    """
+    factory = AccountFactory(base_url)
+    yield factory
+    factory.close()
+
+
+@pytest.fixture(scope="session")
+def account_sweeper(account_factory):
+    """
+    Record the accounts signed up through the UI and delete every
+    account left at the end of the session, in parallel over HTTP.
+    Requested by the fixtures that create accounts, so sessions that
+    create none do not start the account factory.
+    """
+    for page_class in (LoginPage, AsyncLoginPage):
+        page_class.account_registry = account_factory.registry
+    yield account_factory.registry
+    for page_class in (LoginPage, AsyncLoginPage):
+        page_class.account_registry = None
+    deleted, errors = account_factory.sweep()
+    if errors:
+        warnings.warn(
+            f"Account sweeper deleted {deleted} accounts, "
+            f"{len(errors)} failed: " + "; ".join(errors)
+        )
+
+
+@pytest.fixture
+def registered_user(account_factory, account_sweeper):
+    """
+    Fixture to create a random user account over HTTP.
+    The account is deleted after the test.
+    """
+    user = account_factory.create(generate_random_user())
+    yield user
+    account_factory.delete(user)
+
+
+@pytest.fixture(scope="session")
+def checkpoints(browser, base_url, account_factory, account_sweeper):
+    """
+    Per-worker store of journey checkpoints, built on first use:
+
+        registered_user    a new account, logged in on the home page
+        cart_with_product  the first product in the cart of that account,
+                           on the cart page; rebuilt after every use
+    """
+    store = CheckpointStore(lambda: browser.new_context(viewport=VIEWPORT))
+
+    @store.define("registered_user")
+    def registered_user(page, identity):
+        user = account_factory.create(generate_random_user())
+        account_factory.login(page.context, user)
+        PageObjects(page, base_url).home.goto("/")
+        return {"user": user}
+
+    @store.define("cart_with_product", parent="registered_user",
+                  consumable=True)
+    def cart_with_product(page, identity):
+        pages = PageObjects(page, base_url)
+        pages.open("products")
+        pages.products.verify_products_list_visible()
+        pages.products.add_first_product_to_cart()
+        pages.products.click_view_cart_button()
+
+    return store
+
+
+@pytest.fixture(scope="session")
+def invoices():
+    """
+    Per-worker ledger of the invoices of the order tests, attached to
+    the Allure report at the end of the session. Each test checks its
+    own invoice.
+    """
+    ledger = InvoiceLedger()
+    yield ledger
+    if ledger:
+        allure.attach(
+            ledger.report(), name="Invoices",
+            attachment_type=allure.attachment_type.TEXT
+        )
+
+
+@pytest.fixture
+def logged_in_page(page, account_factory, registered_user):
+    """
+    Fixture to return a page whose context is logged in
+    as the registered user.
+    """
+    account_factory.login(page.context, registered_user)
+    return page
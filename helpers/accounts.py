@@ -0,0 +1,229 @@
+"""
+Helper module to create, log in and delete test accounts over HTTP.
+
+Uses the public automationexercise.com API instead of the UI sign-up
+form, so tests that only need an existing account skip ~20 UI steps.
+
+Every account created during a session, over HTTP or through the UI
+sign-up form, is recorded in an `AccountRegistry`. Accounts still in the
+registry at the end of the session are deleted in parallel by
+`AccountFactory.sweep`, so a test that fails midway leaves nothing
+behind.
+"""
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+
+CSRF_TOKEN_PATTERN = re.compile(
+    r'name="csrfmiddlewaretoken"\s+value="([^"]+)"'
+)
+
+
+class AccountProvisioningError(Exception):
+    """Raised when the site rejects an account API call."""
+
+
+class AccountRegistry:
+    """
+    Thread-safe record of the accounts created during a session and not
+    deleted yet, as {email: password}.
+    """
+
+    def __init__(self):
+        self._accounts = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def __contains__(self, email: str) -> bool:
+        return email in self._accounts
+
+    def add(self, email: str, password: str) -> None:
+        """Record a created account."""
+        with self._lock:
+            self._accounts[email] = password
+
+    def discard(self, email: str) -> None:
+        """Forget an account that was deleted."""
+        with self._lock:
+            self._accounts.pop(email, None)
+
+    def accounts(self) -> list[dict]:
+        """Return the recorded accounts as users with email and password."""
+        with self._lock:
+            return [
+                {"email": email, "password": password}
+                for email, password in self._accounts.items()
+            ]
+
+
+class AccountFactory:
+    """
+    Creates and deletes accounts through the site API with a pooled
+    `requests.Session`, and logs browser contexts in over HTTP.
+    """
+
+    def __init__(self, base_url: str, session=None,
+                 pool_size: int = 10, timeout: int = 30,
+                 registry: AccountRegistry = None):
+        """
+        Initialize the factory.
+
+        Args:
+            base_url (str): Base URL of the application.
+            session (requests.Session): Optional session to reuse.
+            pool_size (int): Maximum number of pooled connections.
+            timeout (int): Request timeout in seconds.
+            registry (AccountRegistry): Registry of the created accounts.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        if registry is None:
+            registry = AccountRegistry()
+        self.registry = registry
+        self.session = session or requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def create(self, user: dict) -> dict:
+        """
+        Create an account for a user generated by
+        `helpers.data_helpers.generate_random_user()`.
+        """
+        address = user["address"]
+        payload = {
+            "name": user["first_name"],
+            "email": user["email"],
+            "password": user["password"],
+            "title": "Mrs",
+            "birth_date": user["day"],
+            "birth_month": user["month"],
+            "birth_year": user["year"],
+            "firstname": address["first_name"],
+            "lastname": address["last_name"],
+            "company": address["company"],
+            "address1": address["address1"],
+            "address2": address["address2"],
+            "country": address["country"],
+            "zipcode": address["zipcode"],
+            "state": address["state"],
+            "city": address["city"],
+            "mobile_number": address["mobile_number"],
+        }
+        self._call("POST", "/api/createAccount", payload, expected=201)
+        self.registry.add(user["email"], user["password"])
+        return user
+
+    def delete(self, user: dict) -> bool:
+        """
+        Delete the account of the user.
+
+        Returns False if the account did not exist.
+        """
+        body = self._call(
+            "DELETE",
+            "/api/deleteAccount",
+            {"email": user["email"], "password": user["password"]},
+            expected=(200, 404)
+        )
+        self.registry.discard(user["email"])
+        return body["responseCode"] == 200
+
+    def sweep(self) -> tuple[int, list[str]]:
+        """
+        Delete every account left in the registry, in parallel over the
+        pooled session. Returns the number of deleted accounts and the
+        errors of the deletions that failed.
+        """
+        accounts = self.registry.accounts()
+        if not accounts:
+            return 0, []
+
+        def delete(user):
+            try:
+                return self.delete(user), None
+            except (requests.RequestException,
+                    AccountProvisioningError) as error:
+                return False, f"{user['email']}: {error}"
+
+        workers = min(self.pool_size, len(accounts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(delete, accounts))
+        deleted = sum(1 for was_deleted, _ in results if was_deleted)
+        errors = [error for _, error in results if error]
+        return deleted, errors
+
+    def exists(self, user: dict) -> bool:
+        """
+        Return True if the site accepts the user's email and password.
+        """
+        body = self._call(
+            "POST",
+            "/api/verifyLogin",
+            {"email": user["email"], "password": user["password"]},
+            expected=(200, 404)
+        )
+        return body["responseCode"] == 200
+
+    def login(self, context, user: dict) -> None:
+        """
+        Log the browser context in by submitting the login form with the
+        context's own request client, which shares its cookie jar.
+        """
+        login_url = f"{self.base_url}/login"
+        login_form = context.request.get(login_url)
+        match = CSRF_TOKEN_PATTERN.search(login_form.text())
+        if match is None:
+            raise AccountProvisioningError(
+                f"CSRF token not found on '{login_url}'"
+            )
+
+        response = context.request.post(
+            login_url,
+            form={
+                "csrfmiddlewaretoken": match.group(1),
+                "email": user["email"],
+                "password": user["password"],
+            },
+            headers={"Referer": login_url},
+        )
+        if "Logged in as" not in response.text():
+            raise AccountProvisioningError(
+                f"Login over HTTP failed for '{user['email']}'"
+            )
+
+    def close(self) -> None:
+        """
+        Close the pooled HTTP session.
+        """
+        self.session.close()
+
+    def _call(self, method: str, path: str, data: dict, expected) -> dict:
+        """
+        Send an API request and check the `responseCode` in the body.
+        The API answers with HTTP 200 and reports errors in the body.
+        """
+        if isinstance(expected, int):
+            expected = (expected,)
+        response = self.session.request(
+            method,
+            self.base_url + path,
+            data=data,
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        body = response.json()
+        if body.get("responseCode") not in expected:
+            raise AccountProvisioningError(
+                f"{method} {path} failed for '{data.get('email')}': "
+                f"{body.get('responseCode')} {body.get('message')}"
+            )
+        return body
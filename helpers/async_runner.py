@@ -0,0 +1,207 @@
+"""
+Helper module to run many independent async scenarios concurrently in
+one event loop and one browser, each scenario in its own context.
+
+Page objects of `async_pages/` mark their methods with `step`. While a
+scenario runs, its steps are logged per scenario instead of being sent
+to Allure directly, because Allure nests steps by call order and the
+steps of concurrent scenarios interleave. The runner attaches every
+scenario log to the report when the run is over.
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+import allure
+from allure_commons.utils import func_parameters, represent
+from playwright.async_api import async_playwright
+from helpers import reporting
+
+_scenario_steps = contextvars.ContextVar("scenario_steps", default=None)
+_step_depth = contextvars.ContextVar("step_depth", default=0)
+
+
+def step(title: str, primitive: bool = False):
+    """
+    Decorator for async page object methods, the async counterpart of
+    `helpers.reporting.step`. Outside of a scenario run it opens an
+    Allure step. Steps left out by the reporting mode are not logged.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not reporting.reports(primitive):
+                return await func(*args, **kwargs)
+            params = func_parameters(func, *args, **kwargs)
+            formatted = title.format(*map(represent, args), **params)
+            steps = _scenario_steps.get()
+            if steps is None:
+                with allure.step(formatted), reporting.reported_step():
+                    return await func(*args, **kwargs)
+
+            entry = {"title": formatted, "depth": _step_depth.get()}
+            steps.append(entry)
+            depth_token = _step_depth.set(entry["depth"] + 1)
+            start = time.perf_counter()
+            try:
+                with reporting.reported_step():
+                    result = await func(*args, **kwargs)
+            except BaseException:
+                entry["status"] = "failed"
+                raise
+            else:
+                entry["status"] = "passed"
+                return result
+            finally:
+                entry["seconds"] = time.perf_counter() - start
+                _step_depth.reset(depth_token)
+        return wrapper
+    return decorator
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Outcome of one scenario run.
+    """
+    name: str
+    passed: bool = False
+    seconds: float = 0.0
+    error: str = ""
+    steps: list = field(default_factory=list)
+
+    def log(self) -> str:
+        """
+        Return the step log of the scenario as text.
+        """
+        lines = [
+            f"{'  ' * entry['depth']}{entry['title']} "
+            f"[{entry.get('status', 'running')}, "
+            f"{entry.get('seconds', 0.0):.2f}s]"
+            for entry in self.steps
+        ]
+        if self.error:
+            lines.append(self.error)
+        return "\n".join(lines)
+
+
+class AsyncScenarioRunner:
+    """
+    Runs async scenarios concurrently against one browser.
+
+    A scenario is an async callable `scenario(page, base_url)`. Every
+    scenario gets a new context and page, closed after the scenario.
+    """
+
+    def __init__(self, browser_name: str, base_url: str,
+                 concurrency: int = 5, ws_endpoint: str = None,
+                 context_options: dict = None):
+        """
+        Initialize the runner.
+
+        Args:
+            browser_name (str): chromium, firefox or webkit.
+            base_url (str): Base URL passed to every scenario.
+            concurrency (int): Maximum number of open contexts.
+            ws_endpoint (str): Browser server to connect to instead of
+                launching a browser.
+            context_options (dict): Options of every new context.
+        """
+        self.browser_name = browser_name
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.ws_endpoint = ws_endpoint
+        self.context_options = context_options or {}
+        self.peak_contexts = 0
+        self._open_contexts = 0
+
+    def run(self, scenarios) -> list:
+        """
+        Run the scenarios and return their results in input order.
+
+        Args:
+            scenarios: Iterable of (name, scenario) pairs.
+
+        The event loop runs in its own thread, so the runner can be used
+        next to the sync Playwright fixtures of the same worker.
+        """
+        scenarios = list(scenarios)
+        results = []
+        errors = []
+
+        def target():
+            try:
+                results.extend(asyncio.run(self._run_all(scenarios)))
+            except BaseException as error:
+                errors.append(error)
+
+        thread = threading.Thread(target=target, name="async-scenarios")
+        thread.start()
+        thread.join()
+        if errors:
+            raise errors[0]
+
+        for result in results:
+            allure.attach(
+                result.log(),
+                name=f"Scenario {result.name}",
+                attachment_type=allure.attachment_type.TEXT
+            )
+        return results
+
+    async def _run_all(self, scenarios) -> list:
+        """
+        Start the browser and run every scenario under the semaphore.
+        """
+        async with async_playwright() as playwright:
+            browser_type = getattr(playwright, self.browser_name)
+            if self.ws_endpoint:
+                browser = await browser_type.connect(self.ws_endpoint)
+            else:
+                browser = await browser_type.launch(headless=True)
+            semaphore = asyncio.Semaphore(self.concurrency)
+            try:
+                return await asyncio.gather(*(
+                    self._run_one(browser, semaphore, name, scenario)
+                    for name, scenario in scenarios
+                ))
+            finally:
+                await browser.close()
+
+    async def _run_one(self, browser, semaphore, name: str,
+                       scenario) -> ScenarioResult:
+        """
+        Run one scenario in a new context and record its outcome.
+        """
+        result = ScenarioResult(name)
+        _scenario_steps.set(result.steps)
+        async with semaphore:
+            start = time.perf_counter()
+            context = await browser.new_context(**self.context_options)
+            self._open_contexts += 1
+            self.peak_contexts = max(self.peak_contexts, self._open_contexts)
+            try:
+                page = await context.new_page()
+                await scenario(page, self.base_url)
+                result.passed = True
+            except Exception:
+                result.error = traceback.format_exc()
+            finally:
+                self._open_contexts -= 1
+                await context.close()
+                result.seconds = time.perf_counter() - start
+        return result
+
+
+def failure_report(results) -> str:
+    """
+    Return the names and errors of the failed scenarios.
+    """
+    return "\n\n".join(
+        f"{result.name}:\n{result.error}"
+        for result in results
+        if not result.passed
+    )
@@ -0,0 +1,75 @@
+"""
+Helper module to cache the storage state of logged in users.
+
+Every pytest-xdist worker is its own process, so a session scoped cache
+is a per-worker cache: each user is logged in through the UI once per
+worker and later tests reuse the saved storage state.
+"""
+import time
+from helpers.checkpoints import apply_storage_state
+
+
+class StorageStateCache:
+    """
+    In-memory cache of `context.storage_state()` keyed by user email.
+    """
+
+    def __init__(self, expiry_margin: int = 60):
+        """
+        Initialize an empty cache.
+
+        Args:
+            expiry_margin (int): Seconds before a cookie expires when the
+                cached state is already treated as expired.
+        """
+        self.expiry_margin = expiry_margin
+        self._states = {}
+
+    def get(self, email: str):
+        """
+        Return the cached storage state of the user or None when it is
+        missing or one of its cookies has (almost) expired.
+        """
+        state = self._states.get(email)
+        if state is None:
+            return None
+        if self._is_expired(state):
+            self.discard(email)
+            return None
+        return state
+
+    def save(self, email: str, context) -> None:
+        """
+        Save the storage state of the context for the user.
+        """
+        self._states[email] = context.storage_state()
+
+    def discard(self, email: str) -> None:
+        """
+        Forget the cached storage state of the user.
+        """
+        self._states.pop(email, None)
+
+    def apply(self, context, email: str) -> bool:
+        """
+        Add the cached storage state of the user, cookies and local
+        storage, to the context. Call it before the first navigation.
+
+        Returns True if a usable cached state was applied.
+        """
+        state = self.get(email)
+        if state is None:
+            return False
+        apply_storage_state(context, state)
+        return True
+
+    def _is_expired(self, state) -> bool:
+        """
+        Return True if any persistent cookie of the state is about to
+        expire. Session cookies have `expires` set to -1.
+        """
+        deadline = time.time() + self.expiry_margin
+        return any(
+            0 < cookie.get("expires", -1) < deadline
+            for cookie in state["cookies"]
+        )
@@ -0,0 +1,235 @@
+"""
+Helper module to share a few browser processes between xdist workers.
+
+The controller process starts the servers with the Playwright driver's
+`launch-server` command and workers `connect()` to them over websocket.
+Worker `gwN` is assigned server `N % count`, so the controller can map
+test reports to servers without any extra messages from the workers.
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def worker_index() -> int:
+    """
+    Return the index of the current xdist worker, 0 outside of xdist.
+    """
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return int(worker_id.lstrip("gw") or 0)
+
+
+def process_tree_rss_kb(pid: int):
+    """
+    Return the resident memory in KB of a process and its descendants,
+    or None when /proc is not available.
+    """
+    if not os.path.isdir("/proc"):
+        return None
+
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as stat:
+                ppid = int(stat.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    total = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/status") as status:
+                for line in status:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total
+
+
+class BrowserServer:
+    """
+    A browser process started with `playwright launch-server`.
+    """
+
+    def __init__(self, browser_name: str, launch_options: dict = None):
+        self.browser_name = browser_name
+        self.launch_options = launch_options or {"headless": True}
+        self.ws_endpoint = None
+        self.startup_seconds = None
+        self.peak_rss_kb = 0
+        self.workers = set()
+        self.tests = 0
+        self._process = None
+
+    def start(self) -> str:
+        """
+        Start the server and return its websocket endpoint.
+        """
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", delete=False
+        ) as config:
+            json.dump(self.launch_options, config)
+
+        start = time.perf_counter()
+        self._process = subprocess.Popen(
+            [
+                sys.executable, "-m", "playwright", "launch-server",
+                "--browser", self.browser_name,
+                "--config", config.name,
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        self.ws_endpoint = self._process.stdout.readline().strip()
+        self.startup_seconds = time.perf_counter() - start
+        os.unlink(config.name)
+
+        if not self.ws_endpoint.startswith("ws"):
+            self.stop()
+            raise RuntimeError(
+                f"Failed to start {self.browser_name} browser server"
+            )
+        return self.ws_endpoint
+
+    def sample_rss(self) -> None:
+        """
+        Update the peak resident memory of the server process tree.
+        """
+        if self._process is None:
+            return
+        rss = process_tree_rss_kb(self._process.pid)
+        if rss:
+            self.peak_rss_kb = max(self.peak_rss_kb, rss)
+
+    def stop(self) -> None:
+        """
+        Stop the server process.
+        """
+        if self._process is None:
+            return
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        self._process = None
+
+
+class BrowserServerPool:
+    """
+    A fixed number of browser servers per browser name.
+
+    Registered as a pytest plugin in the controller to count tests per
+    server and report the load at the end of the run.
+    """
+
+    def __init__(self, browser_names, count: int,
+                 sample_interval: float = 1.0):
+        self.servers = {
+            name: [BrowserServer(name) for _ in range(count)]
+            for name in browser_names
+        }
+        self.sample_interval = sample_interval
+        self._last_sample = 0.0
+
+    def start(self) -> dict:
+        """
+        Start every server and return the endpoints by browser name.
+        """
+        for servers in self.servers.values():
+            for server in servers:
+                server.start()
+        return self.endpoints()
+
+    def endpoints(self) -> dict:
+        """
+        Return the websocket endpoints by browser name.
+        """
+        return {
+            name: [server.ws_endpoint for server in servers]
+            for name, servers in self.servers.items()
+        }
+
+    def record_test(self, browser_name: str, worker: int) -> None:
+        """
+        Count a test run by a worker against its assigned server.
+        """
+        servers = self.servers.get(browser_name)
+        if not servers:
+            return
+        server = servers[worker % len(servers)]
+        server.workers.add(worker)
+        server.tests += 1
+
+        now = time.monotonic()
+        if now - self._last_sample >= self.sample_interval:
+            self._last_sample = now
+            for sampled in self.all_servers():
+                sampled.sample_rss()
+
+    def all_servers(self):
+        """
+        Return every server of the pool.
+        """
+        return [
+            server
+            for servers in self.servers.values()
+            for server in servers
+        ]
+
+    def stop(self) -> None:
+        """
+        Stop every server of the pool.
+        """
+        for server in self.all_servers():
+            server.stop()
+
+    def pytest_runtest_logreport(self, report):
+        """
+        Count a finished test against the server of its worker.
+        """
+        if report.when != "call":
+            return
+        node = getattr(report, "node", None)
+        worker = int(node.gateway.id.lstrip("gw")) if node else 0
+        params = report.nodeid.rpartition("[")[2].rstrip("]").split("-")
+        for browser_name in params:
+            self.record_test(browser_name, worker)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """
+        Report the load of every server.
+        """
+        terminalreporter.section("browser servers")
+        for server in self.all_servers():
+            rss = (
+                f"{server.peak_rss_kb / 1024:.0f} MB"
+                if server.peak_rss_kb else "n/a"
+            )
+            terminalreporter.write_line(
+                f"{server.browser_name} {server.ws_endpoint}: "
+                f"startup {server.startup_seconds:.2f}s, "
+                f"{len(server.workers)} workers, "
+                f"{server.tests} tests, peak RSS {rss}"
+            )
+
+
+def worker_endpoint(endpoints: dict, browser_name: str):
+    """
+    Return the endpoint assigned to the current worker, or None.
+    """
+    servers = (endpoints or {}).get(browser_name)
+    if not servers:
+        return None
+    return servers[worker_index() % len(servers)]
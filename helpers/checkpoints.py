@@ -0,0 +1,150 @@
+"""
+Helper module to fork tests from a saved mid-journey state.
+
+A checkpoint is the state after a named part of a user journey: the
+browser storage state, the URL and the server-side identity created on
+the way, e.g. the account. Checkpoints are defined with a builder and an
+optional parent; a test resumes a checkpoint and continues from there.
+A checkpoint is built once per worker, when it is first resumed, on top
+of its parent, so a shared prefix is paid once instead of in every test.
+
+Server-side state such as the cart is shared by every context resumed
+from a checkpoint. Checkpoints that a test uses up, e.g. a filled cart
+that is emptied by placing the order, are marked `consumable`: they are
+rebuilt from their parent for the next test.
+"""
+import copy
+from dataclasses import dataclass
+from helpers.context_pool import BLANK_PAGE
+
+
+@dataclass(frozen=True, slots=True)
+class Checkpoint:
+    """Saved state of a journey after a named step."""
+    name: str
+    url: str
+    storage_state: dict
+    identity: dict
+
+
+def apply_storage_state(context, state: dict) -> None:
+    """
+    Add a storage state to an existing browser context: its cookies
+    and its local storage. Local storage is written once per origin, on
+    a page served a blank document from a route, so nothing stays on
+    the context and no request reaches the network.
+    """
+    context.add_cookies(state["cookies"])
+    origins = [
+        origin for origin in state.get("origins", [])
+        if origin["localStorage"]
+    ]
+    if not origins:
+        return
+    page = context.new_page()
+    page.route(
+        "**/*",
+        lambda route: route.fulfill(body=BLANK_PAGE, content_type="text/html")
+    )
+    for origin in origins:
+        page.goto(origin["origin"])
+        page.evaluate(
+            "items => items.forEach("
+            "({name, value}) => localStorage.setItem(name, value))",
+            origin["localStorage"]
+        )
+    page.close()
+
+
+class CheckpointStore:
+    """
+    Per-worker registry of checkpoint builders and built checkpoints.
+
+        store = CheckpointStore(browser.new_context)
+
+        @store.define("logged_in")
+        def logged_in(page, identity):
+            ...
+            return {"user": user}
+
+        identity = store.resume("logged_in", page)
+    """
+
+    def __init__(self, new_context):
+        """
+        Initialize an empty store.
+
+        Args:
+            new_context (callable): Returns a new browser context to
+                build a checkpoint in.
+        """
+        self.new_context = new_context
+        self.builds = 0
+        self._definitions = {}
+        self._checkpoints = {}
+
+    def define(self, name: str, parent: str = None,
+               consumable: bool = False):
+        """
+        Decorator to register the builder of a checkpoint. The builder
+        gets a page resumed from the parent and the parent's identity,
+        and returns the identity it adds.
+        """
+        def decorator(build):
+            self._definitions[name] = (build, parent, consumable)
+            return build
+        return decorator
+
+    def get(self, name: str) -> Checkpoint:
+        """
+        Return a checkpoint, building it and its parents when needed.
+        """
+        checkpoint = self._checkpoints.get(name)
+        if checkpoint is None:
+            checkpoint = self._checkpoints[name] = self._build(name)
+        return checkpoint
+
+    def identity(self, name: str) -> dict:
+        """
+        Return a copy of the identity of a checkpoint.
+        """
+        return copy.deepcopy(self.get(name).identity)
+
+    def resume(self, name: str, page) -> dict:
+        """
+        Restore a checkpoint into the page's context, navigate to its URL
+        and return its identity.
+        """
+        checkpoint = self.get(name)
+        if self._definitions[name][2]:
+            self._checkpoints.pop(name)
+        apply_storage_state(page.context, checkpoint.storage_state)
+        page.goto(checkpoint.url, wait_until="load")
+        return copy.deepcopy(checkpoint.identity)
+
+    def invalidate(self, name: str) -> None:
+        """
+        Forget a checkpoint and the checkpoints built on it, e.g. after a
+        test deleted its account.
+        """
+        self._checkpoints.pop(name, None)
+        for child, (_, parent, _) in self._definitions.items():
+            if parent == name:
+                self.invalidate(child)
+
+    def _build(self, name: str) -> Checkpoint:
+        build, parent, _ = self._definitions[name]
+        context = self.new_context()
+        try:
+            page = context.new_page()
+            identity = self.resume(parent, page) if parent else {}
+            identity.update(build(page, identity) or {})
+            self.builds += 1
+            return Checkpoint(
+                name=name,
+                url=page.url,
+                storage_state=context.storage_state(),
+                identity=identity,
+            )
+        finally:
+            context.close()
@@ -0,0 +1,185 @@
+"""
+Helper module to reuse warm browser contexts between tests.
+
+A context is reset before it goes back to the pool and recycled after
+`max_uses` tests. The reset closes the pages, which drops their
+sessionStorage, and clears cookies, permissions and routes. On every
+origin the context navigated to, it also clears localStorage, IndexedDB,
+Cache Storage and service worker registrations. A context whose cookies,
+localStorage and IndexedDB are not empty afterwards is closed instead of
+reused, so none of this state leaks from one test to the next.
+
+Not reset: init scripts and event listeners added to the context, and
+the HTTP cache. Tests that add init scripts or listeners to the context
+should not rely on the pool.
+"""
+from urllib.parse import urlsplit
+from playwright.sync_api import Error
+
+DEFAULT_TIMEOUT = 30000
+
+BLANK_PAGE = "<html><head></head><body></body></html>"
+
+CLEAR_ORIGIN_SCRIPT = """
+async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (self.indexedDB && indexedDB.databases) {
+        for (const database of await indexedDB.databases()) {
+            await new Promise(resolve => {
+                const request = indexedDB.deleteDatabase(database.name);
+                request.onsuccess = request.onerror = resolve;
+                request.onblocked = resolve;
+            });
+        }
+    }
+    if (self.caches) {
+        for (const key of await caches.keys()) {
+            await caches.delete(key);
+        }
+    }
+    if (navigator.serviceWorker) {
+        const registrations = await navigator.serviceWorker
+            .getRegistrations();
+        await Promise.all(registrations.map(r => r.unregister()));
+    }
+}
+"""
+
+
+class ContextPool:
+    """
+    Pool of browser contexts created with the same options.
+    """
+
+    def __init__(self, browser, max_uses: int = 20, **context_options):
+        """
+        Initialize an empty pool.
+
+        Args:
+            browser (Browser): Browser that creates the contexts.
+            max_uses (int): Number of tests a context serves before it
+                is closed and replaced.
+            **context_options: Options passed to `browser.new_context`.
+        """
+        self.browser = browser
+        self.max_uses = max_uses
+        self.context_options = context_options
+        self.created = 0
+        self.reused = 0
+        self._idle = []
+        self._uses = {}
+        self._origins = {}
+
+    def acquire(self):
+        """
+        Return a clean context, reusing an idle one when possible.
+        """
+        if self._idle:
+            context = self._idle.pop()
+            self.reused += 1
+        else:
+            context = self.browser.new_context(**self.context_options)
+            self._uses[context] = 0
+            origins = self._origins[context] = set()
+
+            def track(request, origins=origins):
+                if request.is_navigation_request():
+                    origins.add(origin(request.url))
+
+            context.on("request", track)
+            self.created += 1
+        self._uses[context] += 1
+        return context
+
+    def release(self, context) -> None:
+        """
+        Reset the context and return it to the pool, or close it when it
+        reached `max_uses` or could not be reset.
+        """
+        if self._uses[context] >= self.max_uses or not self._reset(context):
+            self._discard(context)
+            return
+        self._idle.append(context)
+
+    def close(self) -> None:
+        """
+        Close every context created by the pool.
+        """
+        for context in list(self._uses):
+            self._discard(context)
+
+    def _discard(self, context) -> None:
+        """
+        Close the context and forget it.
+        """
+        self._uses.pop(context, None)
+        self._origins.pop(context, None)
+        if context in self._idle:
+            self._idle.remove(context)
+        try:
+            context.close()
+        except Error:
+            pass
+
+    def _reset(self, context) -> bool:
+        """
+        Clear the state of the context.
+
+        Returns True only if the context is verified to hold no cookies,
+        localStorage or IndexedDB afterwards.
+        """
+        try:
+            for page in context.pages:
+                page.close()
+            context.unroute_all(behavior="ignoreErrors")
+            context.clear_cookies()
+            context.clear_permissions()
+            context.set_extra_http_headers({})
+            context.set_geolocation(None)
+            context.set_offline(False)
+            context.set_default_timeout(DEFAULT_TIMEOUT)
+            context.set_default_navigation_timeout(DEFAULT_TIMEOUT)
+
+            visited = self._origins.get(context, set())
+            origins = sorted((visited | {
+                item["origin"]
+                for item in context.storage_state(indexed_db=True)["origins"]
+            }) - {None})
+            if origins:
+                self._clear_origin_storage(context, origins)
+            visited.clear()
+            state = context.storage_state(indexed_db=True)
+        except Error:
+            return False
+        return not state["cookies"] and not state["origins"]
+
+    @staticmethod
+    def _clear_origin_storage(context, origins) -> None:
+        """
+        Clear the storage of every origin; see CLEAR_ORIGIN_SCRIPT. The
+        origins are served a blank page from a route, so no request
+        reaches the network.
+        """
+        page = context.new_page()
+        page.route(
+            "**/*",
+            lambda route: route.fulfill(
+                body=BLANK_PAGE,
+                content_type="text/html"
+            )
+        )
+        for origin in origins:
+            page.goto(origin)
+            page.evaluate(CLEAR_ORIGIN_SCRIPT)
+        page.close()
+
+
+def origin(url: str):
+    """
+    Return the origin of an http(s) URL, or None for other schemes.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
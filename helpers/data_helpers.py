@@ -1,20 +1,359 @@
 """
 Helper module to generate random user and payment data for testing.
+
+Test data comes from a seeded `DataPool`: users, payments, reviews,
+contact messages and free texts are generated with Faker in batches and
+cached on disk (`.data_pool/`) keyed by seed and record schema, so later
+runs read the records back and Faker is only imported when a pool runs
+out. Every xdist worker draws from its own seed. The base seed is read
+from the DATA_POOL_SEED environment variable (default 0).
+
+Email addresses are allocated by `helpers.identity` when a record is
+handed out, so they are unique across workers and runs.
 """
+import hashlib
+import json
+import os
 import random
-import time
 import string
-from faker import Faker
+import zlib
+from dataclasses import asdict, astuple, dataclass, fields, replace
+from pathlib import Path
+from helpers.identity import allocator
+
+POOL_DIR = Path(__file__).resolve().parent.parent / ".data_pool"
+
+BATCH_SIZE = 100
+
+SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class Address:
+    """Address of a user, as filled in the sign-up form."""
+    first_name: str
+    last_name: str
+    company: str
+    address1: str
+    address2: str
+    country: str
+    state: str
+    city: str
+    zipcode: str
+    mobile_number: str
+
+    def as_dict(self) -> dict:
+        """Return the address as keyword arguments of the address form."""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class User:
+    """
+    A user to sign up. `email` is assigned when the user is handed out,
+    so the pooled records stay reusable across runs.
+    """
+    first_name: str
+    last_name: str
+    password: str
+    day: str
+    month: str
+    year: str
+    address: Address
+    email: str = ""
+
+    def as_dict(self) -> dict:
+        """Return the user as the dict the page objects expect."""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class Payment:
+    """Payment card details."""
+    name: str
+    card_number: str
+    cvc: str
+    month: str
+    year: str
+
+    def as_dict(self) -> dict:
+        """Return the payment as keyword arguments of `fill_payment`."""
+        return asdict(self)
+
+
+@dataclass(frozen=True, slots=True)
+class Review:
+    """A product review."""
+    name: str
+    email: str
+    review: str
 
-fake = Faker()
+    def as_dict(self) -> dict:
+        """Return the review as keyword arguments of the review form."""
+        return asdict(self)
 
 
-def generate_password(length=10):
+@dataclass(frozen=True, slots=True)
+class ContactMessage:
+    """A message of the contact form."""
+    name: str
+    email: str
+    subject: str
+    message: str
+
+    def as_dict(self) -> dict:
+        """Return the message as keyword arguments of the contact form."""
+        return asdict(self)
+
+
+RECORD_TYPES = {
+    "users": User,
+    "payments": Payment,
+    "reviews": Review,
+    "contacts": ContactMessage,
+    "texts": str,
+}
+
+
+def schema_key() -> str:
+    """
+    Return a short hash of the record fields, so a change of the records
+    never reads a cache written for the old ones.
+    """
+    schema = {
+        kind: [field.name for field in fields(record_type)]
+        for kind, record_type in RECORD_TYPES.items()
+        if record_type is not str
+    }
+    schema["address"] = [field.name for field in fields(Address)]
+    schema["version"] = SCHEMA_VERSION
+    text = json.dumps(schema, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()[:12]
+
+
+def worker_seed(base_seed: int = None) -> int:
+    """
+    Return the data seed of this process: the base seed plus the xdist
+    worker index, so parallel workers never share a pool.
+    """
+    if base_seed is None:
+        base_seed = int(os.environ.get("DATA_POOL_SEED", "0"))
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return base_seed + int(worker.lstrip("gw") or 0)
+
+
+def generate_password(length=10, rng=random):
     """
     Generate a random password
     """
     all_chars = string.ascii_letters + string.digits + string.punctuation
-    return ''.join(random.choice(all_chars) for _ in range(length))
+    return ''.join(rng.choice(all_chars) for _ in range(length))
+
+
+def unique_email(name: str) -> str:
+    """
+    Return an email address for a name, unique across workers and runs.
+    """
+    return allocator().email(name)
+
+
+class DataPool:
+    """
+    Hands out seeded test data records, generated in batches.
+
+    The records of a seed are the same in every run. They are cached in
+    `<cache_dir>/<seed>-<schema>.json`; a pool that runs out generates
+    the next batch and extends the cache. With `cache_dir=None` the
+    records are only kept in memory, e.g. for short-lived pools.
+    """
+
+    def __init__(self, seed: int, batch_size: int = BATCH_SIZE,
+                 cache_dir: Path = POOL_DIR):
+        self.seed = seed
+        self.batch_size = batch_size
+        self.path = (
+            None if cache_dir is None
+            else Path(cache_dir) / f"{seed}-{schema_key()}.json"
+        )
+        self._records = {kind: [] for kind in RECORD_TYPES}
+        self._next = dict.fromkeys(RECORD_TYPES, 0)
+        self._faker = None
+        self._load()
+
+    def user(self) -> User:
+        """Return the next user, with a fresh email address."""
+        user = self._take("users")
+        return replace(user, email=unique_email(user.first_name))
+
+    def payment(self) -> Payment:
+        """Return the next payment."""
+        return self._take("payments")
+
+    def review(self) -> Review:
+        """Return the next review, with a fresh email address."""
+        review = self._take("reviews")
+        return replace(review, email=unique_email(review.name))
+
+    def contact(self) -> ContactMessage:
+        """Return the next contact form message."""
+        return self._take("contacts")
+
+    def text(self) -> str:
+        """Return the next free text, e.g. an order comment."""
+        return self._take("texts")
+
+    def email(self) -> str:
+        """Return a fresh email address of the next user."""
+        return self.user().email
+
+    def _take(self, kind: str):
+        records = self._records[kind]
+        index = self._next[kind]
+        if index == len(records):
+            records.extend(self._generate(kind, len(records)))
+            self._save()
+        self._next[kind] = index + 1
+        return records[index]
+
+    def _load(self) -> None:
+        if self.path is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        for kind, rows in data.items():
+            if kind in self._records:
+                self._records[kind] = [
+                    self._from_row(kind, row) for row in rows
+                ]
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {
+            kind: [self._to_row(record) for record in records]
+            for kind, records in self._records.items()
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(
+            json.dumps(data, separators=(",", ":")), encoding="utf-8"
+        )
+        os.replace(temporary, self.path)
+
+    @staticmethod
+    def _to_row(record):
+        if isinstance(record, str):
+            return record
+        if isinstance(record, User):
+            return [*astuple(record)[:-2], astuple(record.address)]
+        return astuple(record)
+
+    @staticmethod
+    def _from_row(kind: str, row):
+        if kind == "texts":
+            return row
+        if kind == "users":
+            *values, address = row
+            return User(*values, address=Address(*address))
+        return RECORD_TYPES[kind](*row)
+
+    def _generate(self, kind: str, start: int) -> list:
+        """
+        Generate the batch of records that starts at index `start`.
+        """
+        batch_seed = zlib.crc32(f"{self.seed}:{kind}:{start}".encode())
+        rng = random.Random(batch_seed)
+        fake = self._fake(batch_seed)
+        generate = getattr(self, f"_generate_{kind}")
+        return [generate(fake, rng) for _ in range(self.batch_size)]
+
+    def _fake(self, seed: int):
+        if self._faker is None:
+            from faker import Faker
+            self._faker = Faker()
+        self._faker.seed_instance(seed)
+        return self._faker
+
+    @staticmethod
+    def _generate_users(fake, rng) -> User:
+        first_name = fake.first_name()
+        last_name = fake.last_name()
+        return User(
+            first_name=first_name,
+            last_name=last_name,
+            password=generate_password(10, rng),
+            day=str(rng.randint(1, 28)),
+            month=str(rng.randint(1, 12)),
+            year=str(rng.randint(1970, 2005)),
+            address=Address(
+                first_name=first_name,
+                last_name=last_name,
+                company=fake.company(),
+                address1=fake.street_address(),
+                address2=fake.secondary_address(),
+                country="United States",
+                state=fake.state(),
+                city=fake.city(),
+                zipcode=fake.zipcode(),
+                mobile_number=fake.phone_number(),
+            ),
+        )
+
+    @staticmethod
+    def _generate_payments(fake, rng) -> Payment:
+        return Payment(
+            name=fake.name(),
+            card_number=str(rng.randint(4000000000000000, 4999999999999999)),
+            cvc=str(rng.randint(100, 999)),
+            month=str(rng.randint(1, 12)).zfill(2),
+            year=str(rng.randint(2025, 2030)),
+        )
+
+    @staticmethod
+    def _generate_reviews(fake, rng) -> Review:
+        return Review(
+            name=fake.first_name(),
+            email="",
+            review=fake.text(max_nb_chars=100),
+        )
+
+    @staticmethod
+    def _generate_contacts(fake, rng) -> ContactMessage:
+        return ContactMessage(
+            name=fake.name(),
+            email=fake.email(),
+            subject=fake.sentence(nb_words=4),
+            message=fake.paragraph(nb_sentences=3),
+        )
+
+    @staticmethod
+    def _generate_texts(fake, rng) -> str:
+        return fake.text(max_nb_chars=200)
+
+
+_default_pool = None
+
+
+def default_pool() -> DataPool:
+    """
+    Return the data pool of this process, created on first use.
+    """
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = DataPool(worker_seed())
+    return _default_pool
+
+
+def set_default_pool(pool: DataPool) -> DataPool:
+    """
+    Make `pool` the data pool of this process and return the previous
+    one, e.g. to give a test its own seeded data.
+    """
+    global _default_pool
+    previous, _default_pool = _default_pool, pool
+    return previous
 
 
 def generate_random_user():
@@ -22,40 +361,11 @@ def generate_random_user():
     Generate a random user with personal info, email, password, date of birth,
     and address details.
     """
-    timestamp = int(time.time())
-    first_name = fake.first_name()
-    last_name = fake.last_name()
-    return {
-        "first_name": first_name,
-        "last_name": last_name,
-        "email": f"{first_name.lower()}.{timestamp}@example.com",
-        "password": generate_password(10),
-        "day": str(random.randint(1, 28)),
-        "month": str(random.randint(1, 12)),
-        "year": str(random.randint(1970, 2005)),
-        "address": {
-            "first_name": first_name,
-            "last_name": last_name,
-            "company": fake.company(),
-            "address1": fake.street_address(),
-            "address2": fake.secondary_address(),
-            "country": "United States",
-            "state": fake.state(),
-            "city": fake.city(),
-            "zipcode": fake.zipcode(),
-            "mobile_number": fake.phone_number(),
-        },
-    }
+    return default_pool().user().as_dict()
 
 
 def generate_random_payment():
     """
     Generate random payment card details for testing checkout/payment forms.
     """
-    return {
-        "name": fake.name(),
-        "card_number": str(random.randint(4000000000000000, 4999999999999999)),
-        "cvc": str(random.randint(100, 999)),
-        "month": str(random.randint(1, 12)).zfill(2),
-        "year": str(random.randint(2025, 2030)),
-    }
+    return default_pool().payment().as_dict()
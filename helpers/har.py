@@ -0,0 +1,188 @@
+"""
+Helper module to record network traffic of a test into a HAR archive
+and replay it without network access.
+
+Static resources are served by Playwright's `route_from_har`. Stateful
+requests (documents, XHR/fetch and every non-GET request such as signup,
+add to cart or payment) are replayed in recorded order by
+`HarReplayer`, because `route_from_har` matches POST requests by their
+exact body and always picks the same entry for repeated GETs.
+"""
+import base64
+import json
+import re
+import zlib
+from pathlib import Path
+from urllib.parse import urljoin
+
+REDIRECT_STATUS = (301, 302, 303, 307, 308)
+
+STATEFUL_RESOURCE_TYPES = ("document", "xhr", "fetch")
+
+SKIPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+def har_path(har_dir: str, nodeid: str) -> Path:
+    """
+    Return the HAR archive path of a test, one file per test:
+    `<har_dir>/<test module>/<test name>.har`.
+    """
+    module, _, name = nodeid.partition("::")
+    safe_name = re.sub(r"[^\w.\-\[\]]", "_", name.replace("::", "."))
+    return Path(har_dir) / Path(module).with_suffix("") / f"{safe_name}.har"
+
+
+def data_seed(nodeid: str) -> int:
+    """
+    Return a stable seed for the random test data of a test, so a replay
+    generates the same data as the recording.
+    """
+    return zlib.crc32(nodeid.encode())
+
+
+def record(context, path: Path) -> None:
+    """
+    Record the traffic of the context into the HAR archive.
+    The archive is written when the context is closed.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    context.route_from_har(
+        path,
+        update=True,
+        update_content="embed",
+        update_mode="full"
+    )
+
+
+class HarReplayer:
+    """
+    Serves the traffic of a recorded HAR archive to a context.
+    """
+
+    def __init__(self, path: Path, not_found: str = "abort"):
+        """
+        Load the HAR archive.
+
+        Args:
+            path (Path): HAR archive recorded with `record`.
+            not_found (str): "abort" to fail requests missing from the
+                archive, "fallback" to send them to the network.
+        """
+        self.path = path
+        self.not_found = not_found
+        self.hits = 0
+        self.misses = []
+        self._responses = {}
+        self._cursor = {}
+
+        with open(path, encoding="utf-8") as har_file:
+            entries = json.load(har_file)["log"]["entries"]
+        for entry in entries:
+            key = (entry["request"]["method"], entry["request"]["url"])
+            self._responses.setdefault(key, []).append(entry["response"])
+
+    def install(self, context) -> None:
+        """
+        Route the traffic of the context to the archive.
+        """
+        context.route_from_har(self.path, not_found=self.not_found)
+        context.route("**/*", self._handle)
+
+    def _next_response(self, method: str, url: str):
+        """
+        Return the next recorded response for the request. The last
+        response repeats once the recorded ones are used up.
+        """
+        responses = self._responses.get((method, url))
+        if not responses:
+            return None
+        index = self._cursor.get((method, url), 0)
+        self._cursor[(method, url)] = index + 1
+        return responses[min(index, len(responses) - 1)]
+
+    def _handle(self, route) -> None:
+        """
+        Replay stateful requests in order, pass the rest to
+        `route_from_har`.
+        """
+        request = route.request
+        if (request.method == "GET"
+                and request.resource_type not in STATEFUL_RESOURCE_TYPES):
+            route.fallback()
+            return
+
+        method, url = request.method, request.url
+        response = self._next_response(method, url)
+        while response is not None and is_redirect(response):
+            status = response["status"]
+            url = urljoin(url, header(response, "location"))
+            if request.is_navigation_request():
+                # The browser follows the redirect with a new request,
+                # which is replayed in turn.
+                self.hits += 1
+                route.fulfill(status=status, headers={"location": url})
+                return
+            if status == 303 or (status in (301, 302) and method == "POST"):
+                method = "GET"
+            response = self._next_response(method, url)
+
+        if response is None:
+            self.misses.append(f"{request.method} {request.url}")
+            if self.not_found == "abort":
+                route.abort()
+            else:
+                route.fallback()
+            return
+
+        self.hits += 1
+        route.fulfill(
+            status=response["status"],
+            headers=response_headers(response),
+            body=response_body(response),
+        )
+
+
+def header(response: dict, name: str) -> str:
+    """
+    Return the first value of a response header, or an empty string.
+    """
+    for item in response["headers"]:
+        if item["name"].lower() == name:
+            return item["value"]
+    return ""
+
+
+def is_redirect(response: dict) -> bool:
+    """
+    Return True if a recorded response redirects.
+    """
+    return (response["status"] in REDIRECT_STATUS
+            and bool(header(response, "location")))
+
+
+def response_headers(response: dict) -> dict:
+    """
+    Return the headers of a recorded response as a dict. Repeated
+    headers such as set-cookie are joined with newlines.
+    """
+    headers = {}
+    for item in response["headers"]:
+        name = item["name"].lower()
+        if name in SKIPPED_HEADERS:
+            continue
+        if name in headers:
+            headers[name] += "\n" + item["value"]
+        else:
+            headers[name] = item["value"]
+    return headers
+
+
+def response_body(response: dict) -> bytes:
+    """
+    Return the body of a recorded response.
+    """
+    content = response.get("content", {})
+    text = content.get("text", "")
+    if content.get("encoding") == "base64":
+        return base64.b64decode(text)
+    return text.encode("utf-8")
@@ -0,0 +1,83 @@
+"""
+Helper module to allocate identities (emails, usernames) that are unique
+across the tests, xdist workers and runs without any coordination.
+
+An identity token combines the run id, the xdist worker id and a counter
+of the worker process. The run id is created by the first process of a
+run and passed to the xdist workers through the TEST_RUN_ID environment
+variable, which they inherit.
+"""
+import itertools
+import os
+import re
+import secrets
+import time
+
+RUN_ID_VARIABLE = "TEST_RUN_ID"
+
+
+def new_run_id() -> str:
+    """
+    Return a short run id: the start time in base 36 and a random
+    suffix, so concurrent runs on other machines differ too.
+    """
+    seconds = int(time.time())
+    digits = ""
+    while seconds:
+        seconds, digit = divmod(seconds, 36)
+        digits = "0123456789abcdefghijklmnopqrstuvwxyz"[digit] + digits
+    return f"{digits}{secrets.token_hex(2)}"
+
+
+def run_id() -> str:
+    """
+    Return the id of this test run, creating it in the first process.
+    """
+    value = os.environ.get(RUN_ID_VARIABLE)
+    if not value:
+        value = os.environ[RUN_ID_VARIABLE] = new_run_id()
+    return value
+
+
+class IdentityAllocator:
+    """
+    Hands out unique identity tokens `<run id><worker id>n<counter>` and
+    builds emails and usernames from them:
+
+        allocator.email("Jane")     # jane.m1x2k3a9f0gw1n7@example.com
+        allocator.username("Jane")  # Jane_m1x2k3a9f0gw1n8
+    """
+
+    def __init__(self, run: str = None, worker: str = None):
+        self.run = run or run_id()
+        self.worker = worker or os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        self._counter = itertools.count(1)
+
+    def token(self) -> str:
+        """Return the next unique token."""
+        return f"{self.run}{self.worker}n{next(self._counter)}"
+
+    def email(self, name: str = "user",
+              domain: str = "example.com") -> str:
+        """
+        Return a unique email address whose local part starts with `name`.
+        """
+        local = re.sub(r"[^a-z0-9]+", ".", name.lower()).strip(".")
+        return f"{local or 'user'}.{self.token()}@{domain}"
+
+    def username(self, name: str = "user") -> str:
+        """Return a unique username that starts with `name`."""
+        return f"{name}_{self.token()}"
+
+
+_allocator = None
+
+
+def allocator() -> IdentityAllocator:
+    """
+    Return the identity allocator of this process.
+    """
+    global _allocator
+    if _allocator is None:
+        _allocator = IdentityAllocator()
+    return _allocator
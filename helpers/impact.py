@@ -0,0 +1,462 @@
+"""
+Helper module to select the tests affected by a change.
+
+`DependencyGraph` parses the test modules, `conftest.py` and the
+`pages/`, `async_pages/`, `helpers/` and `test_data/` modules with `ast`.
+It collects their imports and their definitions: functions, methods,
+class attributes (the page object locators) and module constants. Every
+definition records the names it uses. A test depends on the definitions
+reachable from its body and fixtures: a bare name resolves in its own
+module, the modules it imports and `conftest.py`; an attribute, e.g. a
+page object method, resolves to every definition of that name outside
+`conftest.py` and the other test modules, which over-approximates calls
+through `self`, fixtures and page objects.
+
+A class is a definition too: reaching it reaches its class attributes
+and special methods, so a test that uses `PageObjects` reaches every page
+object class its `classes` table dispatches to.
+
+`changed_lines` reads `git diff` against a ref. A changed line inside a
+definition affects the tests that reach that definition. A change at
+module level, e.g. an import, affects every test that reaches the module.
+Class attributes and dict tables are read through dispatch the graph
+cannot follow (`__getattr__`, registries filled by `__init_subclass__`),
+so changing one counts as a module level change; when the class has a
+base with `__init_subclass__`, the module of that base counts as changed
+as well. Names built at run time, e.g. `getattr(self, f"_make_{kind}")`,
+cannot be followed at all: a change inside a class that calls `getattr`
+with a non-literal name counts as a change to the whole class, and a
+change to a module whose functions do so as a module level change. A
+change to a conftest hook or to a file the graph does not know, e.g.
+`pytest.ini`, selects every test.
+
+The parsed modules are cached by content hash in the pytest cache.
+"""
+import ast
+import hashlib
+import re
+import subprocess
+from pathlib import Path
+
+SOURCE_DIRS = ("pages", "async_pages", "helpers", "test_data", "tests")
+
+# Changed files that never affect a test run.
+IGNORED_SUFFIXES = (".md",)
+
+CACHE_KEY = "impact/modules/v3"
+
+ALL = "all"
+
+IDENTIFIER = re.compile(r"[A-Za-z_]\w*\Z")
+
+
+def _uses(nodes) -> dict:
+    """
+    Return the names (including arguments, i.e. fixtures) and the
+    attribute names used in the given nodes. Identifier-like strings,
+    e.g. `usefixtures` arguments and locator references, count as both.
+    """
+    names = set()
+    attributes = set()
+    for node in nodes:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name):
+                names.add(child.id)
+            elif isinstance(child, ast.arg):
+                names.add(child.arg)
+            elif isinstance(child, ast.Attribute):
+                attributes.add(child.attr)
+            elif (isinstance(child, ast.Constant)
+                  and isinstance(child.value, str)
+                  and IDENTIFIER.match(child.value)):
+                names.add(child.value)
+                attributes.add(child.value)
+    return {"names": sorted(names), "attributes": sorted(attributes)}
+
+
+def _is_dynamic(nodes) -> bool:
+    """
+    Return True if the nodes call `getattr` with a non-literal name.
+    """
+    return any(
+        isinstance(child, ast.Call)
+        and isinstance(child.func, ast.Name) and child.func.id == "getattr"
+        and len(child.args) > 1
+        and not isinstance(child.args[1], ast.Constant)
+        for node in nodes for child in ast.walk(node)
+    )
+
+
+def _is_autouse(node) -> bool:
+    return any(
+        isinstance(decorator, ast.Call)
+        and any(keyword.arg == "autouse" for keyword in decorator.keywords)
+        for decorator in node.decorator_list
+    )
+
+
+def _first_line(node) -> int:
+    return min([node.lineno] + [
+        decorator.lineno for decorator in node.decorator_list
+    ])
+
+
+def _base_name(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def _class_definition(node) -> dict:
+    """
+    Return the definition of a class: its header, with the uses of its
+    bases, decorators, class attributes and special methods.
+    """
+    members = [
+        member for member in node.body
+        if isinstance(member, (ast.Assign, ast.AnnAssign))
+        or isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef))
+        and member.name.startswith("__") and member.name != "__init__"
+    ]
+    return {
+        "kind": "class",
+        "lines": [_first_line(node), node.lineno],
+        "uses": _uses(node.bases + node.decorator_list + members),
+        "module": True,
+        "bases": [
+            name for name in map(_base_name, node.bases) if name
+        ],
+        "registers": any(
+            isinstance(member, ast.FunctionDef)
+            and member.name == "__init_subclass__"
+            for member in node.body
+        ),
+        "dynamic": _is_dynamic(node.body),
+    }
+
+
+def _definitions(body, prefix: str = "") -> dict:
+    """
+    Return the definitions of a module or class body as
+    {qualname: {"kind": ..., "lines": [first, last], "uses": ...}}.
+    Definitions marked "module" count as module level when changed.
+    """
+    definitions = {}
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            definitions[prefix + node.name] = {
+                "kind": "function",
+                "lines": [_first_line(node), node.end_lineno],
+                "uses": _uses([node]),
+                "autouse": _is_autouse(node),
+            }
+        elif isinstance(node, ast.ClassDef):
+            definitions[prefix + node.name] = _class_definition(node)
+            definitions.update(
+                _definitions(node.body, f"{prefix}{node.name}.")
+            )
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = (node.targets if isinstance(node, ast.Assign)
+                       else [node.target])
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    definitions[prefix + target.id] = {
+                        "kind": "value",
+                        "lines": [node.lineno, node.end_lineno],
+                        "uses": _uses([node.value] if node.value else []),
+                        "module": bool(prefix) or isinstance(
+                            node.value, ast.Dict
+                        ),
+                    }
+    return definitions
+
+
+def parse_module(text: str) -> dict:
+    """
+    Return the imported module names and the definitions of a module.
+    """
+    tree = ast.parse(text)
+    imports = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            imports.add(node.module)
+            imports.update(
+                f"{node.module}.{alias.name}" for alias in node.names
+            )
+    return {
+        "imports": sorted(imports),
+        "definitions": _definitions(tree.body),
+        "dynamic": _is_dynamic(
+            node for node in tree.body if not isinstance(node, ast.ClassDef)
+        ),
+    }
+
+
+def module_name(path: str) -> str:
+    """Return the dotted module name of a relative source path."""
+    name = path[:-len(".py")].replace("/", ".")
+    return name[:-len(".__init__")] if name.endswith(".__init__") else name
+
+
+def is_test_path(path: str) -> bool:
+    """Return True for a test module."""
+    return path.startswith("tests/") and Path(path).name.startswith("test_")
+
+
+class DependencyGraph:
+    """
+    Static dependency graph from the tests to the definitions and
+    modules they use.
+    """
+
+    def __init__(self, root, cache=None):
+        self.root = Path(root)
+        self.modules = self._parse(cache)
+        self.by_module_name = {
+            module_name(path): path for path in self.modules
+        }
+        self.by_name = {}
+        for path, module in self.modules.items():
+            for qualname in module["definitions"]:
+                name = qualname.rpartition(".")[2]
+                self.by_name.setdefault(name, []).append((path, qualname))
+        self.scopes = {
+            path: [path, "conftest.py", *sorted(
+                self.by_module_name[name] for name in module["imports"]
+                if name in self.by_module_name
+            )]
+            for path, module in self.modules.items()
+        }
+        self.autouse = [
+            ("conftest.py", qualname)
+            for qualname, definition in self.modules.get(
+                "conftest.py", {"definitions": {}}
+            )["definitions"].items()
+            if definition.get("autouse")
+        ]
+
+    def sources(self) -> list[Path]:
+        """Return the Python files of the graph."""
+        files = [self.root / "conftest.py"]
+        for directory in SOURCE_DIRS:
+            files.extend(sorted((self.root / directory).rglob("*.py")))
+        return [path for path in files if path.is_file()]
+
+    def _parse(self, cache) -> dict:
+        cached = cache.get(CACHE_KEY, {}) if cache is not None else {}
+        entries = {}
+        for file in self.sources():
+            path = file.relative_to(self.root).as_posix()
+            data = file.read_bytes()
+            digest = hashlib.sha1(data).hexdigest()
+            entry = cached.get(path)
+            if not entry or entry["sha"] != digest:
+                entry = {"sha": digest, **parse_module(data.decode("utf-8"))}
+            entries[path] = entry
+        if cache is not None and entries != cached:
+            cache.set(CACHE_KEY, entries)
+        return entries
+
+    def tests(self) -> list[tuple]:
+        """Return every test as (path, qualname)."""
+        return [
+            (path, qualname)
+            for path, module in self.modules.items() if is_test_path(path)
+            for qualname, definition in module["definitions"].items()
+            if definition["kind"] == "function"
+            and qualname.rpartition(".")[2].startswith("test")
+        ]
+
+    def imported_modules(self, path: str) -> set[str]:
+        """
+        Return the paths of the modules a module imports, transitively.
+        """
+        seen = set()
+        stack = [path]
+        while stack:
+            for name in self.modules[stack.pop()]["imports"]:
+                imported = self.by_module_name.get(name)
+                if imported and imported not in seen:
+                    seen.add(imported)
+                    stack.append(imported)
+        return seen
+
+    def resolve(self, module: str, name: str) -> list[tuple]:
+        """
+        Return the definitions a bare name used in a module refers to.
+        """
+        return [
+            (scope, name) for scope in self.scopes[module]
+            if name in self.modules.get(
+                scope, {"definitions": {}}
+            )["definitions"]
+        ]
+
+    def registries(self, path: str, qualname: str) -> set[str]:
+        """
+        Return the modules of the bases of a class, transitively, that
+        define `__init_subclass__`, i.e. that register their subclasses.
+        """
+        modules = set()
+        seen = set()
+        stack = [(path, qualname)]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            module, name = node
+            definition = self.modules[module]["definitions"][name]
+            if definition.get("registers"):
+                modules.add(module)
+            for base in definition.get("bases", ()):
+                stack.extend(
+                    found for found in self.resolve(module, base)
+                    if self.modules[found[0]]["definitions"][found[1]][
+                        "kind"] == "class"
+                )
+        return modules
+
+    @staticmethod
+    def attribute_scope(module: str, path: str) -> bool:
+        """
+        Return True if an attribute used in `module` may resolve to a
+        definition of `path`: not to conftest fixtures, and not to the
+        definitions of another test module.
+        """
+        if path == "conftest.py":
+            return False
+        return not is_test_path(path) or path == module
+
+    def reachable(self, path: str, qualname: str) -> set[tuple]:
+        """
+        Return the definitions a test reaches, including itself and the
+        autouse fixtures.
+        """
+        seen = set()
+        stack = [(path, qualname), *self.autouse]
+        while stack:
+            node = stack.pop()
+            if node in seen:
+                continue
+            seen.add(node)
+            module, name = node
+            uses = self.modules[module]["definitions"][name]["uses"]
+            for used in uses["names"]:
+                stack.extend(self.resolve(module, used))
+            for used in uses["attributes"]:
+                stack.extend(
+                    found for found in self.by_name.get(used, ())
+                    if self.attribute_scope(module, found[0])
+                )
+        return seen
+
+    def changed_definitions(self, path: str, lines) -> tuple:
+        """
+        Return the definitions of a module that contain changed lines,
+        and whether any changed line is at module level or in a
+        definition that counts as module level. A change inside a class
+        that looks up attributes by computed names changes every
+        definition of the class; see `_is_dynamic`.
+        """
+        module = self.modules[path]
+        definitions = module["definitions"]
+        changed = set()
+        module_level = False
+        for line in lines:
+            hits = [
+                qualname for qualname, definition in definitions.items()
+                if definition["lines"][0] <= line <= definition["lines"][1]
+            ]
+            changed.update(hits)
+            module_level = module_level or not hits or any(
+                definitions[hit].get("module") for hit in hits
+            )
+            if module["dynamic"] and any("." not in hit for hit in hits):
+                module_level = True
+        for qualname in list(changed):
+            parts = qualname.split(".")
+            for end in range(1, len(parts)):
+                owner = ".".join(parts[:end])
+                if definitions.get(owner, {}).get("dynamic"):
+                    changed.update(
+                        name for name in definitions
+                        if name == owner or name.startswith(owner + ".")
+                    )
+        return changed, module_level
+
+    def impacted(self, changes: dict):
+        """
+        Return the tests affected by `changes` ({path: changed lines, or
+        None for a removed file}) as a set of (path, qualname), or ALL.
+        """
+        changed_nodes = set()
+        changed_modules = set()
+        for path, lines in changes.items():
+            if path.endswith(IGNORED_SUFFIXES):
+                continue
+            if path not in self.modules or lines is None:
+                return ALL
+            definitions, module_level = self.changed_definitions(
+                path, lines
+            )
+            if path == "conftest.py" and (module_level or any(
+                    name.startswith("pytest_") for name in definitions)):
+                return ALL
+            changed_nodes.update((path, name) for name in definitions)
+            if module_level:
+                changed_modules.add(path)
+            module_definitions = self.modules[path]["definitions"]
+            for name in definitions:
+                definition = module_definitions[name]
+                if not definition.get("module"):
+                    continue
+                owner = (name if definition["kind"] == "class"
+                         else name.rpartition(".")[0])
+                if module_definitions.get(owner, {}).get("kind") == "class":
+                    changed_modules |= self.registries(path, owner)
+
+        impacted = set()
+        for path, qualname in self.tests():
+            reached = self.reachable(path, qualname)
+            modules = {module for module, _ in reached}
+            modules |= {path} | self.imported_modules(path)
+            if reached & changed_nodes or modules & changed_modules:
+                impacted.add((path, qualname))
+        return impacted
+
+
+def changed_lines(ref: str, root) -> dict:
+    """
+    Return the lines changed since `ref` by relative path, from
+    `git diff`; None for a removed file.
+    """
+    diff = subprocess.run(
+        ["git", "diff", "--unified=0", "--no-renames", ref, "--"],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout
+    changes = {}
+    path = None
+    for line in diff.splitlines():
+        if line.startswith("--- "):
+            path = None
+        elif line.startswith("+++ "):
+            path = line[6:] if line != "+++ /dev/null" else None
+            if path:
+                changes[path] = set()
+        elif line.startswith("diff --git"):
+            # Stays None unless the file has a new version.
+            changes[line.split(" b/", 1)[1]] = None
+        elif line.startswith("@@") and path:
+            new = line.split(" ")[2][1:]
+            start, _, count = new.partition(",")
+            start, count = int(start), int(count or 1)
+            # A pure deletion touches the lines around it.
+            changes[path].update(
+                range(start, start + count) if count else (start, start + 1)
+            )
+    return changes
@@ -0,0 +1,141 @@
+"""
+Helper module to parse and check order invoices.
+
+The invoice is a short text file:
+
+    Hi Jane Doe, Your total purchase amount is 500. Thank you
+
+`parse_invoice` rejects a body that does not start like an invoice or is
+too large, so a wrong download (e.g. an HTML error page) fails with its
+first bytes in the message. Invoices saved to disk go to a temporary
+directory of the worker process, which is removed when the process
+exits. `InvoiceLedger` collects the invoices of many tests into one
+report; each test checks its own invoice when it downloads it.
+"""
+import itertools
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+INVOICE_PATTERN = re.compile(
+    r"Hi (?P<name>.+?), Your total purchase amount is (?P<total>\d+)\. "
+    r"Thank you"
+)
+
+INVOICE_PREFIX = b"Hi "
+
+MAX_INVOICE_BYTES = 64 * 1024
+
+
+class InvoiceError(AssertionError):
+    """Raised when a downloaded invoice is not a valid invoice."""
+
+
+@dataclass(frozen=True, slots=True)
+class Invoice:
+    """A parsed invoice."""
+    name: str
+    total: int
+    size: int
+    path: Path = None
+
+    def mismatches(self, name: str = None, total: int = None) -> list[str]:
+        """
+        Return the differences from the expected customer name and total.
+        """
+        errors = []
+        if name is not None and self.name != name:
+            errors.append(f"name '{self.name}', expected '{name}'")
+        if total is not None and self.total != total:
+            errors.append(f"total {self.total}, expected {total}")
+        return errors
+
+
+def parse_invoice(body: bytes, path: Path = None) -> Invoice:
+    """
+    Parse a downloaded invoice, rejecting a body that is empty, too
+    large or does not start like an invoice.
+    """
+    if not body:
+        raise InvoiceError("Invoice is empty")
+    if len(body) > MAX_INVOICE_BYTES:
+        raise InvoiceError(
+            f"Invoice is larger than {MAX_INVOICE_BYTES} bytes"
+        )
+    if not body.startswith(INVOICE_PREFIX):
+        raise InvoiceError(f"Not an invoice, starts with {body[:40]!r}")
+    text = body.decode("utf-8", errors="replace")
+    match = INVOICE_PATTERN.search(text)
+    if match is None:
+        raise InvoiceError(f"Unexpected invoice content: {text!r}")
+    return Invoice(
+        name=match["name"],
+        total=int(match["total"]),
+        size=len(body),
+        path=path,
+    )
+
+
+def parse_invoice_file(path) -> Invoice:
+    """
+    Parse a saved invoice file.
+    """
+    path = Path(path)
+    return parse_invoice(path.read_bytes(), path)
+
+
+_download_dir = None
+_downloads = itertools.count(1)
+
+
+def download_dir() -> Path:
+    """
+    Return the download directory of this worker process, created on
+    first use and removed when the process exits.
+    """
+    global _download_dir
+    if _download_dir is None:
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+        _download_dir = tempfile.TemporaryDirectory(
+            prefix=f"downloads-{worker}-"
+        )
+    return Path(_download_dir.name)
+
+
+def download_path(filename: str) -> Path:
+    """
+    Return a new path for a downloaded file in the worker's download
+    directory.
+    """
+    return download_dir() / f"{next(_downloads)}-{Path(filename).name}"
+
+
+class InvoiceLedger:
+    """
+    Collects the invoices of many tests for a report. It checks nothing:
+    `PaymentPage.download_invoice` checks the invoice in the test that
+    downloads it.
+    """
+
+    def __init__(self):
+        self.entries = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, label: str, invoice: Invoice) -> None:
+        """Record an invoice."""
+        self.entries.append((label, invoice))
+
+    def report(self) -> str:
+        """
+        Return one line per invoice with its customer name, total and
+        size.
+        """
+        return "\n".join(
+            f"{label}: {invoice.name}, total {invoice.total}, "
+            f"{invoice.size} bytes"
+            for label, invoice in self.entries
+        )
@@ -0,0 +1,102 @@
+"""
+Helper module for the Allure reporting of the page objects.
+
+Page objects mark their methods with `step` instead of `allure.step`.
+The reporting mode (--allure-steps) decides which of them reach the
+report:
+
+    full     every step, including the BasePage primitives (default)
+    summary  only the outermost page object steps, no primitives
+    off      no steps at all
+
+Steps that are not reported cost one mode check: their titles are not
+formatted and no step events are sent.
+"""
+import contextlib
+import contextvars
+import functools
+import allure
+
+MODES = ("full", "summary", "off")
+
+_mode = "full"
+_depth = contextvars.ContextVar("reported_step_depth", default=0)
+_profiler = None
+
+
+def set_mode(mode: str) -> None:
+    """
+    Set the reporting mode of the page object steps.
+    """
+    global _mode
+    if mode not in MODES:
+        raise ValueError(f"Unknown reporting mode: {mode}")
+    _mode = mode
+
+
+def get_mode() -> str:
+    """
+    Return the reporting mode of the page object steps.
+    """
+    return _mode
+
+
+def set_profiler(profiler) -> None:
+    """
+    Set the profiler that counts the page object steps (see
+    `helpers.round_trip_budget`), or None.
+    """
+    global _profiler
+    _profiler = profiler
+
+
+def reports(primitive: bool = False) -> bool:
+    """
+    Return True if a step called now is reported in the current mode.
+    """
+    if _mode == "full":
+        return True
+    if _mode == "off" or primitive:
+        return False
+    return _depth.get() == 0
+
+
+@contextlib.contextmanager
+def reported_step():
+    """
+    Mark the code inside as running within a reported step, so that
+    nested steps are left out in summary mode.
+    """
+    token = _depth.set(_depth.get() + 1)
+    try:
+        yield
+    finally:
+        _depth.reset(token)
+
+
+def step(title: str, primitive: bool = False):
+    """
+    Decorator for page object methods, a drop-in for `allure.step` that
+    honours the reporting mode. `primitive` marks the generic BasePage
+    actions, which are reported in full mode only.
+    """
+    def decorator(func):
+        allure_step = allure.step(title)(func)
+
+        def run(*args, **kwargs):
+            if _mode == "full":
+                return allure_step(*args, **kwargs)
+            if not reports(primitive):
+                return func(*args, **kwargs)
+            with reported_step():
+                return allure_step(*args, **kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profiler is None:
+                return run(*args, **kwargs)
+            with _profiler.method(func.__qualname__):
+                return run(*args, **kwargs)
+        return wrapper
+    return decorator
+
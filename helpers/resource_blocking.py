@@ -0,0 +1,145 @@
+"""
+Helper module to block third-party and heavy requests of a context.
+
+A profile is a set of allow and deny lists by domain and resource type.
+Built-in profiles:
+
+- "off": nothing is blocked
+- "ads": ad, analytics and web font domains are blocked
+- "strict": only first-party requests pass
+- "media-off": images, fonts and media are blocked
+"""
+from urllib.parse import urlparse
+
+AD_DOMAINS = (
+    "googlesyndication.com",
+    "googleadservices.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "google-analytics.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "fundingchoicesmessages.google.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+)
+
+PROFILES = {
+    "off": None,
+    "ads": {"deny_domains": AD_DOMAINS},
+    "strict": {"first_party_only": True},
+    "media-off": {"deny_types": ("image", "font", "media")},
+}
+
+
+def domain_matches(host: str, domains) -> bool:
+    """
+    Return True if the host is one of the domains or their subdomain.
+    """
+    return any(host == domain or host.endswith("." + domain)
+               for domain in domains)
+
+
+class RequestBlocker:
+    """
+    Context route handler that aborts requests denied by its lists and
+    counts blocked and passed requests.
+    """
+
+    def __init__(self, first_party: str, first_party_only: bool = False,
+                 allow_domains=(), deny_domains=(),
+                 allow_types=(), deny_types=()):
+        """
+        Initialize the blocker.
+
+        Args:
+            first_party (str): Host of the application under test.
+            first_party_only (bool): Block every other host.
+            allow_domains: Domains that always pass.
+            deny_domains: Domains that are blocked.
+            allow_types: Resource types that always pass.
+            deny_types: Resource types that are blocked, e.g. "image".
+        """
+        self.first_party = first_party
+        self.first_party_only = first_party_only
+        self.allow_domains = tuple(allow_domains)
+        self.deny_domains = tuple(deny_domains)
+        self.allow_types = tuple(allow_types)
+        self.deny_types = tuple(deny_types)
+        self.blocked = 0
+        self.passed = 0
+        self.blocked_hosts = {}
+
+    def allows(self, url: str, resource_type: str) -> bool:
+        """
+        Return True if a request should reach the network.
+        """
+        host = urlparse(url).hostname or ""
+        if domain_matches(host, self.allow_domains):
+            return True
+        if resource_type in self.allow_types:
+            return True
+        if resource_type in self.deny_types:
+            return False
+        if domain_matches(host, self.deny_domains):
+            return False
+        if self.first_party_only:
+            return domain_matches(host, (self.first_party,))
+        return True
+
+    def install(self, context) -> None:
+        """
+        Route every request of the context through the blocker. Install
+        it after the other routes of the context, e.g. HAR replay:
+        Playwright runs the most recently added route first, and the
+        blocker hands the allowed requests on to the earlier ones.
+        """
+        context.route("**/*", self._handle)
+
+    def summary(self) -> str:
+        """
+        Return a text summary of blocked and passed requests.
+        """
+        lines = [f"blocked: {self.blocked}, passed: {self.passed}"]
+        for host, count in sorted(
+            self.blocked_hosts.items(), key=lambda item: -item[1]
+        ):
+            lines.append(f"  {host}: {count}")
+        return "\n".join(lines)
+
+    def _handle(self, route) -> None:
+        """
+        Abort denied requests, hand allowed ones to the next handler.
+        """
+        request = route.request
+        if self.allows(request.url, request.resource_type):
+            self.passed += 1
+            route.fallback()
+            return
+        self.blocked += 1
+        host = urlparse(request.url).hostname or request.url
+        self.blocked_hosts[host] = self.blocked_hosts.get(host, 0) + 1
+        route.abort("blockedbyclient")
+
+
+def build_blocker(profile: str, base_url: str, **overrides):
+    """
+    Return a RequestBlocker for a built-in profile, or None for "off".
+    Keyword arguments extend the allow and deny lists of the profile.
+    """
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown blocking profile '{profile}', "
+            f"expected one of {sorted(PROFILES)}"
+        )
+    settings = PROFILES[profile]
+    if settings is None and not overrides:
+        return None
+
+    options = dict(settings or {})
+    for key, values in overrides.items():
+        if key == "first_party_only":
+            options[key] = values
+        else:
+            options[key] = tuple(options.get(key, ())) + tuple(values)
+    return RequestBlocker(urlparse(base_url).hostname or "", **options)
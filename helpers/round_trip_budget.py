@@ -0,0 +1,286 @@
+"""
+Helper module to profile the driver round trips of every test and gate
+them on a budget.
+
+`RoundTripProfiler` counts round trips with a process wide
+`RoundTripCounter` and measures time, per test and per page object
+method. Page object methods are the methods marked with
+`helpers.reporting.step`; a method's counts include the methods it
+calls. The setup and call phases of a test are counted apart: only the
+call phase is checked against the budget, because session fixtures are
+built in the setup of whichever test needs them first.
+
+`RoundTripBudgets` keeps the budget of every test in a JSON file. A
+test whose call phase takes more than its budget times (1 + margin)
+round trips fails. Tests without a budget get their count as budget.
+"""
+import contextlib
+import json
+import time
+from collections import Counter
+from pathlib import Path
+import pytest
+from helpers import reporting
+from helpers.round_trips import RoundTripCounter
+
+BUDGET_FILE = ".round_trip_budgets.json"
+
+SUMMARY_FILE = "reports/round_trips.json"
+
+DEFAULT_MARGIN = 0.2
+
+# Name of the user property that carries the profile of a test.
+PROPERTY = "round_trips"
+
+SETUP_PROFILE = pytest.StashKey[dict]()
+CALL_PROFILE = pytest.StashKey[dict]()
+
+
+class MethodStats:
+    """Calls, round trips and seconds of one page object method."""
+
+    __slots__ = ("calls", "round_trips", "seconds")
+
+    def __init__(self):
+        self.calls = 0
+        self.round_trips = 0
+        self.seconds = 0.0
+
+    def add(self, calls: int, round_trips: int, seconds: float) -> None:
+        """Add the counts of one or more calls."""
+        self.calls += calls
+        self.round_trips += round_trips
+        self.seconds += seconds
+
+    def as_dict(self) -> dict:
+        """Return the stats as JSON data."""
+        return {
+            "calls": self.calls,
+            "round_trips": self.round_trips,
+            "seconds": round(self.seconds, 4),
+        }
+
+
+class RoundTripProfiler:
+    """
+    Counts round trips and time of a phase of a test and of the page
+    object methods called during it:
+
+        profiler.start()
+        pages.products.verify_products_list_visible()
+        profile = profiler.stop()
+    """
+
+    def __init__(self, counter: RoundTripCounter = None):
+        self.counter = counter or RoundTripCounter()
+        self.methods = {}
+        self._active = Counter()
+        self._started = None
+
+    def start(self) -> None:
+        """
+        Start a profile, counting from now.
+        """
+        self.counter.start()
+        self.methods = {}
+        self._started = (
+            self.counter.total, self.counter.by_method.copy(),
+            time.perf_counter()
+        )
+
+    def stop(self) -> dict:
+        """
+        Return the profile since `start` as JSON data.
+        """
+        total, by_method, started = self._started
+        protocol = self.counter.by_method.copy()
+        protocol.subtract(by_method)
+        return {
+            "round_trips": self.counter.total - total,
+            "seconds": round(time.perf_counter() - started, 4),
+            "protocol": dict((+protocol).most_common()),
+            "methods": {
+                name: stats.as_dict()
+                for name, stats in sorted(self.methods.items())
+            },
+        }
+
+    @contextlib.contextmanager
+    def method(self, name: str):
+        """
+        Count the code inside as one call of a page object method.
+        Recursive calls are counted once.
+        """
+        if self._active[name]:
+            yield
+            return
+        self._active[name] += 1
+        total, started = self.counter.total, time.perf_counter()
+        try:
+            yield
+        finally:
+            self._active[name] -= 1
+            stats = self.methods.get(name)
+            if stats is None:
+                stats = self.methods[name] = MethodStats()
+            stats.add(
+                1, self.counter.total - total,
+                time.perf_counter() - started
+            )
+
+
+class RoundTripBudgets:
+    """
+    Round-trip budgets of the call phase of the tests, by node id.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.budgets = {}
+        try:
+            self.budgets = json.loads(self.path.read_text("utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    def __contains__(self, nodeid: str) -> bool:
+        return nodeid in self.budgets
+
+    def limit(self, nodeid: str, margin: float):
+        """
+        Return the most round trips the test may take, or None if it
+        has no budget.
+        """
+        budget = self.budgets.get(nodeid)
+        if budget is None:
+            return None
+        return int(budget * (1 + margin))
+
+    def record(self, nodeid: str, round_trips: int) -> None:
+        """Set the budget of a test."""
+        self.budgets[nodeid] = round_trips
+
+    def save(self) -> None:
+        """
+        Write the budgets, sorted by node id.
+        """
+        self.path.write_text(
+            json.dumps(self.budgets, indent=1, sort_keys=True), "utf-8"
+        )
+
+
+def summarize(profiles: dict, over_budget: list, margin: float) -> dict:
+    """
+    Return the JSON summary of the test profiles, with the stats of
+    every page object method summed over the tests.
+    """
+    methods = {}
+    for profile in profiles.values():
+        for name, stats in profile["call"]["methods"].items():
+            methods.setdefault(name, MethodStats()).add(
+                stats["calls"], stats["round_trips"], stats["seconds"]
+            )
+    return {
+        "margin": margin,
+        "round_trips": sum(
+            profile["call"]["round_trips"] for profile in profiles.values()
+        ),
+        "over_budget": sorted(over_budget),
+        "tests": dict(sorted(profiles.items())),
+        "methods": {
+            name: stats.as_dict()
+            for name, stats in sorted(
+                methods.items(), key=lambda item: -item[1].round_trips
+            )
+        },
+    }
+
+
+class RoundTripBudgetPlugin:
+    """
+    Profiles the tests, fails those over budget and, in the controller
+    process, writes the summary and the budgets of new tests.
+    """
+
+    def __init__(self, budgets: RoundTripBudgets, summary_path,
+                 margin: float = DEFAULT_MARGIN, update: bool = False,
+                 controller: bool = True):
+        self.budgets = budgets
+        self.summary_path = Path(summary_path)
+        self.margin = margin
+        self.update = update
+        self.controller = controller
+        self.profiler = RoundTripProfiler()
+        self.profiles = {}
+        self.over_budget = []
+
+    def pytest_sessionstart(self, session):
+        reporting.set_profiler(self.profiler)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        self.profiler.start()
+        yield
+        item.stash[SETUP_PROFILE] = self.profiler.stop()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        self.profiler.start()
+        yield
+        item.stash[CALL_PROFILE] = self.profiler.stop()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if call.when != "call" or CALL_PROFILE not in item.stash:
+            return
+        round_trips = item.stash[CALL_PROFILE]["round_trips"]
+        limit = self.budgets.limit(item.nodeid, self.margin)
+        over_budget = (
+            report.passed and not self.update and limit is not None
+            and round_trips > limit
+        )
+        report.user_properties.append((PROPERTY, {
+            "setup": item.stash.get(SETUP_PROFILE, None),
+            "call": item.stash[CALL_PROFILE],
+            "limit": limit,
+            "over_budget": over_budget,
+        }))
+        if over_budget:
+            report.outcome = "failed"
+            report.longrepr = (
+                f"{round_trips} driver round trips, over the budget of "
+                f"{self.budgets.budgets[item.nodeid]} "
+                f"+{self.margin:.0%} ({limit})"
+            )
+
+    def pytest_runtest_logreport(self, report):
+        if not self.controller or report.when != "call":
+            return
+        for name, profile in report.user_properties:
+            if name != PROPERTY:
+                continue
+            self.profiles[report.nodeid] = profile
+            if profile["over_budget"]:
+                self.over_budget.append(report.nodeid)
+            elif report.passed and (
+                    self.update or report.nodeid not in self.budgets):
+                self.budgets.record(
+                    report.nodeid, profile["call"]["round_trips"]
+                )
+
+    def pytest_sessionfinish(self, session):
+        reporting.set_profiler(None)
+        self.profiler.counter.stop()
+        if not self.controller or not self.profiles:
+            return
+        self.summary_path.parent.mkdir(parents=True, exist_ok=True)
+        self.summary_path.write_text(
+            json.dumps(
+                summarize(self.profiles, self.over_budget, self.margin),
+                indent=1
+            ),
+            "utf-8"
+        )
+        self.budgets.save()
+
@@ -0,0 +1,70 @@
+"""
+Helper module to count the protocol messages the Playwright client sends
+to its driver. Every message that expects a reply is one round trip
+between the test process and the driver.
+"""
+from collections import Counter
+from playwright._impl._connection import Connection
+
+
+class RoundTripCounter:
+    """
+    Counts driver round trips, in total and by protocol method, while
+    it is started. Usable as a context manager:
+
+        with RoundTripCounter() as counter:
+            login_page.fill_address_information(**address)
+        print(counter.total, counter.by_method)
+
+    The patch is process wide, so every Playwright connection of the
+    process is counted. Counters can be nested.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.by_method = Counter()
+        self._original = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self) -> None:
+        """
+        Start counting.
+        """
+        if self._original is not None:
+            return
+        original = Connection._send_message_to_server
+        counter = self
+
+        def counting_send(connection, channel_owner, method, params,
+                          no_reply=False):
+            if not no_reply:
+                counter.total += 1
+                counter.by_method[method] += 1
+            return original(
+                connection, channel_owner, method, params, no_reply
+            )
+
+        self._original = original
+        Connection._send_message_to_server = counting_send
+
+    def stop(self) -> None:
+        """
+        Stop counting and restore the previous send method.
+        """
+        if self._original is None:
+            return
+        Connection._send_message_to_server = self._original
+        self._original = None
+
+    def reset(self) -> None:
+        """
+        Reset the counts.
+        """
+        self.total = 0
+        self.by_method.clear()
@@ -0,0 +1,229 @@
+"""
+Helper module to schedule xdist tests longest-first from past durations.
+
+`DurationHistory` keeps the duration of every test of earlier runs in a
+JSON file. `LPTScheduling` dispatches the pending tests longest
+processing time first: every worker holds the test it runs and the next
+one, and a worker that finishes a test gets the longest test left.
+Tests without history are estimated from the other tests of their file,
+then from `FILE_ESTIMATES`, so a new order test still starts early.
+"""
+import heapq
+import json
+import os
+import time
+from pathlib import Path
+import pytest
+from xdist.scheduler import LoadScheduling
+
+HISTORY_FILE = ".test_durations.json"
+
+DEFAULT_ESTIMATE = 10.0
+
+# Seconds per test of files that have no history yet.
+FILE_ESTIMATES = {
+    "tests/test_order.py": 120.0,
+    "tests/test_download_invoice.py": 90.0,
+    "tests/test_register.py": 40.0,
+    "tests/test_async_scenarios.py": 30.0,
+}
+
+# Weight of the latest run in the stored duration.
+SMOOTHING = 0.5
+
+
+def nodeid_file(nodeid: str) -> str:
+    """Return the file part of a test node id."""
+    return nodeid.split("::", 1)[0]
+
+
+def lpt_makespan(estimates, workers: int) -> float:
+    """
+    Return the makespan of running `estimates` longest first, each on
+    the worker that becomes free first.
+    """
+    loads = [0.0] * max(workers, 1)
+    for estimate in sorted(estimates, reverse=True):
+        heapq.heapreplace(loads, loads[0] + estimate)
+    return max(loads)
+
+
+class DurationHistory:
+    """
+    Durations in seconds of the tests of earlier runs, by node id.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.durations = {}
+        self._by_file = None
+        try:
+            self.durations = json.loads(self.path.read_text("utf-8"))
+        except (OSError, ValueError):
+            pass
+
+    def __contains__(self, nodeid: str) -> bool:
+        return nodeid in self.durations
+
+    def estimate(self, nodeid: str) -> float:
+        """
+        Return the expected duration of a test: its own history, else
+        the mean of its file, else the file estimate or the default.
+        """
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        if self._by_file is None:
+            by_file = {}
+            for known, seconds in self.durations.items():
+                by_file.setdefault(nodeid_file(known), []).append(seconds)
+            self._by_file = {
+                path: sum(values) / len(values)
+                for path, values in by_file.items()
+            }
+        path = nodeid_file(nodeid)
+        if path in self._by_file:
+            return self._by_file[path]
+        return FILE_ESTIMATES.get(path, DEFAULT_ESTIMATE)
+
+    def update(self, durations: dict) -> None:
+        """
+        Merge the durations of a run, smoothing the known tests.
+        """
+        for nodeid, seconds in durations.items():
+            previous = self.durations.get(nodeid)
+            if previous is not None:
+                seconds = SMOOTHING * seconds + (1 - SMOOTHING) * previous
+            self.durations[nodeid] = round(seconds, 3)
+        self._by_file = None
+
+    def save(self) -> None:
+        """
+        Write the history atomically.
+        """
+        temporary = self.path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(
+            json.dumps(self.durations, indent=0, sort_keys=True), "utf-8"
+        )
+        os.replace(temporary, self.path)
+
+
+class LPTScheduling(LoadScheduling):
+    """
+    xdist load scheduling that sends the longest pending test to the
+    worker that becomes free.
+    """
+
+    def __init__(self, config, log=None, history: DurationHistory = None):
+        super().__init__(config, log)
+        self.history = history or DurationHistory(HISTORY_FILE)
+        self.predicted_makespan = None
+        self.with_history = 0
+        self.workers = 0
+        self.started = None
+
+    def schedule(self) -> None:
+        """
+        Sort the collection by expected duration and send every worker
+        its first two tests.
+        """
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        estimates = [self.history.estimate(nodeid)
+                     for nodeid in self.collection]
+        self.pending[:] = sorted(
+            range(len(self.collection)), key=lambda index: -estimates[index]
+        )
+        self.workers = len(self.nodes)
+        self.predicted_makespan = lpt_makespan(estimates, self.workers)
+        self.with_history = sum(
+            1 for nodeid in self.collection if nodeid in self.history
+        )
+        self.started = time.monotonic()
+
+        # A worker runs a test once it knows the next one, so each
+        # worker holds two tests; deal them out longest first.
+        for _ in range(2):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        """
+        Top the worker up to two tests, or shut it down when no tests
+        are left.
+        """
+        if node.shutting_down:
+            return
+        if not self.pending:
+            node.shutdown()
+        elif len(self.node2pending[node]) < 2:
+            self._send_tests(node, 1)
+        self.log("num items waiting for node:", len(self.pending))
+
+
+class LPTSchedulerPlugin:
+    """
+    Registered as a pytest plugin in the controller with --lpt: provides
+    the scheduler, records the test durations into the history and
+    reports the predicted and the actual makespan.
+    """
+
+    def __init__(self, history: DurationHistory):
+        self.history = history
+        self.durations = {}
+        self.scheduler = None
+        self.finished = None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        """
+        Return the longest-first scheduler in place of the `load`
+        distribution, and leave the other --dist modes to xdist.
+        """
+        if config.getoption("dist") != "load":
+            return None
+        self.scheduler = LPTScheduling(config, log, self.history)
+        return self.scheduler
+
+    def pytest_runtest_logreport(self, report):
+        """
+        Add the duration of a test phase to its test.
+        """
+        self.durations[report.nodeid] = (
+            self.durations.get(report.nodeid, 0.0) + report.duration
+        )
+        self.finished = time.monotonic()
+
+    def pytest_sessionfinish(self, session):
+        """
+        Store the durations of this run in the history.
+        """
+        if self.durations:
+            self.history.update(self.durations)
+            self.history.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """
+        Report the predicted and the actual makespan.
+        """
+        scheduler = self.scheduler
+        if scheduler is None or scheduler.started is None:
+            return
+        collection = scheduler.collection or []
+        actual = (self.finished or scheduler.started) - scheduler.started
+        terminalreporter.section("LPT schedule")
+        terminalreporter.write_line(
+            f"{len(collection)} tests on {scheduler.workers} workers, "
+            f"{scheduler.with_history} with history: predicted makespan "
+            f"{scheduler.predicted_makespan:.1f}s, actual {actual:.1f}s"
+        )
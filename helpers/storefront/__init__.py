@@ -0,0 +1,6 @@
+"""
+Local stand-in storefront for hermetic test runs.
+"""
+from helpers.storefront.server import Storefront
+
+__all__ = ["Storefront"]
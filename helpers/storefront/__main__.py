@@ -0,0 +1,29 @@
+"""
+Run the local storefront: `python -m helpers.storefront --port 8000`.
+"""
+import argparse
+import time
+from helpers.storefront import Storefront
+from test_data.login_data import TEST_USER
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    storefront = Storefront(args.host, args.port)
+    storefront.seed_account(
+        TEST_USER["username"], TEST_USER["email"], TEST_USER["password"]
+    )
+    print(f"Serving storefront on {storefront.start()}", flush=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        storefront.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Catalog of the local storefront: products, categories and brands.
+"""
+
+PRODUCTS = [
+    {"id": 1, "name": "Blue Top", "price": 500,
+     "category": ("Women", "Tops"), "brand": "Polo"},
+    {"id": 2, "name": "Men Tshirt", "price": 400,
+     "category": ("Men", "Tshirts"), "brand": "H&M"},
+    {"id": 3, "name": "Sleeveless Dress", "price": 1000,
+     "category": ("Women", "Dress"), "brand": "Madame"},
+    {"id": 4, "name": "Stylish Dress", "price": 1500,
+     "category": ("Women", "Dress"), "brand": "Madame"},
+    {"id": 5, "name": "Winter Top", "price": 600,
+     "category": ("Women", "Tops"), "brand": "Mast & Harbour"},
+    {"id": 6, "name": "Summer White Top", "price": 400,
+     "category": ("Women", "Tops"), "brand": "H&M"},
+    {"id": 7, "name": "Madame Top For Women", "price": 1000,
+     "category": ("Women", "Tops"), "brand": "Madame"},
+    {"id": 8, "name": "Fancy Green Top", "price": 700,
+     "category": ("Women", "Tops"), "brand": "Polo"},
+    {"id": 11, "name": "Blue Cotton Indie Mickey Dress", "price": 1530,
+     "category": ("Kids", "Dress"), "brand": "Babyhug"},
+    {"id": 12, "name": "Little Girls Mr. Panda Shirt", "price": 1000,
+     "category": ("Kids", "Tops & Shirts"), "brand": "Allen Solly Junior"},
+    {"id": 13, "name": "Sleeves Printed Top - White", "price": 499,
+     "category": ("Kids", "Tops & Shirts"), "brand": "Kookie Kids"},
+    {"id": 28, "name": "Pure Cotton V-Neck T-Shirt", "price": 1299,
+     "category": ("Men", "Tshirts"), "brand": "Polo"},
+    {"id": 33, "name": "Soft Stretch Jeans", "price": 799,
+     "category": ("Men", "Jeans"), "brand": "Polo"},
+    {"id": 37, "name": "Rose Pink Embroidered Maxi Dress", "price": 1600,
+     "category": ("Women", "Saree"), "brand": "Biba"},
+]
+
+CATEGORIES = {
+    1: ("Women", "Dress"),
+    2: ("Women", "Tops"),
+    7: ("Women", "Saree"),
+    3: ("Men", "Tshirts"),
+    6: ("Men", "Jeans"),
+    4: ("Kids", "Dress"),
+    5: ("Kids", "Tops & Shirts"),
+}
+
+BRANDS = [
+    "Polo",
+    "H&M",
+    "Madame",
+    "Mast & Harbour",
+    "Babyhug",
+    "Allen Solly Junior",
+    "Kookie Kids",
+    "Biba",
+]
+
+PRODUCTS_BY_ID = {product["id"]: product for product in PRODUCTS}
+
+
+def products_in_category(category_id: int):
+    """
+    Return the products of a category id.
+    """
+    category = CATEGORIES.get(category_id)
+    return [product for product in PRODUCTS
+            if product["category"] == category]
+
+
+def products_of_brand(brand: str):
+    """
+    Return the products of a brand.
+    """
+    return [product for product in PRODUCTS if product["brand"] == brand]
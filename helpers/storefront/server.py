@@ -0,0 +1,546 @@
+"""
+Local stand-in for automationexercise.com.
+
+Serves the pages, forms and API endpoints the suite uses from memory,
+so tests can run without the public site: no network latency, no ads
+and no shared accounts between runs.
+"""
+import json
+import re
+import secrets
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from helpers.storefront import templates
+from helpers.storefront.catalog import (
+    CATEGORIES,
+    PRODUCTS,
+    PRODUCTS_BY_ID,
+    products_in_category,
+    products_of_brand,
+)
+
+SESSION_COOKIE = "sessionid"
+CSRF_COOKIE = "csrftoken"
+
+ACCOUNT_FIELDS = (
+    "title", "birth_date", "birth_month", "birth_year", "firstname",
+    "lastname", "company", "address1", "address2", "country", "zipcode",
+    "state", "city", "mobile_number",
+)
+
+
+class StoreState:
+    """
+    Accounts and browser sessions of the storefront, shared by the
+    request handler threads.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.accounts = {}
+        self.sessions = {}
+
+    def session(self, session_id: str) -> dict:
+        """
+        Return the session for an id, creating an empty one if needed.
+        """
+        return self.sessions.setdefault(
+            session_id, {"email": None, "cart": {}, "signup": None}
+        )
+
+    def user(self, session: dict):
+        """
+        Return the account logged in to the session, or None.
+        """
+        return self.accounts.get(session["email"])
+
+
+def checkout_user(account: dict) -> dict:
+    """
+    Return the fields of an account shown in the checkout addresses.
+    """
+    return {
+        "title": account.get("title", ""),
+        "first_name": account.get("firstname", ""),
+        "last_name": account.get("lastname", ""),
+        "company": account.get("company", ""),
+        "address1": account.get("address1", ""),
+        "address2": account.get("address2", ""),
+        "city": account.get("city", ""),
+        "state": account.get("state", ""),
+        "zipcode": account.get("zipcode", ""),
+        "country": account.get("country", ""),
+        "mobile_number": account.get("mobile_number", ""),
+    }
+
+
+class StorefrontHandler(BaseHTTPRequestHandler):
+    """
+    Request handler dispatching on the route tables below.
+    """
+    state = None
+
+    def do_GET(self):
+        self._dispatch(GET_ROUTES)
+
+    def do_POST(self):
+        self._dispatch(POST_ROUTES)
+
+    def do_DELETE(self):
+        self._dispatch(DELETE_ROUTES)
+
+    def do_PUT(self):
+        self._dispatch(PUT_ROUTES)
+
+    def log_message(self, *args):
+        pass
+
+    def _dispatch(self, routes):
+        """
+        Call the handler of the first matching route, 404 otherwise.
+        """
+        url = urlsplit(self.path)
+        self.query = {
+            key: values[0] for key, values in parse_qs(url.query).items()
+        }
+        self.form = self._read_form()
+        self._new_cookies = {}
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        self.session_id = (
+            cookies[SESSION_COOKIE].value
+            if SESSION_COOKIE in cookies else None
+        )
+        self.csrf_token = (
+            cookies[CSRF_COOKIE].value if CSRF_COOKIE in cookies else None
+        )
+        if self.session_id is None:
+            self.session_id = secrets.token_hex(16)
+            self._new_cookies[SESSION_COOKIE] = self.session_id
+        if self.csrf_token is None:
+            self.csrf_token = secrets.token_hex(32)
+            self._new_cookies[CSRF_COOKIE] = self.csrf_token
+
+        for pattern, handler in routes:
+            match = re.fullmatch(pattern, url.path)
+            if match:
+                with self.state.lock:
+                    self.session = self.state.session(self.session_id)
+                    self.user = self.state.user(self.session)
+                    handler(self, *map(unquote, match.groups()))
+                return
+        self._html(templates.layout("Not Found", "<h2>Not Found</h2>"), 404)
+
+    def _read_form(self) -> dict:
+        """
+        Return url-encoded form fields of the body. Multipart bodies,
+        such as the contact form upload, are read and ignored.
+        """
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        content_type = self.headers.get("Content-Type", "")
+        if not body or content_type.startswith("multipart/"):
+            return {}
+        return {
+            key: values[0]
+            for key, values in parse_qs(body.decode()).items()
+        }
+
+    def _send(self, code: int, body: bytes, content_type: str,
+              headers: dict = None):
+        """
+        Send a response with the pending session cookies.
+        """
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in self._new_cookies.items():
+            self.send_header(
+                "Set-Cookie", f"{name}={value}; Path=/; SameSite=Lax"
+            )
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _html(self, content: str, code: int = 200):
+        self._send(code, content.encode(), "text/html; charset=utf-8")
+
+    def _json(self, code: int, message: str):
+        """
+        Reply like the site API: HTTP 200 with the status in the body.
+        """
+        body = json.dumps({"responseCode": code, "message": message})
+        self._send(200, body.encode(), "application/json")
+
+    def _redirect(self, location: str):
+        self._send(302, b"", "text/html", {"Location": location})
+
+    def _start_session(self, email: str):
+        """
+        Log the session in, keeping its cart.
+        """
+        self.session["email"] = email
+        self.user = self.state.accounts[email]
+
+    # Pages
+
+    def home(self):
+        self._html(templates.home_page(self.user))
+
+    def products(self):
+        self._html(templates.products_page(
+            "All Products", PRODUCTS, self.user
+        ))
+
+    def category_products(self, category_id):
+        category = CATEGORIES.get(int(category_id))
+        if category is None:
+            self._redirect("/products")
+            return
+        self._html(templates.products_page(
+            f"{category[0]} - {category[1]} Products",
+            products_in_category(int(category_id)),
+            self.user
+        ))
+
+    def brand_products(self, brand):
+        self._html(templates.products_page(
+            f"Brand - {brand} Products",
+            products_of_brand(brand),
+            self.user
+        ))
+
+    def product_details(self, product_id):
+        product = PRODUCTS_BY_ID.get(int(product_id))
+        if product is None:
+            self._html(templates.layout("Not Found", "<h2>Not Found</h2>"),
+                       404)
+            return
+        self._html(templates.product_detail_page(product, self.user))
+
+    def login_form(self):
+        self._html(templates.login_page(self.user, self.csrf_token))
+
+    def login(self):
+        account = self.state.accounts.get(self.form.get("email"))
+        if account and account["password"] == self.form.get("password"):
+            self._start_session(account["email"])
+            self._redirect("/")
+            return
+        self._html(templates.login_page(
+            self.user,
+            self.csrf_token,
+            login_error="Your email or password is incorrect!"
+        ))
+
+    def signup(self):
+        if self.form.get("form_type") == "create_account":
+            self._create_account_from_form()
+            return
+        email = self.form.get("email", "")
+        if email in self.state.accounts:
+            self._html(templates.login_page(
+                self.user,
+                self.csrf_token,
+                signup_error="Email Address already exist!"
+            ))
+            return
+        self.session["signup"] = {
+            "name": self.form.get("name", ""),
+            "email": email,
+        }
+        self._html(templates.signup_page(
+            self.form.get("name", ""), email, self.csrf_token
+        ))
+
+    def _create_account_from_form(self):
+        form = self.form
+        account = {
+            "name": form.get("name", ""),
+            "email": form.get("email", ""),
+            "password": form.get("password", ""),
+            "title": form.get("title", ""),
+            "birth_date": form.get("days", ""),
+            "birth_month": form.get("months", ""),
+            "birth_year": form.get("years", ""),
+            "firstname": form.get("first_name", ""),
+            "lastname": form.get("last_name", ""),
+            "company": form.get("company", ""),
+            "address1": form.get("address1", ""),
+            "address2": form.get("address2", ""),
+            "country": form.get("country", ""),
+            "zipcode": form.get("zipcode", ""),
+            "state": form.get("state", ""),
+            "city": form.get("city", ""),
+            "mobile_number": form.get("mobile_number", ""),
+        }
+        self.state.accounts[account["email"]] = account
+        self.session["signup"] = None
+        self._start_session(account["email"])
+        self._redirect("/account_created")
+
+    def account_created(self):
+        self._html(templates.message_page(
+            "account-created",
+            "Account Created!",
+            "Congratulations! Your new account has been successfully "
+            "created!",
+            self.user
+        ))
+
+    def logout(self):
+        self.session["email"] = None
+        self.session["cart"] = {}
+        self._redirect("/login")
+
+    def delete_account(self):
+        if self.user is None:
+            self._redirect("/login")
+            return
+        self.state.accounts.pop(self.user["email"], None)
+        self.session["email"] = None
+        self.session["cart"] = {}
+        self._html(templates.message_page(
+            "account-deleted",
+            "Account Deleted!",
+            "Your account has been permanently deleted!"
+        ))
+
+    def add_to_cart(self, product_id):
+        product_id = int(product_id)
+        if product_id not in PRODUCTS_BY_ID:
+            self._json(404, "Product not found!")
+            return
+        quantity = int(self.query.get("quantity", 1))
+        cart = self.session["cart"]
+        cart[product_id] = cart.get(product_id, 0) + quantity
+        self._json(200, "Added to cart")
+
+    def delete_cart(self, product_id):
+        self.session["cart"].pop(int(product_id), None)
+        self._json(200, "Removed from cart")
+
+    def _cart_items(self):
+        return [
+            (PRODUCTS_BY_ID[product_id], quantity)
+            for product_id, quantity in self.session["cart"].items()
+        ]
+
+    def _cart_total(self) -> int:
+        return sum(
+            product["price"] * quantity
+            for product, quantity in self._cart_items()
+        )
+
+    def view_cart(self):
+        self._html(templates.cart_page(self._cart_items(), self.user))
+
+    def checkout(self):
+        if self.user is None:
+            self._redirect("/view_cart")
+            return
+        self._html(templates.checkout_page(
+            self._cart_items(),
+            self._cart_total(),
+            checkout_user(self.user),
+            self.user
+        ))
+
+    def payment_form(self):
+        if self.user is None:
+            self._redirect("/login")
+            return
+        self._html(templates.payment_page(self.user, self.csrf_token))
+
+    def payment(self):
+        if self.user is None:
+            self._redirect("/login")
+            return
+        total = self._cart_total()
+        self.session["cart"] = {}
+        self._redirect(f"/payment_done/{total}")
+
+    def payment_done(self, total):
+        self._html(templates.payment_done_page(int(total), self.user))
+
+    def download_invoice(self, total):
+        user = self.user or {"firstname": "", "lastname": ""}
+        body = (
+            f"Hi {user['firstname']} {user['lastname']}, Your total "
+            f"purchase amount is {total}. Thank you"
+        )
+        self._send(
+            200,
+            body.encode(),
+            "text/plain",
+            {"Content-Disposition": 'attachment; filename="invoice.txt"'}
+        )
+
+    def contact_us_form(self):
+        self._html(templates.contact_us_page(self.user))
+
+    def contact_us(self):
+        self._html(templates.contact_us_page(self.user, submitted=True))
+
+    def subscribe(self):
+        self._json(200, "You have been successfully subscribed!")
+
+    def test_cases(self):
+        self._html(templates.test_cases_page(self.user))
+
+    # API
+
+    def api_create_account(self):
+        email = self.form.get("email", "")
+        if not email or "password" not in self.form:
+            self._json(400, "Bad request, email or password missing!")
+            return
+        if email in self.state.accounts:
+            self._json(400, "Email already exists!")
+            return
+        account = {
+            "name": self.form.get("name", ""),
+            "email": email,
+            "password": self.form["password"],
+        }
+        account.update({
+            field: self.form.get(field, "") for field in ACCOUNT_FIELDS
+        })
+        self.state.accounts[email] = account
+        self._json(201, "User created!")
+
+    def api_verify_login(self):
+        account = self.state.accounts.get(self.form.get("email"))
+        if account and account["password"] == self.form.get("password"):
+            self._json(200, "User exists!")
+        else:
+            self._json(404, "User not found!")
+
+    def api_delete_account(self):
+        account = self.state.accounts.get(self.form.get("email"))
+        if account and account["password"] == self.form.get("password"):
+            del self.state.accounts[account["email"]]
+            self._json(200, "Account deleted!")
+        else:
+            self._json(404, "Account not found!")
+
+    def api_update_account(self):
+        account = self.state.accounts.get(self.form.get("email"))
+        if not account or account["password"] != self.form.get("password"):
+            self._json(404, "Account not found!")
+            return
+        account.update({
+            field: self.form[field]
+            for field in ("name",) + ACCOUNT_FIELDS
+            if field in self.form
+        })
+        self._json(200, "User updated!")
+
+
+H = StorefrontHandler
+
+GET_ROUTES = (
+    (r"/", H.home),
+    (r"/products", H.products),
+    (r"/category_products/(\d+)", H.category_products),
+    (r"/brand_products/(.+)", H.brand_products),
+    (r"/product_details/(\d+)", H.product_details),
+    (r"/login", H.login_form),
+    (r"/account_created", H.account_created),
+    (r"/logout", H.logout),
+    (r"/delete_account", H.delete_account),
+    (r"/add_to_cart/(\d+)", H.add_to_cart),
+    (r"/delete_cart/(\d+)", H.delete_cart),
+    (r"/view_cart", H.view_cart),
+    (r"/checkout", H.checkout),
+    (r"/payment", H.payment_form),
+    (r"/payment_done/(\d+)", H.payment_done),
+    (r"/download_invoice/(\d+)", H.download_invoice),
+    (r"/contact_us", H.contact_us_form),
+    (r"/test_cases", H.test_cases),
+)
+
+POST_ROUTES = (
+    (r"/login", H.login),
+    (r"/signup", H.signup),
+    (r"/payment", H.payment),
+    (r"/contact_us", H.contact_us),
+    (r"/subscribe", H.subscribe),
+    (r"/api/createAccount", H.api_create_account),
+    (r"/api/verifyLogin", H.api_verify_login),
+)
+
+DELETE_ROUTES = (
+    (r"/api/deleteAccount", H.api_delete_account),
+)
+
+PUT_ROUTES = (
+    (r"/api/updateAccount", H.api_update_account),
+)
+
+
+class Storefront:
+    """
+    Runs the storefront on a local port in a background thread.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the storefront.
+
+        Args:
+            host (str): Interface to listen on.
+            port (int): Port to listen on, 0 picks a free one.
+        """
+        self.host = host
+        self.port = port
+        self.state = StoreState()
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL of the running storefront.
+        """
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> str:
+        """
+        Start serving and return the base URL.
+        """
+        handler = type(
+            "BoundStorefrontHandler", (StorefrontHandler,),
+            {"state": self.state}
+        )
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_port
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self.url
+
+    def seed_account(self, name: str, email: str, password: str,
+                     **fields) -> None:
+        """
+        Create an account, e.g. the fixed users of `test_data`.
+        """
+        account = {field: "" for field in ACCOUNT_FIELDS}
+        account.update(fields, name=name, email=email, password=password)
+        with self.state.lock:
+            self.state.accounts[email] = account
+
+    def stop(self) -> None:
+        """
+        Stop serving.
+        """
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
@@ -0,0 +1,724 @@
+"""
+HTML templates of the local storefront.
+
+The markup keeps the ids, classes and data-qa attributes the page
+objects under `pages/` rely on.
+"""
+from html import escape
+from urllib.parse import quote
+from helpers.storefront.catalog import BRANDS, CATEGORIES
+
+MONTHS = [
+    "January", "February", "March", "April", "May", "June", "July",
+    "August", "September", "October", "November", "December",
+]
+
+COUNTRIES = [
+    "India", "United States", "Canada", "Australia", "Israel",
+    "New Zealand", "Singapore",
+]
+
+STYLE = """
+body { margin: 0; font-family: sans-serif; }
+.nav { list-style: none; display: flex; gap: 12px; padding: 0; }
+.features_items .col-sm-4 { display: inline-block; width: 30%;
+    vertical-align: top; }
+.single-products { position: relative; min-height: 120px; }
+.product-overlay { display: none; position: absolute; inset: 0;
+    background: #fe980f; }
+.single-products:hover .product-overlay { display: block; }
+.panel-collapse.collapse { display: none; }
+.panel-collapse.collapse.in { display: block; }
+#slider-carousel .item { display: none; }
+#slider-carousel .item.active { display: block; }
+.modal { display: none; }
+.modal.show { display: block; position: fixed; top: 30%; left: 30%;
+    background: #fff; border: 1px solid #ccc; padding: 20px; z-index: 10; }
+.hide { display: none; }
+#scrollUp { display: none; position: fixed; right: 10px; bottom: 10px; }
+#footer { margin-top: 40px; }
+"""
+
+SCRIPT = """
+document.addEventListener('click', function (event) {
+  var target = event.target;
+  var addToCart = target.closest('.add-to-cart');
+  if (addToCart) {
+    event.preventDefault();
+    fetch('/add_to_cart/' + addToCart.dataset.productId)
+      .then(function () { showModal('cartModal'); });
+    return;
+  }
+  if (target.closest('button.cart')) {
+    event.preventDefault();
+    var button = target.closest('button.cart');
+    var quantity = document.getElementById('quantity').value;
+    fetch('/add_to_cart/' + button.dataset.productId +
+          '?quantity=' + quantity)
+      .then(function () { showModal('cartModal'); });
+    return;
+  }
+  if (target.closest('.close-modal')) {
+    target.closest('.modal').classList.remove('show');
+    return;
+  }
+  var deleteLink = target.closest('.cart_quantity_delete');
+  if (deleteLink) {
+    event.preventDefault();
+    var productId = deleteLink.dataset.productId;
+    fetch('/delete_cart/' + productId).then(function () {
+      var row = document.getElementById('product-' + productId);
+      if (row) { row.remove(); }
+    });
+    return;
+  }
+  var checkOut = target.closest('.check_out');
+  if (checkOut && checkOut.dataset.loggedIn !== 'true') {
+    event.preventDefault();
+    showModal('checkoutModal');
+    return;
+  }
+  var panelToggle = target.closest('.panel-title a');
+  if (panelToggle) {
+    event.preventDefault();
+    var panel = document.querySelector(panelToggle.getAttribute('href'));
+    document.querySelectorAll('#accordian .panel-collapse')
+      .forEach(function (other) {
+        if (other !== panel) { other.classList.remove('in'); }
+      });
+    panel.classList.add('in');
+    return;
+  }
+  if (target.closest('#subscribe')) {
+    event.preventDefault();
+    var email = document.getElementById('susbscribe_email').value;
+    fetch('/subscribe', {method: 'POST', body: new URLSearchParams(
+      {email: email})}).then(function () {
+      document.getElementById('success-subscribe')
+        .classList.remove('hide');
+    });
+    return;
+  }
+  if (target.closest('#button-review')) {
+    event.preventDefault();
+    document.getElementById('review-section').classList.remove('hide');
+    return;
+  }
+  if (target.closest('#scrollUp')) {
+    event.preventDefault();
+    window.scrollTo(0, 0);
+  }
+});
+
+function showModal(id) {
+  document.getElementById(id).classList.add('show');
+}
+
+window.addEventListener('scroll', function () {
+  var arrow = document.getElementById('scrollUp');
+  arrow.style.display = window.scrollY > 300 ? 'block' : 'none';
+});
+
+var slides = document.querySelectorAll('#slider-carousel .item');
+if (slides.length > 1) {
+  var active = 0;
+  setInterval(function () {
+    slides[active].classList.remove('active');
+    active = (active + 1) % slides.length;
+    slides[active].classList.add('active');
+  }, 1500);
+}
+"""
+
+
+def esc(value) -> str:
+    """
+    Escape a value for HTML text and attributes.
+    """
+    return escape(str(value), quote=True)
+
+
+def price(amount: int) -> str:
+    """
+    Format a price the way the site does.
+    """
+    return f"Rs. {amount}"
+
+
+def layout(title: str, content: str, user=None) -> str:
+    """
+    Wrap page content with the header, footer and scripts.
+    """
+    if user:
+        account_links = (
+            '<li><a href="/logout"><i class="fa fa-lock"></i> Logout</a>'
+            '</li><li><a href="/delete_account">'
+            '<i class="fa fa-trash-o"></i> Delete Account</a></li>'
+        )
+        logged_in = (
+            '<li><a><i class="fa fa-user"></i> Logged in as '
+            f'<b>{esc(user["name"])}</b></a></li>'
+        )
+    else:
+        account_links = (
+            '<li><a href="/login"><i class="fa fa-lock"></i> '
+            'Signup / Login</a></li>'
+        )
+        logged_in = ""
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{esc(title)}</title>
+<style>{STYLE}</style>
+</head>
+<body>
+<header id="header">
+  <div class="header-middle"><div class="shop-menu">
+    <ul class="nav navbar-nav">
+      <li><a href="/"><i class="fa fa-home"></i> Home</a></li>
+      <li><a href="/products"><i class="material-icons"></i> Products</a>
+      </li>
+      <li><a href="/view_cart"><i class="fa fa-shopping-cart"></i> Cart</a>
+      </li>
+      {account_links}
+      <li><a href="/test_cases"><i class="fa fa-list"></i> Test Cases</a>
+      </li>
+      <li><a href="/api_list"><i class="fa fa-list"></i> API Testing</a>
+      </li>
+      <li><a href="/contact_us"><i class="fa fa-envelope"></i> Contact us</a>
+      </li>
+      {logged_in}
+    </ul>
+  </div></div>
+</header>
+{content}
+<div class="modal" id="cartModal">
+  <h4 class="modal-title">Added!</h4>
+  <p>Your product has been added to cart.</p>
+  <p><a href="/view_cart"><u>View Cart</u></a></p>
+  <button class="btn btn-success close-modal btn-block">
+    Continue Shopping</button>
+</div>
+<footer id="footer">
+  <div class="footer-widget"><div class="single-widget">
+    <h2>Subscription</h2>
+    <form class="searchform">
+      <input type="email" id="susbscribe_email"
+             placeholder="Your email address">
+      <button type="submit" id="subscribe" class="btn btn-default">
+        Subscribe</button>
+    </form>
+    <div id="success-subscribe" class="hide">
+      <div class="alert-success alert">
+        You have been successfully subscribed!</div>
+    </div>
+  </div></div>
+</footer>
+<a id="scrollUp" href="#top">Top</a>
+<script>{SCRIPT}</script>
+</body>
+</html>"""
+
+
+def sidebar() -> str:
+    """
+    Left sidebar with categories and brands.
+    """
+    panels = []
+    for main in ("Women", "Men", "Kids"):
+        links = "".join(
+            f'<li><a href="/category_products/{category_id}">'
+            f"{esc(sub)} </a></li>"
+            for category_id, (parent, sub) in CATEGORIES.items()
+            if parent == main
+        )
+        panels.append(f"""
+<div class="panel panel-default">
+  <div class="panel-heading"><h4 class="panel-title">
+    <a data-toggle="collapse" data-parent="#accordian" href="#{main}">
+      <span class="badge pull-right"><i class="fa fa-plus"></i></span>
+      {main}</a>
+  </h4></div>
+  <div id="{main}" class="panel-collapse collapse">
+    <div class="panel-body"><ul>{links}</ul></div>
+  </div>
+</div>""")
+
+    brands = "".join(
+        f'<li><a href="/brand_products/{quote(brand)}">'
+        f'<span class="pull-right">(1)</span>{esc(brand)}</a></li>'
+        for brand in BRANDS
+    )
+    return f"""
+<div class="left-sidebar">
+  <h2>Category</h2>
+  <div class="panel-group category-products" id="accordian">
+    {"".join(panels)}
+  </div>
+  <div class="brands_products">
+    <h2>Brands</h2>
+    <div class="brands-name">
+      <ul class="nav nav-pills nav-stacked">{brands}</ul>
+    </div>
+  </div>
+</div>"""
+
+
+def product_card(product) -> str:
+    """
+    Product card of the products grid.
+    """
+    info = (
+        f"<h2>{price(product['price'])}</h2><p>{esc(product['name'])}</p>"
+        '<a href="#" class="btn btn-default add-to-cart" '
+        f'data-product-id="{product["id"]}">Add to cart</a>'
+    )
+    return f"""
+<div class="col-sm-4">
+  <div class="product-image-wrapper">
+    <div class="single-products">
+      <div class="productinfo text-center">{info}</div>
+      <div class="product-overlay"><div class="overlay-content">
+        {info}
+      </div></div>
+    </div>
+    <div class="choose"><ul class="nav nav-pills nav-justified">
+      <li><a href="/product_details/{product['id']}">View Product</a></li>
+    </ul></div>
+  </div>
+</div>"""
+
+
+def products_page(title: str, products, user=None) -> str:
+    """
+    Products grid with the sidebar, used by the products, category
+    and brand pages.
+    """
+    cards = "".join(product_card(product) for product in products)
+    content = f"""
+<section>
+  {sidebar()}
+  <div class="features_items">
+    <h2 class="title text-center">{esc(title)}</h2>
+    {cards}
+  </div>
+</section>"""
+    return layout(f"Automation Exercise - {title}", content, user)
+
+
+def home_page(user=None) -> str:
+    """
+    Home page with the header carousel and recommended items.
+    """
+    slides = "".join(
+        f'<div class="item{" active" if index == 0 else ""}">'
+        "<h1>AutomationExercise</h1>"
+        "<h2>Full-Fledged practice website for Automation Engineers</h2>"
+        "</div>"
+        for index in range(3)
+    )
+    content = f"""
+<section id="slider">
+  <div id="slider-carousel" class="carousel slide">
+    <div class="carousel-inner">{slides}</div>
+  </div>
+</section>
+<section style="min-height: 1600px">
+  <div class="recommended_items">
+    <h2 class="title text-center">recommended items</h2>
+    <div id="recommended-item-carousel" class="carousel slide">
+      <div class="carousel-inner"><div class="item active">
+        <div class="productinfo text-center">
+          <h2>Rs. 500</h2><p>Blue Top</p>
+          <a href="#" class="btn btn-default add-to-cart"
+             data-product-id="1">Add to cart</a>
+        </div>
+      </div></div>
+    </div>
+  </div>
+</section>"""
+    return layout("Automation Exercise", content, user)
+
+
+def login_page(user=None, csrf_token="", login_error="",
+               signup_error="") -> str:
+    """
+    Login and signup forms.
+    """
+    login_error_html = (
+        f'<p style="color: red;">{esc(login_error)}</p>'
+        if login_error else ""
+    )
+    signup_error_html = (
+        f'<p style="color: red;">{esc(signup_error)}</p>'
+        if signup_error else ""
+    )
+    csrf = (
+        '<input type="hidden" name="csrfmiddlewaretoken" '
+        f'value="{esc(csrf_token)}">'
+    )
+    content = f"""
+<section id="form">
+  <div class="login-form">
+    <h2>Login to your account</h2>
+    <form action="/login" method="POST">
+      {csrf}
+      <input type="email" data-qa="login-email" name="email"
+             placeholder="Email Address" required>
+      <input type="password" data-qa="login-password" name="password"
+             placeholder="Password" required>
+      {login_error_html}
+      <button type="submit" data-qa="login-button" class="btn">Login
+      </button>
+    </form>
+  </div>
+  <div class="signup-form">
+    <h2>New User Signup!</h2>
+    <form action="/signup" method="POST">
+      {csrf}
+      <input type="text" data-qa="signup-name" name="name"
+             placeholder="Name" required>
+      <input type="email" data-qa="signup-email" name="email"
+             placeholder="Email Address" required>
+      {signup_error_html}
+      <button type="submit" data-qa="signup-button" class="btn">Signup
+      </button>
+    </form>
+  </div>
+</section>"""
+    return layout("Automation Exercise - Signup / Login", content, user)
+
+
+def signup_page(name: str, email: str, csrf_token="") -> str:
+    """
+    Account and address information form.
+    """
+    days = "".join(
+        f'<option value="{day}">{day}</option>' for day in range(1, 32)
+    )
+    months = "".join(
+        f'<option value="{index}">{month}</option>'
+        for index, month in enumerate(MONTHS, start=1)
+    )
+    years = "".join(
+        f'<option value="{year}">{year}</option>'
+        for year in range(2021, 1899, -1)
+    )
+    countries = "".join(
+        f'<option value="{country}">{country}</option>'
+        for country in COUNTRIES
+    )
+    content = f"""
+<section id="form">
+  <div class="login-form">
+    <h2 class="title text-center"><b>ENTER ACCOUNT INFORMATION</b></h2>
+    <form action="/signup" method="POST">
+      <input type="hidden" name="csrfmiddlewaretoken"
+             value="{esc(csrf_token)}">
+      <input type="hidden" name="form_type" value="create_account">
+      <input type="hidden" name="email" value="{esc(email)}">
+      <label><input type="radio" name="title" id="id_gender1" value="Mr">
+        Mr.</label>
+      <label><input type="radio" name="title" id="id_gender2" value="Mrs">
+        Mrs.</label>
+      <input type="text" id="name" name="name" data-qa="name"
+             value="{esc(name)}" required>
+      <input type="email" id="email" data-qa="email"
+             value="{esc(email)}" disabled>
+      <input type="password" id="password" name="password"
+             data-qa="password" required>
+      <select id="days" name="days" data-qa="days">
+        <option value="">Day</option>{days}</select>
+      <select id="months" name="months" data-qa="months">
+        <option value="">Month</option>{months}</select>
+      <select id="years" name="years" data-qa="years">
+        <option value="">Year</option>{years}</select>
+      <label><input type="checkbox" name="newsletter" id="newsletter"
+             value="1"> Sign up for our newsletter!</label>
+      <label><input type="checkbox" name="optin" id="optin" value="1">
+        Receive special offers from our partners!</label>
+      <h2 class="title text-center"><b>Address Information</b></h2>
+      <input type="text" id="first_name" name="first_name"
+             data-qa="first_name" required>
+      <input type="text" id="last_name" name="last_name"
+             data-qa="last_name" required>
+      <input type="text" id="company" name="company" data-qa="company">
+      <input type="text" id="address1" name="address1"
+             data-qa="address" required>
+      <input type="text" id="address2" name="address2"
+             data-qa="address2">
+      <select id="country" name="country" data-qa="country">
+        {countries}</select>
+      <input type="text" id="state" name="state" data-qa="state" required>
+      <input type="text" id="city" name="city" data-qa="city" required>
+      <input type="text" id="zipcode" name="zipcode" data-qa="zipcode"
+             required>
+      <input type="text" id="mobile_number" name="mobile_number"
+             data-qa="mobile_number" required>
+      <button type="submit" data-qa="create-account" class="btn">
+        Create Account</button>
+    </form>
+  </div>
+</section>"""
+    return layout("Automation Exercise - Signup", content)
+
+
+def message_page(data_qa: str, title: str, text: str, user=None,
+                 extra: str = "") -> str:
+    """
+    Confirmation page with a title and a Continue button, used for
+    account created, account deleted and order placed.
+    """
+    content = f"""
+<section id="form">
+  <h2 class="title text-center" data-qa="{data_qa}"><b>{esc(title)}</b></h2>
+  <p>{esc(text)}</p>
+  {extra}
+  <a href="/" class="btn btn-primary" data-qa="continue-button">Continue</a>
+</section>"""
+    return layout(f"Automation Exercise - {title}", content, user)
+
+
+def product_detail_page(product, user=None) -> str:
+    """
+    Product details with quantity, add to cart and the review form.
+    """
+    main, sub = product["category"]
+    content = f"""
+<section>
+  <div class="product-details">
+    <div class="product-information">
+      <h2>{esc(product['name'])}</h2>
+      <p>Category: {esc(main)} &gt; {esc(sub)}</p>
+      <span>
+        <span>{price(product['price'])}</span>
+        <label>Quantity:</label>
+        <input type="number" id="quantity" name="quantity" value="1">
+        <button type="button" class="btn btn-default cart"
+                data-product-id="{product['id']}">Add to cart</button>
+      </span>
+      <p><b>Availability:</b> In Stock</p>
+      <p><b>Condition:</b> New</p>
+      <p><b>Brand:</b> {esc(product['brand'])}</p>
+    </div>
+  </div>
+  <div class="category-tab shop-details-tab">
+    <ul class="nav nav-tabs">
+      <li class="active"><a href="#reviews">Write Your Review</a></li>
+    </ul>
+    <form id="review-form">
+      <input type="text" id="name" placeholder="Your Name">
+      <input type="email" id="email" placeholder="Email Address">
+      <textarea id="review" name="review"></textarea>
+      <button type="submit" id="button-review" class="btn btn-default">
+        Submit</button>
+      <div id="review-section" class="hide">
+        <div class="alert-success alert">
+          <span>Thank you for your review.</span></div>
+      </div>
+    </form>
+  </div>
+</section>"""
+    return layout(
+        "Automation Exercise - Product Details", content, user
+    )
+
+
+def cart_rows(items) -> str:
+    """
+    Rows of the cart and checkout tables.
+    """
+    rows = []
+    for product, quantity in items:
+        main, sub = product["category"]
+        rows.append(f"""
+<tr id="product-{product['id']}">
+  <td class="cart_product"></td>
+  <td class="cart_description">
+    <h4><a href="/product_details/{product['id']}">{esc(product['name'])}</a>
+    </h4>
+    <p>{esc(main)} &gt; {esc(sub)}</p>
+  </td>
+  <td class="cart_price"><p>{price(product['price'])}</p></td>
+  <td class="cart_quantity"><button class="disabled">{quantity}</button></td>
+  <td class="cart_total">
+    <p class="cart_total_price">{price(product['price'] * quantity)}</p>
+  </td>
+  <td class="cart_delete">
+    <a class="cart_quantity_delete" data-product-id="{product['id']}">
+      <i class="fa fa-times"></i></a>
+  </td>
+</tr>""")
+    return "".join(rows)
+
+
+def cart_page(items, user=None) -> str:
+    """
+    Cart table with checkout button and the Register / Login modal.
+    """
+    empty = "" if items else (
+        '<span id="empty_cart"><p class="text-center"><b>Cart is empty!</b>'
+        "</p></span>"
+    )
+    content = f"""
+<section id="cart_items">
+  <div class="table-responsive cart_info">
+    <table class="table table-condensed" id="cart_info_table">
+      <thead><tr class="cart_menu">
+        <td class="image">Item</td><td class="description">Description</td>
+        <td class="price">Price</td><td class="quantity">Quantity</td>
+        <td class="total">Total</td><td></td>
+      </tr></thead>
+      <tbody>{cart_rows(items)}</tbody>
+    </table>
+    {empty}
+  </div>
+  <a href="/checkout" class="btn btn-default check_out"
+     data-logged-in="{'true' if user else 'false'}">Proceed To Checkout</a>
+</section>
+<div class="modal" id="checkoutModal">
+  <h4 class="modal-title">Checkout</h4>
+  <p>Register / Login account to proceed on checkout.</p>
+  <p><a href="/login"><u>Register / Login</u></a></p>
+  <button class="btn btn-success close-modal btn-block">
+    Continue On Cart</button>
+</div>"""
+    return layout("Automation Exercise - Checkout", content, user)
+
+
+def address_block(element_id: str, heading: str, address: dict) -> str:
+    """
+    Delivery or billing address of the checkout page.
+    """
+    return f"""
+<ul class="address item box" id="{element_id}">
+  <li class="address_title"><h3 class="page-subheading">{heading}</h3></li>
+  <li class="address_firstname address_lastname">
+    {esc(address['title'])}. {esc(address['first_name'])}
+    {esc(address['last_name'])}
+  </li>
+  <li class="address_address1 address_address2">{esc(address['company'])}</li>
+  <li class="address_address1 address_address2">{esc(address['address1'])}</li>
+  <li class="address_address1 address_address2">{esc(address['address2'])}</li>
+  <li class="address_city address_state_name address_postcode">
+    {esc(address['city'])} {esc(address['state'])} {esc(address['zipcode'])}
+  </li>
+  <li class="address_country_name">{esc(address['country'])}</li>
+  <li class="address_phone">{esc(address['mobile_number'])}</li>
+</ul>"""
+
+
+def checkout_page(items, total: int, address: dict, user) -> str:
+    """
+    Addresses, order review and comment.
+    """
+    content = f"""
+<section id="cart_items">
+  <div class="row">
+    {address_block("address_delivery", "Your delivery address", address)}
+    {address_block("address_invoice", "Your billing address", address)}
+  </div>
+  <h2 class="heading">Review Your Order</h2>
+  <table class="table table-condensed">
+    <tbody>
+      {cart_rows(items)}
+      <tr><td colspan="4"><h4><b>Total Amount</b></h4></td>
+        <td><p class="cart_total_price">{price(total)}</p></td></tr>
+    </tbody>
+  </table>
+  <div id="ordermsg">
+    <label>If you would like to add a comment about your order,
+      please write it in the field below.</label>
+    <textarea name="message" class="form-control" rows="6"></textarea>
+  </div>
+  <a href="/payment" class="btn btn-default check_out">Place Order</a>
+</section>"""
+    return layout("Automation Exercise - Checkout", content, user)
+
+
+def payment_page(user, csrf_token="") -> str:
+    """
+    Payment form.
+    """
+    content = f"""
+<section id="cart_items">
+  <h2 class="heading">Payment</h2>
+  <form id="payment-form" action="/payment" method="POST">
+    <input type="hidden" name="csrfmiddlewaretoken"
+           value="{esc(csrf_token)}">
+    <input type="text" name="name_on_card" data-qa="name-on-card" required>
+    <input type="text" name="card_number" data-qa="card-number" required>
+    <input type="text" name="cvc" data-qa="cvc" required>
+    <input type="text" name="expiry_month" data-qa="expiry-month" required>
+    <input type="text" name="expiry_year" data-qa="expiry-year" required>
+    <button type="submit" data-qa="pay-button"
+            class="form-control btn btn-primary submit-button">
+      Pay and Confirm Order</button>
+  </form>
+</section>"""
+    return layout("Automation Exercise - Payment", content, user)
+
+
+def payment_done_page(total: int, user) -> str:
+    """
+    Order placed confirmation with the invoice link.
+    """
+    return message_page(
+        "order-placed",
+        "ORDER PLACED!",
+        "Congratulations! Your order has been confirmed!",
+        user,
+        extra=(
+            f'<a href="/download_invoice/{total}" '
+            'class="btn btn-default check_out">Download Invoice</a>'
+        ),
+    )
+
+
+def contact_us_page(user=None, submitted=False) -> str:
+    """
+    Contact us form.
+    """
+    success = (
+        '<div class="status alert alert-success">'
+        "Success! Your details have been submitted successfully.</div>"
+        '<a href="/" class="btn btn-success">Home</a>'
+        if submitted else ""
+    )
+    content = f"""
+<section id="contact-page">
+  <div class="contact-form">
+    <h2 class="title text-center">Get In Touch</h2>
+    {success}
+    <form id="contact-us-form" action="/contact_us" method="POST"
+          enctype="multipart/form-data">
+      <input type="text" name="name" data-qa="name" placeholder="Name">
+      <input type="email" name="email" data-qa="email" placeholder="Email">
+      <input type="text" name="subject" data-qa="subject"
+             placeholder="Subject">
+      <textarea name="message" data-qa="message" rows="8"></textarea>
+      <input type="file" name="upload_file">
+      <input type="submit" name="submit" data-qa="submit-button"
+             class="btn btn-primary" value="Submit">
+    </form>
+  </div>
+</section>"""
+    return layout("Automation Exercise - Contact Us", content, user)
+
+
+def test_cases_page(user=None) -> str:
+    """
+    Test cases list.
+    """
+    content = """
+<section>
+  <h2 class="title text-center"><b>Test Cases</b></h2>
+  <p>Below is the list of test Cases for you to practice the Automation.</p>
+</section>"""
+    return layout(
+        "Automation Practice Website for UI Testing - Test Cases",
+        content,
+        user
+    )
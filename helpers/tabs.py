@@ -0,0 +1,139 @@
+"""
+Helper module to run independent read-only checks in several tabs.
+
+`MultiTab` opens one page per check in the test's browser context, so
+the tabs share its cookies, request blocking and HAR routes. It starts
+every navigation before waiting for any of them, then waits for the
+`Ready` condition of each page and runs the checks round-robin. A check
+gets the `PageObjects` of its tab and may be a generator: every `yield`
+hands over to the next tab, e.g. after a click
+that navigates, so the tabs wait for the site at the same time:
+
+    def women_dresses(pages):
+        pages.products.click_subcategory("Women", "Dress")
+        yield
+        pages.products.verify_category_page_header("Women - Dress")
+
+    tabs.add("women", "/products", women_dresses)
+    tabs.run()
+
+Failures of all tabs are collected and raised together, with a summary
+attached to the Allure report.
+"""
+import inspect
+import time
+from collections import deque
+import allure
+from pages.base_page import BasePage, ready_for
+from pages.page_objects import PageObjects
+
+
+class Tab:
+    """One check and the page it runs in."""
+
+    __slots__ = ("name", "path", "check", "page", "error", "seconds")
+
+    def __init__(self, name: str, path: str, check):
+        self.name = name
+        self.path = path
+        self.check = check
+        self.page = None
+        self.error = None
+        self.seconds = 0.0
+
+    def steps(self, base_url: str):
+        """
+        Yield between the steps of the check: after the page is ready
+        and wherever the check yields. Pages without a `Ready` condition
+        wait for the load event.
+        """
+        ready = ready_for(self.path)
+        if ready is None:
+            self.page.wait_for_load_state("load")
+        else:
+            BasePage(self.page, base_url).wait_until_ready(ready)
+        yield
+        result = self.check(PageObjects(self.page, base_url))
+        if inspect.isgenerator(result):
+            yield from result
+
+
+class MultiTab:
+    """
+    Runs independent checks concurrently in tabs of one context.
+    """
+
+    def __init__(self, context, base_url: str, timeout: int = 30000):
+        self.context = context
+        self.base_url = base_url
+        self.timeout = timeout
+        self.tabs = []
+
+    def add(self, name: str, path: str, check) -> None:
+        """
+        Add a check to run on its own tab opened at `path`.
+        """
+        self.tabs.append(Tab(name, path, check))
+
+    def run(self) -> None:
+        """
+        Open the tabs, run every check and raise an AssertionError
+        listing the failures of all tabs.
+        """
+        started = time.perf_counter()
+        for tab in self.tabs:
+            tab.page = self.context.new_page()
+            tab.page.goto(
+                self.base_url + tab.path, wait_until="commit",
+                timeout=self.timeout
+            )
+
+        running = deque(
+            (tab, tab.steps(self.base_url)) for tab in self.tabs
+        )
+        while running:
+            tab, steps = running.popleft()
+            step_started = time.perf_counter()
+            try:
+                next(steps)
+            except StopIteration:
+                continue
+            except Exception as error:
+                tab.error = error
+                continue
+            finally:
+                tab.seconds += time.perf_counter() - step_started
+            running.append((tab, steps))
+
+        self.close()
+        self._report(time.perf_counter() - started)
+        failures = [tab for tab in self.tabs if tab.error is not None]
+        if failures:
+            raise AssertionError(
+                f"{len(failures)} of {len(self.tabs)} tabs failed:\n"
+                + "\n".join(
+                    f"[{tab.name}] {type(tab.error).__name__}: {tab.error}"
+                    for tab in failures
+                )
+            )
+
+    def close(self) -> None:
+        """
+        Close the tabs that are still open.
+        """
+        for tab in self.tabs:
+            if tab.page is not None and not tab.page.is_closed():
+                tab.page.close()
+
+    def _report(self, seconds: float) -> None:
+        lines = [f"{len(self.tabs)} tabs in {seconds:.2f}s"]
+        lines.extend(
+            f"{tab.name} ({tab.path}): "
+            f"{'failed' if tab.error else 'passed'}, "
+            f"{tab.seconds:.2f}s in checks"
+            for tab in self.tabs
+        )
+        allure.attach(
+            "\n".join(lines), name="Tabs",
+            attachment_type=allure.attachment_type.TEXT
+        )
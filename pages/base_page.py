@@ -3,79 +3,654 @@ BasePage module: provides common actions for Playwright page objects.
 All methods expect Locator objects for reliable interactions.
 """
 
-import allure
+import re
+import time
+from urllib.parse import urlsplit
 from playwright.sync_api import Locator, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from helpers.reporting import step
+
+NON_CSS_SELECTOR_TOKENS = (
+    ">>", "internal:", ":has-text(", ":text", ":visible", ":nth-match(",
+)
+
+SELECTOR_ENGINE_PREFIX = re.compile(r"^(?:[a-z_-]+=|//|\.\.|[\"'])")
+
+FIELD_STATE_SCRIPT = """
+element => ({
+    value: 'value' in element ? element.value : element.textContent,
+    checked: ['checkbox', 'radio'].includes(element.type)
+        ? element.checked : null,
+    selected: element.tagName === 'SELECT'
+        ? Array.from(element.selectedOptions, option => option.text.trim())
+        : null,
+})
+"""
+
+FORM_SNAPSHOT_SCRIPT = f"""
+selectors => {{
+    const state = {FIELD_STATE_SCRIPT};
+    const snapshot = {{}};
+    for (const [name, selector] of Object.entries(selectors)) {{
+        const element = document.querySelector(selector);
+        snapshot[name] = element ? state(element) : null;
+    }}
+    return snapshot;
+}}
+"""
+
+BULK_FILL_SCRIPT = """
+fields => {
+    const elements = fields.map(([selector]) =>
+        document.querySelector(selector));
+    const visible = element => element !== null
+        && element.getClientRects().length > 0
+        && getComputedStyle(element).visibility !== 'hidden';
+    if (!elements.every(visible)) {
+        return false;
+    }
+    fields.forEach(([selector, value], index) => {
+        const element = elements[index];
+        if (element.disabled || element.readOnly) {
+            throw new Error(`Field '${selector}' is not editable`);
+        }
+        if (typeof value === 'boolean') {
+            if (element.checked !== value) {
+                element.click();
+            }
+            return;
+        }
+        if (element.tagName === 'SELECT') {
+            const option = Array.from(element.options).find(
+                option => option.value === value || option.label === value);
+            if (!option) {
+                throw new Error(
+                    `Option '${value}' not found in '${selector}'`);
+            }
+            element.value = option.value;
+        } else {
+            const prototype = element.tagName === 'TEXTAREA'
+                ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(prototype, 'value')
+                .set.call(element, value);
+        }
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+    });
+    return true;
+}
+"""
+
+COLLECTION_STATE_SCRIPT = """
+(elements, attributes) => elements.map(element => ({
+    visible: element.getClientRects().length > 0
+        && getComputedStyle(element).visibility !== 'hidden',
+    text: (element.textContent || '').replace(/\\s+/g, ' ').trim(),
+    attributes: Object.fromEntries(
+        attributes.map(name => [name, element.getAttribute(name)])),
+}))
+"""
+
+COLLECTION_MATCH_SCRIPT = f"""
+(elements, names, expected) => {{
+    const states = ({COLLECTION_STATE_SCRIPT})(elements, names);
+    const at = (value, index) => Array.isArray(value) ? value[index] : value;
+    let count = expected.count;
+    if (Array.isArray(expected.texts) && count === null) {{
+        count = expected.texts.length;
+    }}
+    if (count === null ? !states.length : states.length !== count) {{
+        return false;
+    }}
+    return states.every((state, index) =>
+        (expected.visible === null || state.visible === expected.visible)
+        && (expected.texts === null || (expected.contains
+            ? state.text.includes(at(expected.texts, index))
+            : state.text === at(expected.texts, index)))
+        && Object.entries(expected.attributes).every(([name, value]) =>
+            state.attributes[name] === at(value, index)));
+}}
+"""
+
+# Polls in the browser until the elements of a CSS selector chain match.
+COLLECTION_WAIT_SCRIPT = f"""
+([chain, names, expected]) => {{
+    let elements = [document];
+    for (const selector of chain) {{
+        const found = new Set();
+        for (const root of elements) {{
+            root.querySelectorAll(selector).forEach(el => found.add(el));
+        }}
+        elements = [...found].sort((a, b) =>
+            a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING
+                ? -1 : 1);
+    }}
+    return ({COLLECTION_MATCH_SCRIPT})(elements, names, expected);
+}}
+"""
+
+# Polls in the browser on the elements a locator matched when called.
+COLLECTION_WAIT_ELEMENTS_SCRIPT = f"""
+(elements, [names, expected, timeout]) => new Promise(resolve => {{
+    const deadline = Date.now() + timeout;
+    const poll = () => {{
+        if (({COLLECTION_MATCH_SCRIPT})(elements, names, expected)) {{
+            resolve(true);
+        }} else if (Date.now() >= deadline) {{
+            resolve(false);
+        }} else {{
+            requestAnimationFrame(poll);
+        }}
+    }};
+    poll();
+}})
+"""
+
+
+class Option(str):
+    """A fill_form value to select in a dropdown, by value or label."""
+
+
+class Ready:
+    """
+    Readiness condition of a page, declared by its page object together
+    with the path pattern of the page:
+
+        class ProductsPage(BasePage):
+            path = "/products"
+            ready = Ready("div.features_items")
+
+    `selector` waits for a key element to be visible, `response` for a
+    response matching a URL glob, regex or predicate during the
+    navigation, and `state` for a load state of the page.
+    """
+
+    __slots__ = ("selector", "response", "state")
+
+    def __init__(self, selector: str = None, *, response=None,
+                 state: str = None) -> None:
+        self.selector = selector
+        self.response = response
+        self.state = state
+
+
+def register_ready(page_class) -> None:
+    """
+    Record the readiness condition a page object class declares in the
+    `ready_by_path` registry of its page layer.
+    """
+    if page_class.path is not None and "ready" in page_class.__dict__:
+        page_class.ready_by_path[page_class.path] = page_class.ready
+
+
+def ready_for(path: str, page_class=None):
+    """
+    Return the readiness condition of the page at a path or URL, or None.
+    Looks up the registry of the page layer of `page_class`, the sync
+    `BasePage` by default.
+    """
+    registry = (page_class or BasePage).ready_by_path
+    path = urlsplit(path).path or "/"
+    for pattern, ready in registry.items():
+        if re.fullmatch(pattern, path):
+            return ready
+    return None
+
+
+def css_selector(locator, page):
+    """
+    Return the selector of a locator if it is a plain CSS selector of
+    the page's main frame, otherwise None.
+    """
+    impl = getattr(locator, "_impl_obj", None)
+    selector = getattr(impl, "_selector", "")
+    if not selector or impl._frame is not page.main_frame._impl_obj:
+        return None
+    if (SELECTOR_ENGINE_PREFIX.match(selector)
+            or any(token in selector for token in NON_CSS_SELECTOR_TOKENS)):
+        return None
+    return selector
+
+
+def css_chain(locator, page):
+    """
+    Return the `>>` parts of a locator built from plain CSS selectors
+    of the page's main frame, e.g. `brands_section.locator("li a")`,
+    otherwise None.
+    """
+    impl = getattr(locator, "_impl_obj", None)
+    selector = getattr(impl, "_selector", "")
+    if not selector or impl._frame is not page.main_frame._impl_obj:
+        return None
+    parts = [part.strip() for part in selector.split(" >> ")]
+    if any(
+        not part or SELECTOR_ENGINE_PREFIX.match(part)
+        or any(token in part for token in NON_CSS_SELECTOR_TOKENS)
+        for part in parts
+    ):
+        return None
+    return parts
+
+
+def collection_expectations(count, visible, texts, contains,
+                            attributes) -> dict:
+    """
+    Return the expectations of a collection check as the argument of
+    COLLECTION_MATCH_SCRIPT.
+    """
+    return {
+        "count": count,
+        "visible": visible,
+        "texts": list(texts) if isinstance(texts, tuple) else texts,
+        "contains": contains,
+        "attributes": {
+            name: list(value) if isinstance(value, tuple) else value
+            for name, value in (attributes or {}).items()
+        },
+    }
+
+
+def collection_size(expected: dict):
+    """
+    Return the number of elements the expectations of a collection
+    check require, or None when any non-zero number will do.
+    """
+    if expected["count"] is not None:
+        return expected["count"]
+    if isinstance(expected["texts"], list):
+        return len(expected["texts"])
+    return None
+
+
+def collection_mismatches(states: list, count: int = None,
+                          visible: bool = None, texts=None,
+                          contains: bool = False,
+                          attributes: dict = None) -> list[str]:
+    """
+    Compare the element states returned by COLLECTION_STATE_SCRIPT with
+    the expectations and return one message per mismatch.
+
+    `texts` and the values of `attributes` are either one value expected
+    of every element or a list with one value per index.
+    """
+    if isinstance(texts, (list, tuple)) and count is None:
+        count = len(texts)
+    if count is None and not states:
+        return ["No elements found"]
+    if count is not None and len(states) != count:
+        return [f"Expected {count} elements but found {len(states)}"]
+
+    def expected_at(expected, index):
+        if isinstance(expected, (list, tuple)):
+            return expected[index]
+        return expected
+
+    mismatches = []
+    for index, state in enumerate(states):
+        if visible is not None and state["visible"] != visible:
+            mismatches.append(
+                f"Element {index}: expected "
+                f"{'visible' if visible else 'hidden'}"
+            )
+        if texts is not None:
+            text = expected_at(texts, index)
+            matches = (text in state["text"] if contains
+                       else state["text"] == text)
+            if not matches:
+                mismatches.append(
+                    f"Element {index}: expected text "
+                    f"{'containing ' if contains else ''}'{text}' "
+                    f"but got '{state['text']}'"
+                )
+        for name, expected in (attributes or {}).items():
+            value = expected_at(expected, index)
+            actual = state["attributes"][name]
+            if actual != value:
+                mismatches.append(
+                    f"Element {index}: expected {name}='{value}' "
+                    f"but got '{actual}'"
+                )
+    return mismatches
+
+
+class Element:
+    """
+    Declares a locator of a page object class. The locator is built on
+    first access and memoized per page object instance:
+
+        class CartPage(BasePage):
+            product_rows = Element("table#cart_info_table tbody tr")
+            first_row = Element(within="product_rows", nth=0)
+
+    `within` names another Element to scope the selector to, `nth` picks
+    one match, and `role` builds the locator with `get_by_role` (`name`
+    and `exact` are passed through).
+    """
+
+    __slots__ = (
+        "selector", "has_text", "within", "nth", "role", "role_options",
+        "name",
+    )
+
+    def __init__(self, selector: str = None, *, has_text: str = None,
+                 within: str = None, nth: int = None, role: str = None,
+                 **role_options) -> None:
+        self.selector = selector
+        self.has_text = has_text
+        self.within = within
+        self.nth = nth
+        self.role = role
+        self.role_options = role_options
+        self.name = None
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return instance._locators[self.name]
+        except KeyError:
+            locator = instance._locators[self.name] = self.build(instance)
+            return locator
+
+    def build(self, instance):
+        """Create the locator for a page object instance."""
+        scope = (
+            instance.page if self.within is None
+            else getattr(instance, self.within)
+        )
+        if self.role is not None:
+            locator = scope.get_by_role(self.role, **self.role_options)
+        elif self.selector is not None:
+            locator = scope.locator(self.selector, has_text=self.has_text)
+        else:
+            locator = scope
+        if self.nth is not None:
+            locator = locator.nth(self.nth)
+        return locator
 
 
 class BasePage:
-    """Base class for page objects with common actions."""
+    """
+    Base class for page objects with common actions.
+
+    By default every action waits for its element to be visible first.
+    With `auto_wait` set (--auto-wait) actions rely on the actionability
+    checks of the action itself instead, which saves one driver round
+    trip per action. Timeouts stay the same; reads wait for the element
+    to be attached rather than visible.
+
+    Subclasses declare their locators as `Element` class attributes and
+    an empty `__slots__`, so constructing a page object only stores the
+    page; locators are created when a test first uses them. They also
+    declare the `path` pattern of their page and a `Ready` condition:
+    `goto` waits for `wait_until` (--goto-wait-until) and then for the
+    condition of the page it navigates to, not for every iframe and ad.
+    """
+
+    __slots__ = ("page", "base_url", "_locators")
+
+    path = None
+    ready = None
+    # Readiness conditions by path pattern, filled by the subclasses.
+    ready_by_path = {}
+    wait_until = "domcontentloaded"
+    auto_wait = False
+    strict_fill = False
+    click_timeout = 20000
 
     def __init__(self, page: Page, base_url: str = "") -> None:
         """Initialize with Playwright page and optional base URL."""
         self.page = page
         self.base_url = base_url
+        self._locators = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        register_ready(cls)
+
+    def locator(self, selector: str, has_text: str = None) -> Locator:
+        """
+        Return a page locator for a selector built at run time, memoized
+        per page object like the `Element` declarations.
+        """
+        key = (selector, has_text)
+        try:
+            return self._locators[key]
+        except KeyError:
+            locator = self._locators[key] = self.page.locator(
+                selector, has_text=has_text
+            )
+            return locator
 
-    @allure.step("Go to page: {path}")
+    @step("Go to page: {path}", primitive=True)
     def goto(self, path: str = "/", timeout: int = 30000) -> None:
-        """Navigate to a URL path."""
-        self.page.goto(
-         self.base_url + path,
-         wait_until="load",
-         timeout=timeout
-        )
+        """Navigate to a URL path and wait until the page is ready."""
+        ready = ready_for(path, type(self))
+        if ready is not None and ready.response is not None:
+            with self.page.expect_response(ready.response, timeout=timeout):
+                self.page.goto(
+                    self.base_url + path,
+                    wait_until=self.wait_until,
+                    timeout=timeout
+                )
+        else:
+            self.page.goto(
+                self.base_url + path,
+                wait_until=self.wait_until,
+                timeout=timeout
+            )
+        if ready is not None:
+            self.wait_until_ready(ready, timeout)
+
+    def wait_until_ready(self, ready: Ready, timeout: int = 30000) -> None:
+        """Wait for the load state and key element of a condition."""
+        if ready.state is not None:
+            self.page.wait_for_load_state(ready.state, timeout=timeout)
+        if ready.selector is not None:
+            self.locator(ready.selector).wait_for(
+                state="visible", timeout=timeout
+            )
 
-    @allure.step("Click element")
+    @step("Click element", primitive=True)
     def click(self, locator: Locator) -> None:
         """Wait for element and click."""
-        locator.wait_for(state="visible", timeout=20000)
+        if self.auto_wait:
+            locator.click(timeout=self.click_timeout)
+            return
+        locator.wait_for(state="visible", timeout=self.click_timeout)
         locator.click()
 
-    @allure.step("Fill element with text: {text}")
+    @step("Fill element with text: {text}", primitive=True)
     def fill(self, locator: Locator, text: str) -> None:
         """Wait for element and fill text."""
-        locator.wait_for(state="visible")
+        if not self.auto_wait:
+            locator.wait_for(state="visible")
         locator.fill(text)
 
-    @allure.step("Get text from element")
+    @step("Get text from element", primitive=True)
     def get_text(self, locator: Locator) -> str:
         """Return trimmed inner text of element."""
-        locator.wait_for(state="visible")
+        if not self.auto_wait:
+            locator.wait_for(state="visible")
         return locator.inner_text().strip()
 
-    @allure.step("Get value from input")
+    @step("Get value from input", primitive=True)
     def get_value(self, locator: Locator) -> str:
         """Return value of input element."""
-        locator.wait_for(state="visible")
+        if not self.auto_wait:
+            locator.wait_for(state="visible")
         return locator.input_value()
 
-    @allure.step("Check visibility of element")
+    @step("Check visibility of element", primitive=True)
     def is_visible(self, locator: Locator) -> bool:
         """Return True if element is visible."""
         locator.wait_for(state="visible")
+        if self.auto_wait:
+            return True
         return locator.is_visible()
 
-    @allure.step("Check checkbox")
+    @step("Check checkbox", primitive=True)
     def check(self, locator: Locator) -> None:
         """Check checkbox if not checked."""
+        if self.auto_wait:
+            locator.check()
+            return
         locator.wait_for(state="visible")
         if not locator.is_checked():
             locator.check()
 
-    @allure.step("Uncheck checkbox")
+    @step("Uncheck checkbox", primitive=True)
     def uncheck(self, locator: Locator) -> None:
         """Uncheck checkbox if checked."""
+        if self.auto_wait:
+            locator.uncheck()
+            return
         locator.wait_for(state="visible")
         if locator.is_checked():
             locator.uncheck()
 
-    @allure.step("Verify if checkbox is checked")
+    @step("Verify if checkbox is checked", primitive=True)
     def is_checked(self, locator: Locator) -> bool:
         """Return True if checkbox is checked."""
-        locator.wait_for(state="visible")
+        if not self.auto_wait:
+            locator.wait_for(state="visible")
         return locator.is_checked()
 
-    @allure.step("Select option '{value}' from dropdown")
+    @step("Select option '{value}' from dropdown", primitive=True)
     def select_option(self, locator: Locator, value: str) -> None:
         """Select a value from dropdown."""
-        locator.wait_for(state="visible")
+        if not self.auto_wait:
+            locator.wait_for(state="visible")
         locator.select_option(value)
+
+    @step("Read form snapshot", primitive=True)
+    def snapshot_form(self, fields: dict) -> dict:
+        """
+        Read the value, checked state and selected option texts of named
+        locators in one round trip. Returns
+        {name: {"value": ..., "checked": ..., "selected": [...]}}.
+        Locators without a plain CSS selector, and elements not in the
+        page yet, are read one by one with the usual wait.
+        """
+        selectors = {}
+        for name, locator in fields.items():
+            selector = css_selector(locator, self.page)
+            if selector:
+                selectors[name] = selector
+        snapshot = (
+            self.page.evaluate(FORM_SNAPSHOT_SCRIPT, selectors)
+            if selectors else {}
+        )
+        return {
+            name: snapshot.get(name) or self._read_field(locator)
+            for name, locator in fields.items()
+        }
+
+    def _read_field(self, locator: Locator) -> dict:
+        """Return the snapshot state of a single element."""
+        if not self.auto_wait:
+            locator.wait_for(state="visible")
+        return locator.evaluate(FIELD_STATE_SCRIPT)
+
+    @step("Fill form", primitive=True)
+    def fill_form(self, values: dict, strict: bool = None,
+                  timeout: float = None) -> None:
+        """
+        Fill several fields at once. `values` maps locators to a text,
+        an `Option` for dropdowns, or a bool for checkboxes.
+
+        The fields are filled in one browser-side batch as soon as all of
+        them are visible, firing input and change events. With `strict`
+        (default: --strict-fill), or when a locator is not plain CSS,
+        every field goes through its Playwright action instead.
+        `timeout` bounds the wait for the fields of the batch.
+        """
+        if strict is None:
+            strict = self.strict_fill
+        selectors = [css_selector(locator, self.page) for locator in values]
+        if strict or not all(selectors):
+            for locator, value in values.items():
+                self._fill_field(locator, value)
+            return
+        self.page.wait_for_function(
+            BULK_FILL_SCRIPT,
+            arg=[list(field) for field in zip(selectors, values.values())],
+            timeout=timeout
+        )
+
+    @step("Verify collection", primitive=True)
+    def verify_collection(self, locator: Locator, count: int = None,
+                          visible: bool = None, texts=None,
+                          contains: bool = False, attributes: dict = None,
+                          timeout: float = 30000) -> list[dict]:
+        """
+        Verify every element matched by a locator at once.
+        Checks the number of elements, their visibility, their
+        whitespace-normalized text (exact, or substring with `contains`)
+        and attribute values; see `collection_mismatches`.
+
+        The check is polled inside the browser until it passes or
+        `timeout` ms elapse, so it takes two round trips: the wait and
+        the read of the element states. A locator that is not a chain of
+        CSS selectors first waits for its first element, then is polled
+        on the elements it matches at that point. Fails listing every
+        mismatching index. Returns the element states.
+        """
+        names = list(attributes or {})
+        expected = collection_expectations(
+            count, visible, texts, contains, attributes
+        )
+        chain = css_chain(locator, self.page)
+        if chain is not None:
+            try:
+                self.page.wait_for_function(
+                    COLLECTION_WAIT_SCRIPT, arg=[chain, names, expected],
+                    timeout=timeout
+                )
+            except PlaywrightTimeoutError:
+                pass
+        else:
+            remaining = self._wait_for_first(locator, expected, timeout)
+            if remaining:
+                locator.evaluate_all(
+                    COLLECTION_WAIT_ELEMENTS_SCRIPT,
+                    [names, expected, remaining]
+                )
+        states = locator.evaluate_all(COLLECTION_STATE_SCRIPT, names)
+        mismatches = collection_mismatches(
+            states, count, visible, texts, contains, attributes
+        )
+        if mismatches:
+            raise AssertionError("\n".join(mismatches))
+        return states
+
+    @staticmethod
+    def _wait_for_first(locator: Locator, expected: dict,
+                        timeout: float) -> float:
+        """
+        Wait for the first element of a collection expected not to be
+        empty. Returns the ms left of `timeout`, 0 if it ran out.
+        """
+        if collection_size(expected) == 0:
+            return timeout
+        started = time.monotonic()
+        try:
+            locator.first.wait_for(state="attached", timeout=timeout)
+        except PlaywrightTimeoutError:
+            return 0
+        return max(timeout - (time.monotonic() - started) * 1000, 1)
+
+    def _fill_field(self, locator: Locator, value) -> None:
+        """Fill one fill_form field with its Playwright action."""
+        if isinstance(value, bool):
+            if value:
+                self.check(locator)
+            else:
+                self.uncheck(locator)
+        elif isinstance(value, Option):
+            self.select_option(locator, value)
+        else:
+            self.fill(locator, value)
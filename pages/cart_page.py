@@ -1,26 +1,27 @@
 """
     Page object for the Cart Page.
 """
-import allure
-from playwright.sync_api import Page, expect
-from pages.base_page import BasePage
+from playwright.sync_api import expect
+from helpers.reporting import step
+from pages.base_page import BasePage, Element, Ready
 
 
 class CartPage(BasePage):
     """Cart class representing page objects with actions."""
-    def __init__(self, page: Page, base_url: str):
-        super().__init__(page, base_url)
-        self.page = page
-        self.product_rows = page.locator("table#cart_info_table tbody tr")
-        self.quantity_button = page.locator("td.cart_quantity button")
-        self.proceed_to_checkout_button = page.locator(
-            'a.btn.btn-default.check_out'
-            )
-        self.register_login_link = page.locator(
-            'a[href="/login"]', has_text="Register / Login"
-            )
 
-    @allure.step("Verify product in cart")
+    __slots__ = ()
+
+    path = "/view_cart"
+    ready = Ready("#cart_info_table")
+
+    product_rows = Element("table#cart_info_table tbody tr")
+    quantity_button = Element("td.cart_quantity button")
+    proceed_to_checkout_button = Element('a.btn.btn-default.check_out')
+    register_login_link = Element(
+        'a[href="/login"]', has_text="Register / Login"
+    )
+
+    @step("Verify product in cart")
     def verify_product(
        self,
        product_id: str,
@@ -31,23 +32,23 @@ class CartPage(BasePage):
         """
         Verify product details in cart
         """
-        row = self.page.locator(f"tr#{product_id}")
-        price = row.locator(".cart_price p")
-        qty = row.locator(".cart_quantity button")
-        total = row.locator(".cart_total p")
+        row = f"tr#{product_id}"
+        price = self.locator(f"{row} .cart_price p")
+        qty = self.locator(f"{row} .cart_quantity button")
+        total = self.locator(f"{row} .cart_total p")
 
         expect(price).to_have_text(expected_price)
         expect(qty).to_have_text(expected_qty)
         expect(total).to_have_text(expected_total)
 
-    @allure.step("Get number of products in cart")
+    @step("Get number of products in cart")
     def get_product_count(self):
         """
         Get number of products in cart
         """
         return self.product_rows.count()
 
-    @allure.step("Verify quantity of product is {expected_quantity}")
+    @step("Verify quantity of product is {expected_quantity}")
     def verify_quantity(self, expected_quantity: int):
         """
         Verify product quantity
@@ -59,7 +60,7 @@ class CartPage(BasePage):
          f"but got {actual_quantity}"
         )
 
-    @allure.step("Click on 'Proceed to checkout' button in view cart page")
+    @step("Click on 'Proceed to checkout' button in view cart page")
     def click_proceed_to_checkout_button(self):
         """
         Click on 'Proceed to checkout' button in view cart page
@@ -67,7 +68,7 @@ class CartPage(BasePage):
         self.proceed_to_checkout_button.wait_for(state="visible", timeout=5000)
         self.proceed_to_checkout_button.click()
 
-    @allure.step("Click on 'Register/Login' link in Checkout")
+    @step("Click on 'Register/Login' link in Checkout")
     def click_register_login_link(self):
         """
         Click on 'Register/Login' link in Checkout
@@ -92,11 +93,11 @@ class CartPage(BasePage):
                f"a.cart_quantity_delete"
                f"[data-product-id='{product_id}']"
             )
-            expect(self.page.locator(selector)).not_to_be_visible()
+            expect(self.locator(selector)).not_to_be_visible()
 
     def verify_product_removed(self, product_id: str):
         """
         Verify the product is no longer visible in the cart
         """
         selector = f"a.cart_quantity_delete[data-product-id='{product_id}']"
-        expect(self.page.locator(selector)).not_to_be_visible()
+        expect(self.locator(selector)).not_to_be_visible()
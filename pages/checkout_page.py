@@ -2,29 +2,30 @@
     Page object for the Checkout Page.
 """
 import re
-import allure
-from playwright.sync_api import Page, expect
-from pages.base_page import BasePage
+from playwright.sync_api import expect
+from helpers.reporting import step
+from pages.base_page import BasePage, Element, Ready
 
 
 class CheckoutPage(BasePage):
     """Checkout class representing page objects with actions."""
-    def __init__(self, page: Page, base_url: str):
-        super().__init__(page, base_url)
-        self.page = page
-        self.delivery_address = page.locator("#address_delivery")
-        self.billing_address = page.locator("#address_invoice")
-        self.product_name = page.locator(".cart_description h4 a")
-        self.category = page.locator(".cart_description p")
-        self.price = page.locator(".cart_price p")
-        self.quantity = page.locator(".cart_quantity button")
-        self.total = page.locator(".cart_total p")
-        self.comment_textarea = page.locator("textarea[name='message']")
-        self.place_order_button = page.locator(
-            'a[href="/payment"]', has_text="Place Order"
-            )
 
-    @allure.step("Verify delivery and billing addresses")
+    __slots__ = ()
+
+    path = "/checkout"
+    ready = Ready("#address_delivery")
+
+    delivery_address = Element("#address_delivery")
+    billing_address = Element("#address_invoice")
+    product_name = Element(".cart_description h4 a")
+    category = Element(".cart_description p")
+    price = Element(".cart_price p")
+    quantity = Element(".cart_quantity button")
+    total = Element(".cart_total p")
+    comment_textarea = Element("textarea[name='message']")
+    place_order_button = Element('a[href="/payment"]', has_text="Place Order")
+
+    @step("Verify delivery and billing addresses")
     def verify_addresses(
         self,
         expected_delivery_components: dict,
@@ -60,7 +61,7 @@ class CheckoutPage(BasePage):
                 f"'{billing_text}'"
             )
 
-    @allure.step("Verify Review Your Order")
+    @step("Verify Review Your Order")
     def verify_product_details_visible(self):
         """
         Verify product details in the Review your order.
@@ -76,14 +77,14 @@ class CheckoutPage(BasePage):
             text = locator.text_content().strip()
             assert text != "", f"{name} is not visible or empty"
 
-    @allure.step("Fill comment in the checkout: comment: {comment}")
+    @step("Fill comment in the checkout: comment: {comment}")
     def fill_comment_input_field(self, comment):
         """
         Fill comment in the input field in the checkout.
         """
         self.comment_textarea.fill(comment)
 
-    @allure.step("Click on 'Place Order' button")
+    @step("Click on 'Place Order' button")
     def click_place_order_button(self):
         """
         Click on 'Place Order' button
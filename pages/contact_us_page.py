@@ -2,9 +2,8 @@
     Page object for the Contact us Page.
 """
 import logging
-import allure
-from playwright.sync_api import Page
-from pages.base_page import BasePage
+from helpers.reporting import step
+from pages.base_page import BasePage, Element, Ready
 
 logger = logging.getLogger(__name__)
 
@@ -13,24 +12,22 @@ class ContactUsPage(BasePage):
     """
     Provides methods to interact with Contact us form fields.
     """
-    def __init__(self, page: Page, base_url: str):
-        super().__init__(page, base_url)
-        self.page = page
-        self.get_in_touch_text = self.page.locator('div.contact-form h2.title')
-        self.name_input_field = self.page.locator('[data-qa="name"]')
-        self.email_input_field = self.page.locator('[data-qa="email"]')
-        self.subject_input_field = self.page.locator('[data-qa="subject"]')
-        self.message_input_field = self.page.locator('[data-qa="message"]')
-        self.upload_input = self.page.locator('input[name="upload_file"]')
-        self.submit_button = self.page.locator(
-            'input[data-qa="submit-button"]'
-            )
-        self.success_message = self.page.locator(
-            'div.status.alert.alert-success'
-            )
-        self.home_link = self.page.locator('a.btn-success')
+    __slots__ = ()
 
-    @allure.step("Verify 'GET IN TOUCH' text is visible")
+    path = "/contact_us"
+    ready = Ready("div.contact-form")
+
+    get_in_touch_text = Element('div.contact-form h2.title')
+    name_input_field = Element('[data-qa="name"]')
+    email_input_field = Element('[data-qa="email"]')
+    subject_input_field = Element('[data-qa="subject"]')
+    message_input_field = Element('[data-qa="message"]')
+    upload_input = Element('input[name="upload_file"]')
+    submit_button = Element('input[data-qa="submit-button"]')
+    success_message = Element('div.status.alert.alert-success')
+    home_link = Element('a.btn-success')
+
+    @step("Verify 'GET IN TOUCH' text is visible")
     def verify_get_in_touch_text(self, expected_text):
         """
         Verify 'GET IN TOUCH' text is visible.
@@ -42,7 +39,7 @@ class ContactUsPage(BasePage):
           f"but got '{actual_text.strip()}'"
         )
 
-    @allure.step("Fill Contact Us form")
+    @step("Fill Contact Us form")
     def fill_contact_us_form(
         self,
         name: str,
@@ -53,16 +50,14 @@ class ContactUsPage(BasePage):
         """
         Fill Contact us input fields.
         """
-        self.name_input_field.wait_for(state="visible", timeout=5000)
-        self.name_input_field.fill(name)
-        self.email_input_field.wait_for(state="visible", timeout=5000)
-        self.email_input_field.fill(email)
-        self.subject_input_field.wait_for(state="visible", timeout=5000)
-        self.subject_input_field.fill(subject)
-        self.message_input_field.wait_for(state="visible", timeout=5000)
-        self.message_input_field.fill(message)
+        self.fill_form({
+            self.name_input_field: name,
+            self.email_input_field: email,
+            self.subject_input_field: subject,
+            self.message_input_field: message,
+        }, timeout=5000)
 
-    @allure.step("Click Submit button")
+    @step("Click Submit button")
     def click_submit_button(self):
         """
         Click on the Submit button.
@@ -71,7 +66,7 @@ class ContactUsPage(BasePage):
         self.submit_button.scroll_into_view_if_needed()
         self.submit_button.click(force=True)
 
-    @allure.step("Verify form after submit")
+    @step("Verify form after submit")
     def verify_form_after_submit(self):
         """
         Verify form after submit.
@@ -1,83 +1,75 @@
 """
     Page object for the Login Page.
 """
-import allure
 from playwright.sync_api import Page
-from pages.base_page import BasePage
+from helpers.reporting import step
+from pages.base_page import BasePage, Element, Ready, Option
 
 
 class LoginPage(BasePage):
-    def __init__(self, page: Page, base_url: str):
-        """
-        Provides methods to interact with login form fields,
-        submit form.
-        """
-        super().__init__(page, base_url)
-        self.page = page
-        self.base_url = base_url
+    """
+    Provides methods to interact with login form fields,
+    submit form.
 
-        self.new_user_signup_text = self.page.locator("div.signup-form h2")
-        self.name_input_field = self.page.locator('[data-qa="signup-name"]')
-        self.sign_up_email_input_field = self.page.locator(
-            '[data-qa="signup-email"]'
-        )
-        self.sign_up_button = self.page.locator('[data-qa="signup-button"]')
-        self.mrs_title_radio = self.page.locator('#id_gender2')
-
-        self.account_info_title = self.page.locator("h2.title").nth(0)
-        self.name_field = self.page.locator("#name")
-        self.email_field = self.page.locator("#email")
-        self.password_field = self.page.locator('input[name="password"]')
-        self.day_dropdown = self.page.locator('select[name="days"]')
-        self.month_dropdown = self.page.locator('select[name="months"]')
-        self.year_dropdown = self.page.locator('select[name="years"]')
-        self.newsletter_checkbox = self.page.locator("#newsletter")
-        self.special_offer_checkbox = self.page.locator("#optin")
-
-        self.first_name = self.page.locator('#first_name')
-        self.last_name = self.page.locator('#last_name')
-        self.company = self.page.locator('#company')
-        self.address_first = self.page.locator('#address1')
-        self.address_second = self.page.locator('#address2')
-        self.country = self.page.locator('#country')
-        self.state = self.page.locator('#state')
-        self.city = self.page.locator('#city')
-        self.zipcode = self.page.locator("#zipcode")
-        self.mobile_number = self.page.locator('#mobile_number')
-
-        self.create_account_button = self.page.locator(
-            '[data-qa="create-account"]'
-            )
-        self.account_created_text = self.page.locator(
-            '[data-qa="account-created"]'
-            )
-        self.continue_button = self.page.locator('[data-qa="continue-button"]')
-        self.logged_in_user_navbar_item = self.page.locator(
-            "ul.nav li a:has-text('Logged in as')"
-            )
-        self.delete_account_navbar_item = self.page.locator(
-            "ul.nav li a:has-text('Delete Account')"
-            )
+    Accounts signed up through the form are recorded in
+    `account_registry` when it is set, so the session sweeper deletes
+    them even if the test fails before deleting them itself.
+    """
 
-        self.verify_login_to_account_text = self.page.locator(
-            'div.login-form h2'
-            )
-        self.login_email_input_field = self.page.locator(
-            '[data-qa="login-email"]'
-            )
-        self.login_password_input_field = self.page.locator(
-            '[data-qa="login-password"]'
-            )
-        self.login_button = self.page.locator('[data-qa="login-button"]')
-        self.logout_navbar_item = self.page.locator(
-            "ul.nav li a:has-text('Logout')"
-            )
+    __slots__ = ("_signup_email", "_signup_password")
 
-        self.name_on_card_input_field = self.page.locator(
-            '[data-qa="name-on-card"]'
-            )
+    path = "/login"
+    ready = Ready('[data-qa="login-button"]')
+
+    account_registry = None
+    ui_account_deletion = True
 
-    @allure.step("Verify 'New User Signup!' text is visible")
+    new_user_signup_text = Element("div.signup-form h2")
+    name_input_field = Element('[data-qa="signup-name"]')
+    sign_up_email_input_field = Element('[data-qa="signup-email"]')
+    sign_up_button = Element('[data-qa="signup-button"]')
+    mrs_title_radio = Element('#id_gender2')
+    account_info_title = Element("h2.title", nth=0)
+    name_field = Element("#name")
+    email_field = Element("#email")
+    password_field = Element('input[name="password"]')
+    day_dropdown = Element('select[name="days"]')
+    month_dropdown = Element('select[name="months"]')
+    year_dropdown = Element('select[name="years"]')
+    newsletter_checkbox = Element("#newsletter")
+    special_offer_checkbox = Element("#optin")
+    first_name = Element('#first_name')
+    last_name = Element('#last_name')
+    company = Element('#company')
+    address_first = Element('#address1')
+    address_second = Element('#address2')
+    country = Element('#country')
+    state = Element('#state')
+    city = Element('#city')
+    zipcode = Element("#zipcode")
+    mobile_number = Element('#mobile_number')
+    create_account_button = Element('[data-qa="create-account"]')
+    account_created_text = Element('[data-qa="account-created"]')
+    continue_button = Element('[data-qa="continue-button"]')
+    logged_in_user_navbar_item = Element(
+        "ul.nav li a:has-text('Logged in as')"
+    )
+    delete_account_navbar_item = Element(
+        "ul.nav li a:has-text('Delete Account')"
+    )
+    verify_login_to_account_text = Element('div.login-form h2')
+    login_email_input_field = Element('[data-qa="login-email"]')
+    login_password_input_field = Element('[data-qa="login-password"]')
+    login_button = Element('[data-qa="login-button"]')
+    logout_navbar_item = Element("ul.nav li a:has-text('Logout')")
+    name_on_card_input_field = Element('[data-qa="name-on-card"]')
+
+    def __init__(self, page: Page, base_url: str = "") -> None:
+        super().__init__(page, base_url)
+        self._signup_email = None
+        self._signup_password = None
+
+    @step("Verify 'New User Signup!' text is visible")
     def verify_new_user_signup_text(self, expected_text):
         """
         Verify 'New User Signup!' text is visible.
@@ -88,22 +80,25 @@ class LoginPage(BasePage):
           f"but got '{actual_text}'"
         )
 
-    @allure.step("Fill signup name: {name} and email: {email}")
+    @step("Fill signup name: {name} and email: {email}")
     def fill_name_email(self, name, email):
         """
         Fill signup form.
         """
-        self.name_input_field.fill(name)
-        self.sign_up_email_input_field.fill(email)
+        self.fill_form({
+            self.name_input_field: name,
+            self.sign_up_email_input_field: email,
+        })
+        self._signup_email = email
 
-    @allure.step("Click Signup button")
+    @step("Click Signup button")
     def click_signup_button(self):
         """
         Click Signup button.
         """
         self.click(self.sign_up_button)
 
-    @allure.step("Verify account information title text")
+    @step("Verify account information title text")
     def verify_account_info_title_text(self, expected_text):
         """
         Verify account information title.
@@ -121,14 +116,14 @@ class LoginPage(BasePage):
             f"for locator '{selector_info}'"
         )
 
-    @allure.step("Select title 'Mrs.'")
+    @step("Select title 'Mrs.'")
     def select_mrs_title(self):
         """
         Select title 'Mrs.'
         """
         self.click(self.mrs_title_radio)
 
-    @allure.step("Fill account information")
+    @step("Fill account information")
     def fill_account_information(
         self,
         password,
@@ -141,17 +136,20 @@ class LoginPage(BasePage):
         """
         Fill account information.
         """
-        self.fill(self.password_field, password)
-        self.select_option(self.day_dropdown, str(day))
-        self.select_option(self.month_dropdown, str(month))
-        self.select_option(self.year_dropdown, str(year))
-
+        fields = {
+            self.password_field: password,
+            self.day_dropdown: Option(day),
+            self.month_dropdown: Option(month),
+            self.year_dropdown: Option(year),
+        }
         if newsletter:
-            self.check(self.newsletter_checkbox)
+            fields[self.newsletter_checkbox] = True
         if special_offer:
-            self.check(self.special_offer_checkbox)
+            fields[self.special_offer_checkbox] = True
+        self.fill_form(fields)
+        self._signup_password = password
 
-    @allure.step("Verify account information is filled correctly")
+    @step("Verify account information is filled correctly")
     def verify_account_information(
         self,
         name,
@@ -165,25 +163,36 @@ class LoginPage(BasePage):
     ):
         """
         Verify account information is filled correctly.
-        """
-        assert self.get_value(self.name_field) == name, (
+        All fields are read in one round trip.
+        """
+        form = self.snapshot_form({
+            "name": self.name_field,
+            "email": self.email_field,
+            "password": self.password_field,
+            "day": self.day_dropdown,
+            "month": self.month_dropdown,
+            "year": self.year_dropdown,
+            "newsletter": self.newsletter_checkbox,
+            "special_offer": self.special_offer_checkbox,
+        })
+        assert form["name"]["value"] == name, (
           f"Expected name '{name}' "
-          f"but got '{self.get_value(self.name_field)}'"
+          f"but got '{form['name']['value']}'"
         )
-        assert self.get_value(self.email_field) == email, (
+        assert form["email"]["value"] == email, (
           f"Expected email '{email}' "
-          f"but got '{self.get_value(self.email_field)}'"
+          f"but got '{form['email']['value']}'"
         )
-        assert self.get_value(self.password_field) != "", (
+        assert form["password"]["value"] != "", (
           "Password field is empty"
         )
-        assert self.get_value(self.day_dropdown) == str(day)
-        assert self.get_value(self.month_dropdown) == str(month)
-        assert self.get_value(self.year_dropdown) == str(year)
-        assert self.is_checked(self.newsletter_checkbox) == newsletter
-        assert self.is_checked(self.special_offer_checkbox) == special_offer
+        assert form["day"]["value"] == str(day)
+        assert form["month"]["value"] == str(month)
+        assert form["year"]["value"] == str(year)
+        assert form["newsletter"]["checked"] == newsletter
+        assert form["special_offer"]["checked"] == special_offer
 
-    @allure.step("Fill address information")
+    @step("Fill address information")
     def fill_address_information(
         self,
         first_name,
@@ -200,18 +209,20 @@ class LoginPage(BasePage):
         """
         Fill address information.
         """
-        self.fill(self.first_name, first_name)
-        self.fill(self.last_name, last_name)
-        self.fill(self.company, company)
-        self.fill(self.address_first, address1)
-        self.fill(self.address_second, address2)
-        self.select_option(self.country, country)
-        self.fill(self.state, state)
-        self.fill(self.city, city)
-        self.fill(self.zipcode, zipcode)
-        self.fill(self.mobile_number, mobile_number)
-
-    @allure.step("Verify address information")
+        self.fill_form({
+            self.first_name: first_name,
+            self.last_name: last_name,
+            self.company: company,
+            self.address_first: address1,
+            self.address_second: address2,
+            self.country: Option(country),
+            self.state: state,
+            self.city: city,
+            self.zipcode: zipcode,
+            self.mobile_number: mobile_number,
+        })
+
+    @step("Verify address information")
     def verify_address_information(
         self,
         first_name,
@@ -227,40 +238,65 @@ class LoginPage(BasePage):
     ):
         """
         Verify address information.
-        """
-        assert self.get_value(self.first_name) == first_name
-        assert self.get_value(self.last_name) == last_name
-        assert self.get_value(self.company) == company
-        assert self.get_value(self.address_first) == address1
-        assert self.get_value(self.address_second) == address2
-        assert self.get_value(self.country) == country
-        assert self.get_value(self.state) == state
-        assert self.get_value(self.city) == city
-        assert self.get_value(self.zipcode) == zipcode
-        assert self.get_value(self.mobile_number) == mobile_number
-
-    @allure.step("Click Create Account button")
+        All fields are read in one round trip.
+        """
+        expected = {
+            "first_name": first_name,
+            "last_name": last_name,
+            "company": company,
+            "address1": address1,
+            "address2": address2,
+            "country": country,
+            "state": state,
+            "city": city,
+            "zipcode": zipcode,
+            "mobile_number": mobile_number,
+        }
+        form = self.snapshot_form({
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "company": self.company,
+            "address1": self.address_first,
+            "address2": self.address_second,
+            "country": self.country,
+            "state": self.state,
+            "city": self.city,
+            "zipcode": self.zipcode,
+            "mobile_number": self.mobile_number,
+        })
+        for field, value in expected.items():
+            assert form[field]["value"] == value, (
+                f"Expected {field} '{value}' "
+                f"but got '{form[field]['value']}'"
+            )
+
+    @step("Click Create Account button")
     def click_create_account_button(self):
         """
-        Click Create Account button.
+        Click Create Account button and record the account.
         """
         self.click(self.create_account_button)
+        if (self.account_registry is not None
+                and self._signup_email and self._signup_password):
+            self.account_registry.add(
+                self._signup_email, self._signup_password
+            )
 
-    @allure.step("Wait for Account Created text to be visible")
+    @step("Wait for Account Created text to be visible")
     def wait_for_account_created(self, timeout=10000):
         """
         Wait for Account Created text to be visible.
         """
         self.account_created_text.wait_for(state="visible", timeout=timeout)
 
-    @allure.step("Click Continue button")
+    @step("Click Continue button")
     def click_continue_button(self):
         """
         Click Continue button.
         """
         self.click(self.continue_button)
 
-    @allure.step("Verify user logged in as {username}")
+    @step("Verify user logged in as {username}")
     def verify_logged_in_user(self, username: str):
         """
         Verify user logged in.
@@ -268,25 +304,49 @@ class LoginPage(BasePage):
         text = self.get_text(self.logged_in_user_navbar_item)
         assert username in text, f"Expected username '{username}' in '{text}'"
 
-    @allure.step("Click on Delete Account in the navbar")
+    @step("Check whether user is logged in as {username}")
+    def is_logged_in_as(self, username: str) -> bool:
+        """
+        Return True if the navbar shows the user as logged in.
+        Does not wait for the navbar item to appear.
+        """
+        if not self.logged_in_user_navbar_item.is_visible():
+            return False
+        return username in self.logged_in_user_navbar_item.inner_text()
+
+    @step("Click on Delete Account in the navbar")
     def click_delete_account_in_navbar(self):
         """
         Click on Delete Account in the navbar.
         """
         self.click(self.delete_account_navbar_item)
 
-    @allure.step("Verify existing email error in the Sign up form")
+    @step("Delete account")
+    def delete_account(self):
+        """
+        Delete the logged in account through the navbar.
+        Skipped with --skip-ui-account-deletion: the session sweeper
+        deletes the account over HTTP instead.
+        """
+        if not self.ui_account_deletion:
+            return
+        self.click_delete_account_in_navbar()
+        self.click_continue_button()
+        if self.account_registry is not None and self._signup_email:
+            self.account_registry.discard(self._signup_email)
+
+    @step("Verify existing email error in the Sign up form")
     def verify_existing_email_error(self, expected_text):
         """
         Verify existing email error in the Sign up form.
         """
-        error_message = self.page.locator("p", has_text=expected_text)
+        error_message = self.locator("p", has_text=expected_text)
         error_message.wait_for(state="visible", timeout=5000)
         assert error_message.is_visible(), (
           f"Expected error message '{expected_text}' not visible"
         )
 
-    @allure.step("Verify 'Login to your account' text is visible")
+    @step("Verify 'Login to your account' text is visible")
     def verify_login_to_your_account_text(self, expected_text: str):
         """
         Verify 'Login to your account' text is visible.
@@ -300,27 +360,29 @@ class LoginPage(BasePage):
             f"for locator '{selector_info}'"
         )
 
-    @allure.step("Fill login form: email: {email} and password: {password}")
+    @step("Fill login form: email: {email} and password: {password}")
     def fill_login_form(self, email, password):
         """
         Fill login form.
         """
-        self.fill(self.login_email_input_field, email)
-        self.fill(self.login_password_input_field, password)
+        self.fill_form({
+            self.login_email_input_field: email,
+            self.login_password_input_field: password,
+        })
 
-    @allure.step("Click Login button")
+    @step("Click Login button")
     def click_login_button(self):
         """
         Click Login button.
         """
         self.click(self.login_button)
 
-    @allure.step("Verify incorrect email or password error in the Login form")
+    @step("Verify incorrect email or password error in the Login form")
     def verify_incorrect_email_or_password_error(self, expected_text):
         """
         Verify incorrect email or password error in the Login form.
         """
-        error_message = self.page.locator(
+        error_message = self.locator(
            '[action="/login"] p',
            has_text=expected_text
         )
@@ -332,7 +394,7 @@ class LoginPage(BasePage):
             f"Expected error message '{expected_text}' but got '{actual_text}'"
         )
 
-    @allure.step("Click Logout button")
+    @step("Click Logout button")
     def click_logout_button(self):
         """
         Click Logout button.
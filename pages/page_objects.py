@@ -0,0 +1,83 @@
+"""
+    One memoized instance of each page object for a Playwright page.
+"""
+from playwright.sync_api import Page
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.contact_us_page import ContactUsPage
+from pages.home_page import HomePage
+from pages.login_page import LoginPage
+from pages.payment_page import PaymentPage
+from pages.product_detail_page import ProductDetailPage
+from pages.products_page import ProductsPage
+from pages.test_cases_page import CasesPage
+from test_data.endpoints_data import route_path
+
+
+class PageObjects:
+    """
+    Creates each page object of a page on first access and returns the
+    same instance afterwards, so its memoized locators are shared by
+    everything in the test that uses it:
+
+        pages.products.add_first_product_to_cart()
+        pages.cart.click_proceed_to_checkout_button()
+
+    `open` deep-links to a route of `test_data.endpoints_data` and
+    returns the page object of the route:
+
+        products = pages.open("products")
+    """
+
+    __slots__ = ("page", "base_url", "_instances")
+
+    classes = {
+        "cart": CartPage,
+        "checkout": CheckoutPage,
+        "contact_us": ContactUsPage,
+        "home": HomePage,
+        "login": LoginPage,
+        "payment": PaymentPage,
+        "product_detail": ProductDetailPage,
+        "products": ProductsPage,
+        "test_cases": CasesPage,
+    }
+
+    # Page object of each route in test_data.endpoints_data.PATHS.
+    routes = {
+        "home": "home",
+        "products": "products",
+        "view_cart": "cart",
+        "login": "login",
+        "checkout": "checkout",
+        "payment": "payment",
+        "product_details": "product_detail",
+        "contact_us": "contact_us",
+        "test_cases": "test_cases",
+    }
+
+    def __init__(self, page: Page, base_url: str) -> None:
+        self.page = page
+        self.base_url = base_url
+        self._instances = {}
+
+    def __getattr__(self, name: str):
+        page_class = self.classes.get(name)
+        if page_class is None:
+            raise AttributeError(f"No page object named '{name}'")
+        try:
+            return self._instances[name]
+        except KeyError:
+            instance = self._instances[name] = page_class(
+                self.page, self.base_url
+            )
+            return instance
+
+    def open(self, route: str, **params):
+        """
+        Navigate straight to a named route, without going through the
+        home page, and return its page object once the page is ready.
+        """
+        page_object = getattr(self, self.routes[route])
+        page_object.goto(route_path(route, **params))
+        return page_object
@@ -1,10 +1,13 @@
 """
     Page object for the Payment Page.
 """
-import os
-import allure
-from playwright.sync_api import Page, expect
-from pages.base_page import BasePage
+from urllib.parse import urljoin
+from playwright.sync_api import expect
+from helpers.invoices import (
+    Invoice, download_path, parse_invoice, parse_invoice_file
+)
+from helpers.reporting import step
+from pages.base_page import BasePage, Element, Ready
 
 
 class PaymentPage(BasePage):
@@ -13,52 +16,35 @@ class PaymentPage(BasePage):
     submit payment, and verify order placement.
     """
 
-    def __init__(self, page: Page, base_url: str):
-        """
-        Initialize PaymentPage with Playwright page and base URL.
+    __slots__ = ()
 
-        Args:
-            page (Page): Playwright page object.
-            base_url (str): Base URL of the application.
-        """
-        super().__init__(page, base_url)
-        self.page = page
-        self.name_on_card_input_field = self.page.locator(
-            '[data-qa="name-on-card"]')
-        self.card_number_input_field = self.page.locator(
-            '[data-qa="card-number"]')
-        self.cvc_input_field = self.page.locator('[data-qa="cvc"]')
-        self.expiration_input_field = self.page.locator(
-          '[data-qa="expiry-month"]')
-        self.year_input_field = self.page.locator('[data-qa="expiry-year"]')
-        self.pay_button = self.page.locator('button.submit-button')
-        self.order_plasced_text = self.page.locator('[data-qa="order-placed"]')
-        self.download_invoice_button = self.page.locator(
-            'a:has-text("Download Invoice")'
-            )
+    path = "/payment"
+    ready = Ready('[data-qa="name-on-card"]')
+
+    name_on_card_input_field = Element('[data-qa="name-on-card"]')
+    card_number_input_field = Element('[data-qa="card-number"]')
+    cvc_input_field = Element('[data-qa="cvc"]')
+    expiration_input_field = Element('[data-qa="expiry-month"]')
+    year_input_field = Element('[data-qa="expiry-year"]')
+    pay_button = Element('button.submit-button')
+    order_plasced_text = Element('[data-qa="order-placed"]')
+    download_invoice_button = Element('a:has-text("Download Invoice")')
 
-    @allure.step("Fill payment information")
+    @step("Fill payment information")
     def fill_payment(self, name: str, card_number: str, cvc: str,
                      expiration: str, year: str):
         """
         Fill all payment fields in the payment form.
         """
-        self.name_on_card_input_field.wait_for(state="visible", timeout=5000)
-        self.name_on_card_input_field.fill(name)
-
-        self.card_number_input_field.wait_for(state="visible", timeout=5000)
-        self.card_number_input_field.fill(card_number)
-
-        self.cvc_input_field.wait_for(state="visible", timeout=5000)
-        self.cvc_input_field.fill(cvc)
-
-        self.expiration_input_field.wait_for(state="visible", timeout=5000)
-        self.expiration_input_field.fill(expiration)
-
-        self.year_input_field.wait_for(state="visible", timeout=5000)
-        self.year_input_field.fill(year)
-
-    @allure.step("Click on 'Pay' button")
+        self.fill_form({
+            self.name_on_card_input_field: name,
+            self.card_number_input_field: card_number,
+            self.cvc_input_field: cvc,
+            self.expiration_input_field: expiration,
+            self.year_input_field: year,
+        }, timeout=5000)
+
+    @step("Click on 'Pay' button")
     def click_pay_button(self):
         """
         Click the 'Pay' button to submit the payment.
@@ -68,7 +54,7 @@ class PaymentPage(BasePage):
         self.pay_button.wait_for(state="visible", timeout=5000)
         self.pay_button.click()
 
-    @allure.step("Verify order placed message text")
+    @step("Verify order placed message text")
     def verify_order_placed_text(self, expected_text: str):
         """
         Verify that the order placed confirmation text is visible and correct.
@@ -80,21 +66,34 @@ class PaymentPage(BasePage):
            f"but got '{actual_text}'"
         )
 
-    @allure.step("Download invoice")
-    def download_invoice(self, save_path: str = "invoice.txt"):
+    @step("Download invoice")
+    def download_invoice(self, to_disk: bool = False, name: str = None,
+                         total: int = None) -> Invoice:
         """
-        Click on the Download Invoice button, save the file,
-        and verify that it exists and is not empty.
+        Download the invoice and return it parsed, checking the customer
+        name and total when given. The invoice is fetched into memory
+        with the page's cookies; with `to_disk` it is downloaded through
+        the browser into the worker's download directory instead.
         """
-        self.download_invoice_button.wait_for(state="visible", timeout=5000)
-
-        with self.page.expect_download() as download_info:
-            self.download_invoice_button.click()
-
-        download = download_info.value
-        download.save_as(save_path)
-
-        assert os.path.exists(save_path), (
-            f"File '{save_path}' was not downloaded"
+        self.download_invoice_button.wait_for(
+            state="visible", timeout=5000
         )
-        assert os.path.getsize(save_path) > 0, f"File '{save_path}' is empty"
+        if to_disk:
+            with self.page.expect_download() as download_info:
+                self.download_invoice_button.click()
+            download = download_info.value
+            path = download_path(download.suggested_filename)
+            download.save_as(path)
+            invoice = parse_invoice_file(path)
+        else:
+            href = self.download_invoice_button.get_attribute("href")
+            url = urljoin(self.page.url, href)
+            response = self.page.request.get(url)
+            assert response.ok, (
+                f"Invoice download '{url}' failed: {response.status}"
+            )
+            invoice = parse_invoice(response.body())
+
+        errors = invoice.mismatches(name, total)
+        assert not errors, f"Unexpected invoice: {', '.join(errors)}"
+        return invoice
@@ -1,30 +1,30 @@
 """
   Page object for the Product Detail Page.
 """
-import allure
-from playwright.sync_api import Page, expect
-from pages.base_page import BasePage
+from playwright.sync_api import expect
+from helpers.reporting import step
+from pages.base_page import BasePage, Element, Ready
 
 
 class ProductDetailPage(BasePage):
     """
     Provides methods to interact with the product detail page elements
     """
-    def __init__(self, page: Page, base_url: str):
-        super().__init__(page, base_url)
-        self.page = page
-        self.quantity_input_field = page.locator('input#quantity')
-        self.add_to_cart_button = page.locator('button.btn.btn-default.cart')
-        self.active_tab = page.locator('li.active > a')
-        self.your_name_input_field = page.locator('[id="name"]')
-        self.email_address_input_field = page.locator('[id="email"]')
-        self.review_input_field = page.locator('[id="review"]')
-        self.review_button = page.locator('[id="button-review"]')
-        self.success_review_send_message = page.locator(
-            'div.alert-success.alert span'
-            )
+    __slots__ = ()
 
-    @allure.step("Fill quantity input field: quantity: {quantity}")
+    path = r"/product_details/\d+"
+    ready = Ready("div.product-information")
+
+    quantity_input_field = Element('input#quantity')
+    add_to_cart_button = Element('button.btn.btn-default.cart')
+    active_tab = Element('li.active > a')
+    your_name_input_field = Element('[id="name"]')
+    email_address_input_field = Element('[id="email"]')
+    review_input_field = Element('[id="review"]')
+    review_button = Element('[id="button-review"]')
+    success_review_send_message = Element('div.alert-success.alert span')
+
+    @step("Fill quantity input field: quantity: {quantity}")
     def fill_quantity_field(self, quantity):
         """
         Fill the quantity input field with the specified number.
@@ -35,7 +35,7 @@ class ProductDetailPage(BasePage):
         self.quantity_input_field.press("Backspace")
         self.quantity_input_field.type(str(quantity))
 
-    @allure.step("Click on 'Add to Cart' button")
+    @step("Click on 'Add to Cart' button")
     def click_continue_shopping_button(self):
         """
         Click the 'Add to Cart' button to add the selected product
@@ -44,26 +44,25 @@ class ProductDetailPage(BasePage):
         self.add_to_cart_button.wait_for(state="visible", timeout=5000)
         self.add_to_cart_button.click()
 
-    @allure.step("Verify active tab contains text: {expected_text}")
+    @step("Verify active tab contains text: {expected_text}")
     def verify_active_tab_text(self, expected_text: str):
         """
         Verify that the currently active tab contains the expected text.
         """
         expect(self.active_tab).to_contain_text(expected_text)
 
-    @allure.step("Fill review product form")
+    @step("Fill review product form")
     def fill_review_product_form(self, name, email, review):
         """
         Fill the review product forn.
         """
-        self.your_name_input_field.wait_for(state="visible", timeout=5000)
-        self.your_name_input_field.fill(name)
-        self.email_address_input_field.wait_for(state="visible", timeout=5000)
-        self.email_address_input_field.fill(email)
-        self.review_input_field.wait_for(state="visible", timeout=5000)
-        self.review_input_field.fill(review)
+        self.fill_form({
+            self.your_name_input_field: name,
+            self.email_address_input_field: email,
+            self.review_input_field: review,
+        }, timeout=5000)
 
-    @allure.step("Click on Submit button")
+    @step("Click on Submit button")
     def click_submit_button(self):
         """
         Click the Submit button.
@@ -71,7 +70,7 @@ class ProductDetailPage(BasePage):
         self.review_button.wait_for(state="visible", timeout=5000)
         self.review_button.click()
 
-    @allure.step("Verify success message after submitting review")
+    @step("Verify success message after submitting review")
     def verify_review_success_message(self, expected_text: str):
         """
         Verify that the success message is displayed with the expected text.
@@ -1,23 +1,23 @@
 """
     Page object for the Test cases Page.
 """
-import allure
-from playwright.sync_api import Page
-from pages.base_page import BasePage
+from helpers.reporting import step
+from pages.base_page import BasePage, Element, Ready
 
 
 class CasesPage(BasePage):
-    def __init__(self, page: Page, base_url: str):
-        """
-        Provides methods to interact with the Test cases page elements.
-        """
-        super().__init__(page, base_url)
-        self.page = page
-        self.verify_login_to_account_text = page.locator(
-            'h2.title.text-center b'
-        )
+    """
+    Provides methods to interact with the Test cases page elements.
+    """
+
+    __slots__ = ()
+
+    path = "/test_cases"
+    ready = Ready("h2.title.text-center b")
+
+    verify_login_to_account_text = Element('h2.title.text-center b')
 
-    @allure.step("Verify 'Test Cases' text is visible")
+    @step("Verify 'Test Cases' text is visible")
     def verify_test_cases_text(self, expected_text: str):
         """
         Verify 'Test Cases' text is visible.
@@ -3,14 +3,39 @@ Data pages endpoints
 """
 BASE_URL = "https://automationexercise.com"
 
-endpoints = {
-    "products": f"{BASE_URL}/products",
-    "view_cart": f"{BASE_URL}/view_cart",
-    "login": f"{BASE_URL}/login",
-    "checkout": f"{BASE_URL}/checkout",
-    "payment": f"{BASE_URL}/payment",
-    "account_delete": f"{BASE_URL}/delete_account",
-    "product_details": f"{BASE_URL}/product_details/{{id}}",
-    "contact_us": f"{BASE_URL}/contact_us",
-    "test_cases": f"{BASE_URL}/test_cases"
+PATHS = {
+    "home": "/",
+    "products": "/products",
+    "view_cart": "/view_cart",
+    "login": "/login",
+    "checkout": "/checkout",
+    "payment": "/payment",
+    "account_delete": "/delete_account",
+    "product_details": "/product_details/{id}",
+    "contact_us": "/contact_us",
+    "test_cases": "/test_cases"
 }
+
+endpoints = {}
+
+
+def set_base_url(base_url: str) -> None:
+    """
+    Point the endpoints at another deployment, e.g. the local storefront.
+    Updates `endpoints` in place so modules that imported it see the change.
+    """
+    base_url = base_url.rstrip("/")
+    endpoints.update(
+        {name: f"{base_url}{path}" for name, path in PATHS.items()}
+    )
+
+
+def route_path(name: str, **params) -> str:
+    """
+    Return the path of a named route, e.g.
+    `route_path("product_details", id=1)`.
+    """
+    return PATHS[name].format(**params)
+
+
+set_base_url(BASE_URL)
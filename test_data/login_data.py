@@ -1,10 +1,7 @@
 """
 Data for Login page
 """
-import time
-from faker import Faker
-
-fake = Faker()
+from helpers.data_helpers import default_pool
 
 LOGIN_TITLE_TEXT = "Login to your account"
 
@@ -16,10 +13,10 @@ TEST_USER = {
 
 EXPECTED_ERROR = "Your email or password is incorrect!"
 
-timestamp = int(time.time())
+_user = default_pool().user()
 RANDOM_USER = {
-    "email": f"{fake.first_name().lower()}.{timestamp}@example.com",
-    "password": fake.password(length=10, special_chars=True, digits=True)
+    "email": _user.email,
+    "password": _user.password
 }
 
 SIGN_UP_TITLE_TEXT = "New User Signup!"
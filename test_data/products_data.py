@@ -1,11 +1,8 @@
 """
 Data for Products and Product detail pages.
 """
+from helpers.data_helpers import default_pool
 
-import time
-from faker import Faker
-
-fake = Faker()
 products_in_cart = [
     {
         "name": "product-1",
@@ -55,10 +52,6 @@ HM_BRAND_TITLE = "Brand - H&M Products"
 
 REVIEW_TITLE = "Write Your Review"
 
-RANDOM_USER = {
-    "name": fake.first_name(),
-    "email": f"{fake.first_name().lower()}.{int(time.time())}@example.com",
-    "review": fake.text(max_nb_chars=100)
-}
+RANDOM_USER = default_pool().review().as_dict()
 
 SUCCESS_MESSAGE = "Thank you for your review."
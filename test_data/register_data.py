@@ -1,12 +1,7 @@
 """
 Data for Sign up page
 """
-
-import random
-import time
-from faker import Faker
-
-fake = Faker()
+from helpers.data_helpers import default_pool
 
 ACCOUNT_INFORMATION_TITLE = "ENTER ACCOUNT INFORMATION"
 
@@ -15,29 +10,20 @@ EXIST_USER = {
     "email": "test@gmail.com"
 }
 
+_user = default_pool().user()
+
 RANDOM_USER = {
-    "name": fake.first_name(),
-    "email": f"{fake.first_name().lower()}.{int(time.time())}@example.com"
+    "name": _user.first_name,
+    "email": _user.email
 }
 
 ACCOUNT_INFO = {
-    "password": fake.password(length=10, special_chars=True, digits=True),
-    "day": str(random.randint(1, 28)),
-    "month": str(random.randint(1, 12)),
-    "year": str(random.randint(1970, 2005)),
+    "password": _user.password,
+    "day": _user.day,
+    "month": _user.month,
+    "year": _user.year,
     "newsletter": True,
     "special_offer": True
 }
 
-ADDRESS_INFO = {
-    "first_name": RANDOM_USER["name"],
-    "last_name": fake.last_name(),
-    "company": fake.company(),
-    "address1": fake.street_address(),
-    "address2": fake.secondary_address(),
-    "country": "United States",
-    "state": fake.state(),
-    "city": fake.city(),
-    "zipcode": fake.zipcode(),
-    "mobile_number": fake.phone_number()
-}
+ADDRESS_INFO = _user.address.as_dict()
@@ -0,0 +1,79 @@
+"""
+    Test the HTTP account factory against the local storefront.
+"""
+import pytest
+from helpers.accounts import AccountFactory, AccountProvisioningError
+from helpers.data_helpers import generate_random_user
+from helpers.storefront import Storefront
+
+
+@pytest.fixture
+def storefront():
+    """
+    Start an empty local storefront.
+    """
+    server = Storefront()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def local_factory(storefront):
+    """
+    Return a factory pointed at the local storefront.
+    """
+    factory = AccountFactory(storefront.url)
+    yield factory
+    factory.close()
+
+
+def test_create_and_delete_account(storefront, local_factory):
+    """
+    Test creating, verifying and deleting an account over HTTP.
+    """
+    user = generate_random_user()
+
+    local_factory.create(user)
+    assert local_factory.exists(user)
+    stored = storefront.state.accounts[user["email"]]
+    assert stored["firstname"] == user["address"]["first_name"]
+    assert stored["birth_year"] == user["year"]
+
+    assert local_factory.delete(user) is True
+    assert not local_factory.exists(user)
+    assert local_factory.delete(user) is False
+
+
+def test_create_existing_account_fails(local_factory):
+    """
+    Test creating the same account twice raises an error.
+    """
+    user = generate_random_user()
+    local_factory.create(user)
+
+    with pytest.raises(AccountProvisioningError, match="already exists"):
+        local_factory.create(user)
+
+
+def test_sweep_deletes_leftover_accounts(storefront, local_factory):
+    """
+    Test the sweeper deletes every recorded account that is left,
+    including accounts signed up through the UI.
+    """
+    users = [generate_random_user() for _ in range(5)]
+    for user in users[:4]:
+        local_factory.create(user)
+    local_factory.delete(users[0])
+    storefront.seed_account(
+        users[4]["first_name"], users[4]["email"], users[4]["password"]
+    )
+    local_factory.registry.add(users[4]["email"], users[4]["password"])
+    local_factory.registry.add("gone@example.com", "password")
+
+    deleted, errors = local_factory.sweep()
+
+    assert (deleted, errors) == (4, [])
+    assert not storefront.state.accounts
+    assert len(local_factory.registry) == 0
+    assert local_factory.sweep() == (0, [])
@@ -0,0 +1,109 @@
+"""
+    Run independent scenarios concurrently with the async page objects.
+"""
+from playwright.async_api import expect
+from async_pages.cart_page import CartPage
+from async_pages.contact_us_page import ContactUsPage
+from async_pages.home_page import HomePage
+from async_pages.product_detail_page import ProductDetailPage
+from async_pages.products_page import ProductsPage
+from async_pages.test_cases_page import CasesPage
+from helpers.async_runner import failure_report
+from helpers.data_helpers import default_pool
+from test_data.home_data import SUBSCRIPTION_TITLE
+from test_data.products_data import ALL_PRODUCTS_TITLE, QUANTITY_VALUE
+
+
+async def subscribe_from_home_page(page, base_url):
+    """
+    Subscribe to the newsletter from the home page.
+    """
+    home = HomePage(page, base_url)
+    await home.goto("/")
+    await home.scroll_to_footer()
+    await home.verify_subscription_text(SUBSCRIPTION_TITLE)
+    await home.fill_subscription_form(default_pool().email())
+    await home.click_subscribe_button()
+    await home.verify_success_message(
+        "You have been successfully subscribed!"
+    )
+
+
+async def view_first_product(page, base_url):
+    """
+    Open the details of the first product from the products page.
+    """
+    products = ProductsPage(page, base_url)
+    await products.goto("/products")
+    await products.verify_all_products_text(ALL_PRODUCTS_TITLE)
+    await products.click_first_product_view()
+    await expect(page).to_have_url(f"{base_url}/product_details/1")
+    await products.verify_product_details_visible()
+
+
+async def add_quantity_to_cart(page, base_url):
+    """
+    Add a product with a quantity and check it in the cart.
+    """
+    products = ProductsPage(page, base_url)
+    product_detail = ProductDetailPage(page, base_url)
+    cart = CartPage(page, base_url)
+    await product_detail.goto("/product_details/1")
+    await product_detail.fill_quantity_field(QUANTITY_VALUE)
+    await product_detail.click_continue_shopping_button()
+    await products.click_view_cart_button()
+    await cart.verify_quantity(QUANTITY_VALUE)
+
+
+async def send_contact_form(page, base_url):
+    """
+    Fill in and submit the contact form.
+    """
+    contact_us = ContactUsPage(page, base_url)
+    await contact_us.goto("/contact_us")
+    await contact_us.verify_get_in_touch_text("Get In Touch")
+    await contact_us.fill_contact_us_form(
+        **default_pool().contact().as_dict()
+    )
+    await contact_us.click_submit_button()
+    await contact_us.verify_form_after_submit()
+
+
+async def open_test_cases(page, base_url):
+    """
+    Open the test cases page from the header.
+    """
+    home = HomePage(page, base_url)
+    cases = CasesPage(page, base_url)
+    await home.goto("/")
+    await home.go_to_test_cases_page()
+    await cases.verify_test_cases_text("Test Cases")
+
+
+SCENARIOS = [
+    subscribe_from_home_page,
+    view_first_product,
+    add_quantity_to_cart,
+    send_contact_form,
+    open_test_cases,
+]
+
+
+def test_concurrent_scenarios(async_runner):
+    """
+    Test independent scenarios run concurrently, each in its own context
+    of one browser, up to the configured concurrency. The scenario set
+    runs once per SCENARIOS contexts of concurrency, so the default
+    concurrency runs it once.
+    """
+    scenarios = [
+        (f"{scenario.__name__}[{index}]", scenario)
+        for index in range(async_runner.concurrency // len(SCENARIOS) or 1)
+        for scenario in SCENARIOS
+    ]
+
+    results = async_runner.run(scenarios)
+
+    assert len(results) == len(scenarios)
+    assert all(result.passed for result in results), failure_report(results)
+    assert async_runner.peak_contexts <= async_runner.concurrency
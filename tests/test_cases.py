@@ -1,12 +1,14 @@
 """
 This module contains a test for the Test Cases page.
 """
+import pytest
 from playwright.sync_api import expect
 from pages.home_page import HomePage
 from pages.test_cases_page import CasesPage
 from test_data.endpoints_data import endpoints
 
 
+@pytest.mark.smoke
 def test_cases_page(page, base_url):
     """
     Test navigation to the Test Cases page and verify the title and URL.
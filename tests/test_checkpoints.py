@@ -0,0 +1,126 @@
+"""
+    Test building and resuming journey checkpoints without a browser.
+"""
+from helpers.checkpoints import CheckpointStore
+
+
+class FakeContext:
+    """
+    Browser context that keeps cookies and local storage in memory.
+    """
+
+    def __init__(self):
+        self.cookies = []
+        self.local_storage = {}
+        self.closed = False
+
+    def new_page(self):
+        return FakePage(self)
+
+    def add_cookies(self, cookies):
+        self.cookies.extend(cookies)
+
+    def storage_state(self):
+        return {
+            "cookies": list(self.cookies),
+            "origins": [{
+                "origin": "http://shop",
+                "localStorage": [{"name": "cart", "value": "1"}],
+            }],
+        }
+
+    def close(self):
+        self.closed = True
+
+
+class FakePage:
+    """
+    Page that records the URL it navigates to and writes local storage.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.url = "about:blank"
+        self.routes = []
+
+    def goto(self, url, wait_until=None):
+        self.url = url
+
+    def route(self, url, handler):
+        self.routes.append(url)
+
+    def evaluate(self, script, items):
+        assert self.routes, "local storage written without a route"
+        storage = self.context.local_storage.setdefault(self.url, {})
+        storage.update({item["name"]: item["value"] for item in items})
+
+    def close(self):
+        pass
+
+
+def make_store():
+    """
+    Return a store with a reusable account and a consumable cart.
+    """
+    contexts = []
+
+    def new_context():
+        contexts.append(FakeContext())
+        return contexts[-1]
+
+    store = CheckpointStore(new_context)
+
+    @store.define("registered_user")
+    def registered_user(page, identity):
+        page.context.add_cookies([{"name": "sessionid", "value": "abc"}])
+        page.goto("http://shop/")
+        return {"user": {"email": "jane@example.com"}}
+
+    @store.define("cart_with_product", parent="registered_user",
+                  consumable=True)
+    def cart_with_product(page, identity):
+        assert identity["user"]["email"] == "jane@example.com"
+        page.goto("http://shop/view_cart")
+
+    return store, contexts
+
+
+def test_resume_restores_state_and_identity():
+    """
+    Test a resumed checkpoint restores cookies, URL and identity, and
+    builds its parent once.
+    """
+    store, contexts = make_store()
+    page = FakeContext().new_page()
+
+    identity = store.resume("cart_with_product", page)
+
+    assert identity == {"user": {"email": "jane@example.com"}}
+    assert page.url == "http://shop/view_cart"
+    assert page.context.cookies == [{"name": "sessionid", "value": "abc"}]
+    assert page.context.local_storage == {"http://shop": {"cart": "1"}}
+    assert store.builds == 2
+    assert all(context.closed for context in contexts)
+
+    identity["user"]["email"] = "changed"
+    assert store.identity("registered_user")["user"]["email"] == (
+        "jane@example.com"
+    )
+
+
+def test_consumable_checkpoint_is_rebuilt_from_parent():
+    """
+    Test a consumable checkpoint is rebuilt for every test on top of
+    the cached parent, and invalidating the parent rebuilds both.
+    """
+    store, _ = make_store()
+    for _ in range(3):
+        store.resume("cart_with_product", FakeContext().new_page())
+    assert store.builds == 4
+
+    store.resume("registered_user", FakeContext().new_page())
+    assert store.builds == 4
+
+    store.invalidate("registered_user")
+    store.resume("cart_with_product", FakeContext().new_page())
+    assert store.builds == 6
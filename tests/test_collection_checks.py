@@ -0,0 +1,148 @@
+"""
+    Test the collection assertion of BasePage without a browser.
+"""
+from types import SimpleNamespace
+import pytest
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from pages.base_page import (
+    COLLECTION_STATE_SCRIPT, COLLECTION_WAIT_ELEMENTS_SCRIPT, BasePage,
+    collection_mismatches, css_chain
+)
+
+
+def state(text, visible=True, **attributes):
+    """
+    Return an element state as read by COLLECTION_STATE_SCRIPT.
+    """
+    return {"visible": visible, "text": text, "attributes": attributes}
+
+
+def test_collection_reports_every_mismatching_index():
+    """
+    Test all mismatching elements are reported, not only the first one.
+    """
+    states = [
+        state("Polo", href="/brand_products/Polo"),
+        state("H&M", visible=False, href="/brand_products/H&M"),
+        state("Madame", href="/brand_products/Mast"),
+    ]
+
+    mismatches = collection_mismatches(
+        states,
+        visible=True,
+        texts=["Polo", "H&M", "Mast & Harbour"],
+        attributes={"href": [
+            "/brand_products/Polo",
+            "/brand_products/H&M",
+            "/brand_products/Madame",
+        ]},
+    )
+
+    assert mismatches == [
+        "Element 1: expected visible",
+        "Element 2: expected text 'Mast & Harbour' but got 'Madame'",
+        "Element 2: expected href='/brand_products/Madame' "
+        "but got '/brand_products/Mast'",
+    ]
+
+
+def test_collection_checks_count_and_contained_text():
+    """
+    Test the element count and substring text matching.
+    """
+    states = [state("(6) Polo"), state("(5) H&M")]
+
+    assert collection_mismatches(
+        states, texts=["Polo", "H&M"], contains=True
+    ) == []
+    assert collection_mismatches(states, texts=["Polo"]) == [
+        "Expected 1 elements but found 2"
+    ]
+    assert collection_mismatches([], visible=True) == ["No elements found"]
+    assert collection_mismatches([], count=0) == []
+
+
+def test_css_chain_splits_plain_css_locators():
+    """
+    Test chained CSS locators are polled in the browser by their parts,
+    and locators using other selector engines are not.
+    """
+    frame = object()
+    page = SimpleNamespace(main_frame=SimpleNamespace(_impl_obj=frame))
+
+    def locator(selector, locator_frame=frame):
+        return SimpleNamespace(_impl_obj=SimpleNamespace(
+            _selector=selector, _frame=locator_frame
+        ))
+
+    assert css_chain(locator("div.brands_products >> ul.nav li a"), page) \
+        == ["div.brands_products", "ul.nav li a"]
+    assert css_chain(locator("div#slider-carousel h2"), page) == [
+        "div#slider-carousel h2"
+    ]
+    assert css_chain(locator("li >> internal:has-text=\"Polo\"i"), page) \
+        is None
+    assert css_chain(locator("text=Polo"), page) is None
+    assert css_chain(locator("li a", object()), page) is None
+
+
+class FakeLocator:
+    """
+    Locator of a non-CSS selector that logs its waits and scripts, and
+    whose elements are in the page or never appear.
+    """
+
+    def __init__(self, states, present=True):
+        self._impl_obj = SimpleNamespace(
+            _selector='text="Polo"', _frame=None
+        )
+        self.states = states
+        self.present = present
+        self.log = []
+        self.first = self
+
+    def wait_for(self, state=None, timeout=None):
+        self.log.append(f"wait first {state}")
+        if not self.present:
+            raise PlaywrightTimeoutError("Timeout")
+
+    def evaluate_all(self, script, arg):
+        if script == COLLECTION_WAIT_ELEMENTS_SCRIPT:
+            self.log.append("poll")
+            assert 0 < arg[2] <= 5000
+            return True
+        assert script == COLLECTION_STATE_SCRIPT
+        self.log.append("read")
+        return self.states if self.present else []
+
+
+def collection_page():
+    """Return a page object of a page without elements of its own."""
+    return BasePage(SimpleNamespace(
+        main_frame=SimpleNamespace(_impl_obj=object())
+    ))
+
+
+def test_non_css_collection_waits_for_its_first_element():
+    """
+    Test a collection without a CSS selector waits for its first element
+    before polling, and fails without polling when none appears.
+    """
+    locator = FakeLocator([state("Polo")])
+    assert collection_page().verify_collection(
+        locator, texts=["Polo"], timeout=5000
+    ) == [state("Polo")]
+    assert locator.log == ["wait first attached", "poll", "read"]
+
+    locator = FakeLocator([], present=False)
+    with pytest.raises(AssertionError, match="1 elements but found 0"):
+        collection_page().verify_collection(
+            locator, texts=["Polo"], timeout=5000
+        )
+    assert locator.log == ["wait first attached", "read"]
+
+    locator = FakeLocator([], present=False)
+    assert collection_page().verify_collection(
+        locator, count=0, timeout=5000
+    ) == []
+    assert locator.log == ["poll", "read"]
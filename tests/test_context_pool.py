@@ -0,0 +1,123 @@
+"""
+    Test the reset of pooled browser contexts without a browser.
+"""
+from helpers.context_pool import CLEAR_ORIGIN_SCRIPT, ContextPool
+
+
+class FakeRequest:
+    """Request of a URL, a navigation or not."""
+
+    def __init__(self, url, navigation):
+        self.url = url
+        self.navigation = navigation
+
+    def is_navigation_request(self):
+        return self.navigation
+
+
+class FakePage:
+    """
+    Page that logs the origins it clears.
+    """
+
+    def __init__(self, context):
+        self.context = context
+        self.url = None
+
+    def route(self, url, handler):
+        pass
+
+    def goto(self, url):
+        self.url = url
+
+    def evaluate(self, script):
+        assert script == CLEAR_ORIGIN_SCRIPT
+        self.context.cleared.append(self.url)
+        self.context.local_storage.pop(self.url, None)
+
+    def close(self):
+        pass
+
+
+class FakeContext:
+    """
+    Context that fires request events and keeps local storage by origin.
+    """
+
+    def __init__(self):
+        self.pages = []
+        self.listeners = []
+        self.cleared = []
+        self.local_storage = {}
+
+    def on(self, event, listener):
+        assert event == "request"
+        self.listeners.append(listener)
+
+    def request(self, url, navigation=True):
+        for listener in self.listeners:
+            listener(FakeRequest(url, navigation))
+
+    def new_page(self):
+        return FakePage(self)
+
+    def storage_state(self, indexed_db=False):
+        assert indexed_db
+        return {"cookies": [], "origins": [
+            {"origin": origin} for origin in self.local_storage
+        ]}
+
+    def unroute_all(self, behavior=None):
+        pass
+
+    def clear_cookies(self):
+        pass
+
+    def clear_permissions(self):
+        pass
+
+    def set_extra_http_headers(self, headers):
+        pass
+
+    def set_geolocation(self, geolocation):
+        pass
+
+    def set_offline(self, offline):
+        pass
+
+    def set_default_timeout(self, timeout):
+        pass
+
+    def set_default_navigation_timeout(self, timeout):
+        pass
+
+
+class FakeBrowser:
+    """Browser that creates fake contexts."""
+
+    def new_context(self, **options):
+        return FakeContext()
+
+
+def test_reset_clears_every_visited_origin():
+    """
+    Test the storage of every origin the test navigated to is cleared,
+    including origins that left nothing in localStorage, e.g. only
+    IndexedDB or service workers, and the context is reused.
+    """
+    pool = ContextPool(FakeBrowser())
+    context = pool.acquire()
+    context.request("https://shop.test/products")
+    context.request("https://shop.test/api/cart", navigation=False)
+    context.request("https://cdn.test/frame")
+    context.request("about:blank")
+    context.local_storage["https://other.test"] = {"cart": "1"}
+
+    pool.release(context)
+
+    assert context.cleared == [
+        "https://cdn.test", "https://other.test", "https://shop.test"
+    ]
+    assert pool.acquire() is context
+    pool.release(context)
+    assert context.cleared[3:] == []
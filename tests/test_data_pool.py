@@ -0,0 +1,67 @@
+"""
+    Test the seeded test data pool without a browser.
+"""
+import dataclasses
+import pytest
+from helpers.data_helpers import DataPool, User, schema_key
+
+
+def without_email(user):
+    """
+    Return the pooled part of a user handed out by a pool.
+    """
+    return dataclasses.replace(user, email="")
+
+
+def test_pool_is_seeded_and_cached_on_disk(tmp_path):
+    """
+    Test a seed always yields the same records, read back from the cache
+    without Faker.
+    """
+    pool = DataPool(7, batch_size=3, cache_dir=tmp_path)
+    users = [pool.user() for _ in range(4)]
+    payment = pool.payment()
+
+    assert pool.path.name == f"7-{schema_key()}.json"
+    assert len(pool._records["users"]) == 6
+
+    cached = DataPool(7, batch_size=3, cache_dir=tmp_path)
+    assert [without_email(cached.user()) for _ in range(4)] == [
+        without_email(user) for user in users
+    ]
+    assert cached.payment() == payment
+    assert cached._faker is None
+
+    other = DataPool(8, batch_size=3, cache_dir=tmp_path)
+    assert other.user().address != users[0].address
+
+
+def test_records_are_frozen_and_compact(tmp_path):
+    """
+    Test the records are immutable, slotted and convert to form dicts.
+    """
+    user = DataPool(1, batch_size=1, cache_dir=tmp_path).user()
+
+    assert isinstance(user, User)
+    assert not hasattr(user, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        user.first_name = "Jane"
+    assert user.as_dict()["address"]["first_name"] == user.first_name
+    assert user.email.startswith(f"{user.first_name.lower()}.")
+
+
+def test_in_memory_pool_writes_no_cache(tmp_path, monkeypatch):
+    """
+    Test a pool without a cache directory yields the same records as a
+    cached pool of its seed and writes no file.
+    """
+    monkeypatch.chdir(tmp_path)
+    pool = DataPool(7, batch_size=3, cache_dir=None)
+    cached = DataPool(7, batch_size=3, cache_dir=tmp_path / "cache")
+
+    assert pool.path is None
+    assert without_email(pool.user()) == without_email(cached.user())
+    assert pool.payment() == cached.payment()
+    assert [path.name for path in tmp_path.rglob("*.json")] == [
+        cached.path.name
+    ]
@@ -2,67 +2,26 @@
     Test place order and download invoice.
 """
 from playwright.sync_api import expect
-from faker import Faker
-from pages.home_page import HomePage
-from pages.cart_page import CartPage
-from pages.login_page import LoginPage
-from pages.payment_page import PaymentPage
-from pages.checkout_page import CheckoutPage
-from helpers.data_helpers import generate_random_user, generate_random_payment
-from test_data.products_data import ALL_PRODUCTS_TITLE
-from test_data.register_data import ACCOUNT_INFORMATION_TITLE
-from test_data.login_data import SIGN_UP_TITLE_TEXT
 from test_data.order_data import ORDER_PLACED_TITLE
 from test_data.endpoints_data import endpoints
 
-fake = Faker()
 
-
-def test_register_while_place_order(products_page, page, base_url):
+def test_download_invoice_after_place_order(page, pages, checkpoints,
+                                            payment_data, data_pool):
     """
-    Test register new user while place order and download invoice.
+    Test place order as a registered user and download invoice.
+    Starts from a logged in user with a product in the cart.
     """
-    products = products_page
-    cart = CartPage(page, base_url)
-    login = LoginPage(page, base_url)
-    home = HomePage(page, base_url)
-    checkout = CheckoutPage(page, base_url)
-    payment = PaymentPage(page, base_url)
-    user = generate_random_user()
-    payment_data = generate_random_payment()
-
-    products.verify_all_products_text(ALL_PRODUCTS_TITLE)
-    products.verify_products_list_visible()
-    expect(page).to_have_url(endpoints["products"])
+    cart = pages.cart
+    login = pages.login
+    home = pages.home
+    checkout = pages.checkout
+    payment = pages.payment
 
-    products.add_first_product_to_cart()
-    products.click_view_cart_button()
+    user = checkpoints.resume("cart_with_product", page)["user"]
     expect(page).to_have_url(endpoints["view_cart"])
+    home.verify_logged_in_user(user["first_name"])
 
-    cart.click_proceed_to_checkout_button()
-    cart.click_register_login_link()
-    login.verify_new_user_signup_text(SIGN_UP_TITLE_TEXT)
-
-    login.fill_name_email(user["first_name"], user["email"])
-    login.click_signup_button()
-    login.verify_account_info_title_text(ACCOUNT_INFORMATION_TITLE)
-    login.select_mrs_title()
-    login.fill_account_information(
-        password=user["password"],
-        day=user["day"],
-        month=user["month"],
-        year=user["year"],
-        newsletter=True,
-        special_offer=True,
-    )
-    login.fill_address_information(**user["address"])
-    login.click_create_account_button()
-    login.wait_for_account_created()
-    login.click_continue_button()
-    login.verify_logged_in_user(user["first_name"])
-
-    home.go_to_cart_page()
-    expect(page).to_have_url(endpoints["view_cart"])
     cart.click_proceed_to_checkout_button()
 
     checkout.verify_addresses(
@@ -70,7 +29,7 @@ def test_register_while_place_order(products_page, page, base_url):
         expected_billing_components=user["address"],
     )
     checkout.verify_product_details_visible()
-    checkout.fill_comment_input_field(fake.text(max_nb_chars=200))
+    checkout.fill_comment_input_field(data_pool.text())
     checkout.click_place_order_button()
 
     payment.fill_payment(
@@ -83,8 +42,9 @@ def test_register_while_place_order(products_page, page, base_url):
     payment.click_pay_button()
     payment.verify_order_placed_text(ORDER_PLACED_TITLE)
 
-    payment.download_invoice("invoice.txt")
+    invoice = payment.download_invoice(
+        to_disk=True, name=f"{user['first_name']} {user['last_name']}"
+    )
+    assert invoice.path.is_file()
 
     login.click_continue_button()
-    login.click_delete_account_in_navbar()
-    login.click_continue_button()
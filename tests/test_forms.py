@@ -0,0 +1,196 @@
+"""
+    Test the form snapshot and bulk fill of BasePage without a browser.
+"""
+from types import SimpleNamespace
+from pages.base_page import (
+    BULK_FILL_SCRIPT, FIELD_STATE_SCRIPT, FORM_SNAPSHOT_SCRIPT, BasePage,
+    Option
+)
+
+
+class FakeFrame:
+    """Frame a locator belongs to."""
+
+
+class FakeLocator:
+    """
+    Locator of a selector in a frame, that logs its actions and reads
+    its element from the page's fake DOM.
+    """
+
+    def __init__(self, page, selector, frame=None):
+        self.page = page
+        self._impl_obj = self
+        self._selector = selector
+        self._frame = frame or page.main_frame._impl_obj
+
+    def wait_for(self, state=None, timeout=None):
+        self.page.log.append(f"wait {self._selector}")
+
+    def evaluate(self, script):
+        assert script == FIELD_STATE_SCRIPT
+        self.page.log.append(f"evaluate {self._selector}")
+        return self.page.elements[self._selector]
+
+    def fill(self, text):
+        self.page.log.append(f"fill {self._selector} {text}")
+
+    def is_checked(self):
+        return self.page.elements[self._selector]["checked"]
+
+    def check(self):
+        self.page.log.append(f"check {self._selector}")
+
+    def uncheck(self):
+        self.page.log.append(f"uncheck {self._selector}")
+
+    def select_option(self, value):
+        self.page.log.append(f"select {self._selector} {value}")
+
+
+class FakePage:
+    """
+    Page with a fake DOM of field states by selector, that logs the
+    scripts it runs.
+    """
+
+    def __init__(self, elements):
+        self.main_frame = SimpleNamespace(_impl_obj=FakeFrame())
+        self.elements = elements
+        self.log = []
+
+    def evaluate(self, script, selectors):
+        assert script == FORM_SNAPSHOT_SCRIPT
+        self.log.append(f"snapshot {sorted(selectors)}")
+        return {
+            name: self.elements.get(selector)
+            for name, selector in selectors.items()
+        }
+
+    def wait_for_function(self, script, arg=None, timeout=None):
+        assert script == BULK_FILL_SCRIPT
+        self.log.append(f"bulk fill {arg} {timeout}")
+
+
+def field(value="", checked=None, selected=None):
+    """
+    Return a field state as read by FIELD_STATE_SCRIPT.
+    """
+    return {"value": value, "checked": checked, "selected": selected}
+
+
+def test_snapshot_reads_css_fields_in_one_evaluate():
+    """
+    Test the plain CSS fields are read by one evaluate, keyed by name,
+    with the state shape of FIELD_STATE_SCRIPT.
+    """
+    page = FakePage({
+        "#name": field("Jane"),
+        "#newsletter": field("on", checked=True),
+        "#country": field("India", selected=["India"]),
+    })
+    form = BasePage(page)
+
+    snapshot = form.snapshot_form({
+        "name": FakeLocator(page, "#name"),
+        "newsletter": FakeLocator(page, "#newsletter"),
+        "country": FakeLocator(page, "#country"),
+    })
+
+    assert page.log == ["snapshot ['country', 'name', 'newsletter']"]
+    assert snapshot == {
+        "name": {"value": "Jane", "checked": None, "selected": None},
+        "newsletter": {"value": "on", "checked": True, "selected": None},
+        "country": {"value": "India", "checked": None,
+                    "selected": ["India"]},
+    }
+
+
+def test_snapshot_reads_other_fields_one_by_one():
+    """
+    Test fields without a plain CSS selector, or not in the page when
+    the snapshot runs, are read one by one after a wait.
+    """
+    page = FakePage({
+        "#name": field("Jane"),
+        "text=Email >> input": field("jane@example.com"),
+        "#late": field("1"),
+    })
+    form = BasePage(page)
+    late = FakeLocator(page, "#late")
+    del page.elements["#late"]
+
+    def read_late(script):
+        page.elements["#late"] = field("1")
+        return FakeLocator.evaluate(late, script)
+
+    late.evaluate = read_late
+    snapshot = form.snapshot_form({
+        "name": FakeLocator(page, "#name"),
+        "email": FakeLocator(page, "text=Email >> input"),
+        "late": late,
+    })
+
+    assert page.log == [
+        "snapshot ['late', 'name']",
+        "wait text=Email >> input",
+        "evaluate text=Email >> input",
+        "wait #late",
+        "evaluate #late",
+    ]
+    assert snapshot["email"]["value"] == "jane@example.com"
+    assert snapshot["late"]["value"] == "1"
+
+
+def signup_fields(page, email_selector="#email"):
+    """
+    Return fill_form values for a text field, a dropdown and two
+    checkboxes.
+    """
+    return {
+        FakeLocator(page, email_selector): "jane@example.com",
+        FakeLocator(page, "#country"): Option("India"),
+        FakeLocator(page, "#newsletter"): True,
+        FakeLocator(page, "#offers"): False,
+    }
+
+
+def test_fill_form_sets_css_fields_in_one_batch():
+    """
+    Test plain CSS fields are filled by one wait_for_function with the
+    selector and value of every field.
+    """
+    page = FakePage({})
+    BasePage(page).fill_form(signup_fields(page), timeout=5000)
+
+    assert page.log == [
+        "bulk fill [['#email', 'jane@example.com'], ['#country', 'India'], "
+        "['#newsletter', True], ['#offers', False]] 5000"
+    ]
+
+
+def test_fill_form_falls_back_to_field_actions():
+    """
+    Test every field goes through its Playwright action when a locator
+    is not plain CSS, or in strict mode.
+    """
+    elements = {
+        "#newsletter": field("on", checked=False),
+        "#offers": field("on", checked=True),
+    }
+    expected = [
+        "wait {email}", "fill {email} jane@example.com",
+        "wait #country", "select #country India",
+        "wait #newsletter", "check #newsletter",
+        "wait #offers", "uncheck #offers",
+    ]
+
+    page = FakePage(elements)
+    BasePage(page).fill_form(signup_fields(page, "text=Email >> input"))
+    assert page.log == [
+        line.format(email="text=Email >> input") for line in expected
+    ]
+
+    page = FakePage(elements)
+    BasePage(page).fill_form(signup_fields(page), strict=True)
+    assert page.log == [line.format(email="#email") for line in expected]
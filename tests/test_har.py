@@ -0,0 +1,77 @@
+"""
+    Test the replay of stateful requests from a HAR archive without a
+    browser.
+"""
+import json
+from helpers.har import HarReplayer
+
+
+class FakeRequest:
+    """
+    Request of the given method, URL and navigation kind.
+    """
+
+    def __init__(self, method, url, navigation=True):
+        self.method = method
+        self.url = url
+        self.resource_type = "document" if navigation else "fetch"
+        self.navigation = navigation
+
+    def is_navigation_request(self):
+        return self.navigation
+
+
+class FakeRoute:
+    """
+    Route that records how it was handled.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.fulfilled = None
+
+    def fulfill(self, **response):
+        self.fulfilled = response
+
+    def abort(self):
+        self.fulfilled = "aborted"
+
+
+def entry(method, url, status, location=None, body=""):
+    """
+    Return a HAR entry of a response.
+    """
+    headers = [{"name": "location", "value": location}] if location else []
+    return {
+        "request": {"method": method, "url": url},
+        "response": {
+            "status": status,
+            "headers": headers,
+            "content": {"text": body},
+        },
+    }
+
+
+def test_navigation_redirect_is_fulfilled_and_followed(tmp_path):
+    """
+    Test a recorded redirect of a navigation is fulfilled with its status
+    and location, and the request the browser then sends is replayed.
+    """
+    path = tmp_path / "signup.har"
+    path.write_text(json.dumps({"log": {"entries": [
+        entry("POST", "http://shop/signup", 302, "/account_created"),
+        entry("GET", "http://shop/account_created", 200, body="Created"),
+    ]}}))
+    replayer = HarReplayer(path)
+
+    signup = FakeRoute(FakeRequest("POST", "http://shop/signup"))
+    replayer._handle(signup)
+    created = FakeRoute(FakeRequest("GET", "http://shop/account_created"))
+    replayer._handle(created)
+
+    assert signup.fulfilled == {
+        "status": 302, "headers": {"location": "http://shop/account_created"}
+    }
+    assert created.fulfilled["status"] == 200
+    assert replayer.hits == 2
+    assert replayer.misses == []
@@ -0,0 +1,37 @@
+"""
+    Test the header links of the home page, each in its own tab.
+
+Other tests open their pages directly, so the header navigation is
+covered here.
+"""
+from playwright.sync_api import expect
+from test_data.endpoints_data import endpoints
+
+HEADER_LINKS = {
+    "products": "go_to_products_page",
+    "login": "go_to_signup_or_login",
+    "view_cart": "go_to_cart_page",
+    "contact_us": "go_to_contact_us_form",
+    "test_cases": "go_to_test_cases_page",
+}
+
+
+def follow(link: str, route: str):
+    """
+    Return a check that clicks a header link and verifies the URL it
+    leads to.
+    """
+    def check(pages):
+        getattr(pages.home, link)()
+        yield
+        expect(pages.page).to_have_url(endpoints[route])
+    return check
+
+
+def test_header_links(tabs):
+    """
+    Test every header link of the home page leads to its page.
+    """
+    for route, link in HEADER_LINKS.items():
+        tabs.add(route, "/", follow(link, route))
+    tabs.run()
@@ -0,0 +1,22 @@
+"""
+    Test the independent widgets of the home page.
+"""
+from test_data.home_data import (
+    HEADER_CAROUSEL_TEXT,
+    RECOMMENDED_ITEMS_TITLE,
+    SUBSCRIPTION_TITLE
+)
+
+
+def test_home_page_widgets(pages):
+    """
+    Test the header carousel, recommended items and subscription widget
+    of the home page. They are read-only and on the same page, so one
+    page load serves all of them.
+    """
+    home = pages.open("home")
+
+    home.verify_header_carousel_texts(HEADER_CAROUSEL_TEXT)
+    home.scroll_to_footer()
+    home.verify_recommended_items_text(RECOMMENDED_ITEMS_TITLE)
+    home.verify_subscription_text(SUBSCRIPTION_TITLE)
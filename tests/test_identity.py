@@ -0,0 +1,34 @@
+"""
+    Test the identity allocator without a browser.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from helpers.identity import IdentityAllocator
+
+
+def test_identities_are_unique_across_workers_and_threads():
+    """
+    Test workers of one run, and threads of one worker, never collide.
+    """
+    workers = [IdentityAllocator("run1", f"gw{index}") for index in range(4)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        emails = list(executor.map(
+            lambda index: workers[index % 4].email("Jane"), range(2000)
+        ))
+
+    assert len(set(emails)) == len(emails)
+    assert IdentityAllocator("run1", "gw0").email("Jane") == (
+        "jane.run1gw0n1@example.com"
+    )
+
+
+def test_identities_differ_between_runs():
+    """
+    Test the same worker and counter give other identities in a new run.
+    """
+    first = IdentityAllocator(worker="gw0")
+    second = IdentityAllocator(run="other", worker="gw0")
+
+    assert first.username("Jane") != second.username("Jane")
+    assert IdentityAllocator().run == first.run
+    assert first.email("Mary O'Neil").startswith("mary.o.neil.")
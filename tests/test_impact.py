@@ -0,0 +1,276 @@
+"""
+    Test the change-impact selection on a small repository.
+"""
+import subprocess
+from textwrap import dedent
+import pytest
+from helpers.impact import ALL, CACHE_KEY, DependencyGraph, changed_lines
+
+FILES = {
+    "conftest.py": '''
+        import pytest
+        from pages.home_page import HomePage
+
+
+        def pytest_configure(config):
+            pass
+
+
+        @pytest.fixture
+        def home(page):
+            return HomePage(page)
+    ''',
+    "pages/home_page.py": '''
+        import logging
+
+        logger = logging.getLogger(__name__)
+
+
+        class HomePage:
+            cart_link = "a.cart"
+
+            def open_cart(self):
+                self.click(self.cart_link)
+
+            def subscribe(self, email):
+                self.fill(email)
+    ''',
+    "test_data/home_data.py": '''
+        CART_TITLE = "Cart"
+        EMAIL = "user@example.com"
+    ''',
+    "tests/test_home.py": '''
+        from test_data.home_data import CART_TITLE, EMAIL
+
+
+        def test_cart(home):
+            home.open_cart()
+            assert CART_TITLE
+
+
+        def test_subscribe(home):
+            home.subscribe(EMAIL)
+    ''',
+    "tests/test_other.py": '''
+        def test_other():
+            assert True
+    ''',
+}
+
+
+def git(root, *args):
+    return subprocess.run(
+        ["git", *args], cwd=root, check=True, capture_output=True, text=True
+    ).stdout
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """
+    Create a committed repository with a page, test data and tests.
+    """
+    for path, text in FILES.items():
+        file = tmp_path / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(dedent(text).lstrip())
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "-c", "user.name=test", "-c", "user.email=test@test",
+        "commit", "-qm", "init")
+    return tmp_path
+
+
+def impacted(repo, path, old, new):
+    file = repo / path
+    file.write_text(file.read_text().replace(old, new))
+    result = DependencyGraph(repo).impacted(changed_lines("HEAD", repo))
+    return result if result == ALL else sorted(name for _, name in result)
+
+
+@pytest.mark.parametrize("path, old, new, tests", [
+    ("pages/home_page.py", "self.fill(email)", "self.type(email)",
+     ["test_subscribe"]),
+    ("pages/home_page.py", '"a.cart"', '"a#cart"',
+     ["test_cart", "test_subscribe"]),
+    ("pages/home_page.py", "import logging", "import logging, os",
+     ["test_cart", "test_subscribe"]),
+    ("test_data/home_data.py", '"Cart"', '"Shopping Cart"', ["test_cart"]),
+    ("tests/test_other.py", "True", "1", ["test_other"]),
+    ("conftest.py", "pass", "return", ALL),
+])
+def test_changes_select_affected_tests(repo, path, old, new, tests):
+    """
+    Test a change selects the tests that reach the changed code.
+    """
+    assert impacted(repo, path, old, new) == tests
+
+
+DISPATCH_FILES = {
+    "pages/base_page.py": '''
+        READY = {}
+
+
+        class BasePage:
+            path = None
+
+            def __init_subclass__(cls, **kwargs):
+                READY[cls.path] = cls
+
+
+        def ready_for(path):
+            return READY.get(path)
+    ''',
+    "pages/cart_page.py": '''
+        from pages.base_page import BasePage
+
+
+        class CartPage(BasePage):
+            path = "/view_cart"
+
+            def checkout(self):
+                self.click()
+    ''',
+    "pages/page_objects.py": '''
+        from pages.cart_page import CartPage
+
+
+        class PageObjects:
+            classes = {
+                "cart": CartPage,
+            }
+
+            def __getattr__(self, name):
+                return self.classes[name]()
+    ''',
+    "tests/test_dispatch.py": '''
+        from pages.base_page import ready_for
+        from pages.page_objects import PageObjects
+
+
+        def test_cart_through_pages():
+            PageObjects().cart.checkout()
+
+
+        def test_ready_for_cart():
+            assert ready_for("/view_cart")
+    ''',
+}
+
+
+@pytest.mark.parametrize("path, old, new", [
+    ("pages/page_objects.py", '"cart": CartPage,',
+     '"basket": CartPage,'),
+    ("pages/cart_page.py", '"/view_cart"', '"/cart"'),
+])
+def test_dispatch_tables_and_registries_select_their_users(
+        repo, path, old, new):
+    """
+    Test a change to a `__getattr__` dispatch table or to a class
+    attribute read through an `__init_subclass__` registry selects the
+    tests that use them.
+    """
+    for name, text in DISPATCH_FILES.items():
+        (repo / name).write_text(dedent(text).lstrip())
+    git(repo, "add", ".")
+    git(repo, "-c", "user.name=test", "-c", "user.email=test@test",
+        "commit", "-qm", "pages")
+
+    assert impacted(repo, path, old, new) == [
+        "test_cart_through_pages", "test_ready_for_cart"
+    ]
+
+
+DYNAMIC_FILES = {
+    "helpers/data_pool.py": '''
+        class DataPool:
+            def user(self):
+                return self._generate("users")
+
+            def _generate(self, kind):
+                return getattr(self, f"_generate_{kind}")()
+
+            def _generate_users(self):
+                return {"name": "Ann"}
+    ''',
+    "helpers/factories.py": '''
+        def make(kind):
+            return globals()["make_" + kind]()
+
+
+        def build(kind):
+            return getattr(make, kind)
+
+
+        def make_person():
+            return {"name": "Bob"}
+    ''',
+    "tests/test_pool.py": '''
+        from helpers.data_pool import DataPool
+
+
+        def test_pool_user():
+            assert DataPool().user()
+    ''',
+    "tests/test_factories.py": '''
+        from helpers.factories import build
+
+
+        def test_build():
+            assert build("person")
+    ''',
+}
+
+
+@pytest.mark.parametrize("path, old, new, tests", [
+    ("helpers/data_pool.py", '"Ann"', '"Eve"', ["test_pool_user"]),
+    ("helpers/factories.py", '"Bob"', '"Eve"', ["test_build"]),
+])
+def test_computed_attribute_names_select_their_callers(
+        repo, path, old, new, tests):
+    """
+    Test a change to a method or function only reached through `getattr`
+    with a computed name selects the tests that reach its class or
+    module.
+    """
+    for name, text in DYNAMIC_FILES.items():
+        (repo / name).parent.mkdir(parents=True, exist_ok=True)
+        (repo / name).write_text(dedent(text).lstrip())
+    git(repo, "add", ".")
+    git(repo, "-c", "user.name=test", "-c", "user.email=test@test",
+        "commit", "-qm", "pool")
+
+    assert impacted(repo, path, old, new) == tests
+
+
+def test_unknown_and_removed_files_select_every_test(repo):
+    """
+    Test changes the graph cannot follow select every test.
+    """
+    (repo / "pytest.ini").write_text("[pytest]\n")
+    git(repo, "add", "pytest.ini")
+    assert DependencyGraph(repo).impacted(
+        changed_lines("HEAD", repo)
+    ) == ALL
+
+    git(repo, "rm", "-q", "--cached", "pytest.ini")
+    (repo / "tests/test_other.py").unlink()
+    assert changed_lines("HEAD", repo) == {"tests/test_other.py": None}
+
+
+def test_parsed_modules_are_cached(repo):
+    """
+    Test the graph reuses the parsed modules of unchanged files.
+    """
+    cache = {}
+
+    class Cache:
+        get = cache.get
+        set = cache.__setitem__
+
+    DependencyGraph(repo, Cache())
+    modules = cache[CACHE_KEY]
+    (repo / "tests/test_other.py").write_text("def test_new():\n    pass\n")
+    graph = DependencyGraph(repo, Cache())
+
+    assert graph.modules["conftest.py"] is modules["conftest.py"]
+    assert ("tests/test_other.py", "test_new") in graph.tests()
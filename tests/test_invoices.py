@@ -0,0 +1,74 @@
+"""
+    Test the invoice parser and the invoice ledger.
+"""
+import pytest
+from helpers.invoices import (
+    MAX_INVOICE_BYTES, InvoiceError, InvoiceLedger, download_dir,
+    download_path, parse_invoice, parse_invoice_file
+)
+
+BODY = b"Hi Jane Doe, Your total purchase amount is 1500. Thank you"
+
+
+def test_invoice_is_parsed():
+    """
+    Test the customer name, total and size are read from the invoice.
+    """
+    invoice = parse_invoice(BODY)
+    assert (invoice.name, invoice.total, invoice.size) == (
+        "Jane Doe", 1500, len(BODY)
+    )
+    assert invoice.mismatches("Jane Doe", 1500) == []
+
+
+def test_wrong_download_is_rejected():
+    """
+    Test a body that is not an invoice fails with its first bytes.
+    """
+    with pytest.raises(InvoiceError, match="Not an invoice.*DOCTYPE"):
+        parse_invoice(b"<!DOCTYPE html><html></html>")
+
+    with pytest.raises(InvoiceError, match="larger than"):
+        parse_invoice(BODY + b" " * MAX_INVOICE_BYTES)
+
+    with pytest.raises(InvoiceError, match="empty"):
+        parse_invoice(b"")
+
+
+def test_invoice_file_in_worker_download_dir():
+    """
+    Test saved invoices get distinct paths in the worker's directory.
+    """
+    first = download_path("invoice.txt")
+    second = download_path("../invoice.txt")
+    assert first != second
+    assert first.parent == second.parent == download_dir()
+
+    first.write_bytes(BODY)
+    invoice = parse_invoice_file(first)
+    assert (invoice.total, invoice.path) == (1500, first)
+
+
+def test_invoice_mismatches():
+    """
+    Test every difference from the expected name and total is listed.
+    """
+    invoice = parse_invoice(BODY)
+    assert invoice.mismatches("John Doe", 500) == [
+        "name 'Jane Doe', expected 'John Doe'",
+        "total 1500, expected 500",
+    ]
+
+
+def test_ledger_reports_every_invoice():
+    """
+    Test the ledger lists the invoices it collected.
+    """
+    ledger = InvoiceLedger()
+    assert not ledger
+    ledger.add("login order", parse_invoice(BODY))
+    ledger.add("register order", parse_invoice(BODY))
+    assert ledger.report().splitlines() == [
+        f"login order: Jane Doe, total 1500, {len(BODY)} bytes",
+        f"register order: Jane Doe, total 1500, {len(BODY)} bytes",
+    ]
@@ -7,7 +7,7 @@ Includes:
 - Logout
 """
 
-from faker import Faker
+import pytest
 from test_data.endpoints_data import endpoints
 from test_data.login_data import (
     LOGIN_TITLE_TEXT,
@@ -17,13 +17,11 @@ from test_data.login_data import (
 )
 
 
-fake = Faker()
-
-
+@pytest.mark.smoke
 def test_login_with_valid_data(login_signup_page, login_user):
     """Test login with valid credentials."""
     login_signup_page.verify_login_to_your_account_text(LOGIN_TITLE_TEXT)
-    login_user(**TEST_USER)
+    login_user(**TEST_USER, use_cache=False)
 
 
 def test_login_with_incorrect_email_and_password(login_signup_page):
@@ -36,12 +34,10 @@ def test_login_with_incorrect_email_and_password(login_signup_page):
     login_signup_page.verify_incorrect_email_or_password_error(EXPECTED_ERROR)
 
 
-def test_logout(login_signup_page, login_user):
+def test_logout(login_user):
     """Test logging out after a successful login."""
-    login_signup_page.verify_login_to_your_account_text(LOGIN_TITLE_TEXT)
+    login = login_user(**TEST_USER)
+    login.click_logout_button()
 
-    login_user(**TEST_USER)
-    login_signup_page.click_logout_button()
-
-    login_signup_page.page.wait_for_url(endpoints["login"])
-    login_signup_page.verify_login_to_your_account_text(LOGIN_TITLE_TEXT)
+    login.page.wait_for_url(endpoints["login"])
+    login.verify_login_to_your_account_text(LOGIN_TITLE_TEXT)
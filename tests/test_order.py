@@ -3,14 +3,6 @@
     and after login.
     """
 from playwright.sync_api import expect
-from faker import Faker
-from pages.home_page import HomePage
-from pages.cart_page import CartPage
-from pages.login_page import LoginPage
-from pages.products_page import ProductsPage
-from pages.payment_page import PaymentPage
-from pages.checkout_page import CheckoutPage
-from helpers.data_helpers import generate_random_user, generate_random_payment
 from test_data.products_data import ALL_PRODUCTS_TITLE
 from test_data.register_data import ACCOUNT_INFORMATION_TITLE
 from test_data.login_data import SIGN_UP_TITLE_TEXT
@@ -18,21 +10,19 @@ from test_data.order_data import ORDER_PLACED_TITLE
 from test_data.login_data import LOGIN_TITLE_TEXT
 from test_data.endpoints_data import endpoints
 
-fake = Faker()
 
-
-def test_register_while_place_order(products_page, page, base_url):
+def test_register_while_place_order(products_page, page, pages, new_user,
+                                    payment_data, data_pool, invoices):
     """
     Test register new user while place order.
     """
     products = products_page
-    cart = CartPage(page, base_url)
-    login = LoginPage(page, base_url)
-    home = HomePage(page, base_url)
-    checkout = CheckoutPage(page, base_url)
-    payment = PaymentPage(page, base_url)
-    user = generate_random_user()
-    payment_data = generate_random_payment()
+    cart = pages.cart
+    login = pages.login
+    home = pages.home
+    checkout = pages.checkout
+    payment = pages.payment
+    user = new_user
 
     products.verify_all_products_text(ALL_PRODUCTS_TITLE)
     products.verify_products_list_visible()
@@ -73,7 +63,7 @@ def test_register_while_place_order(products_page, page, base_url):
         expected_billing_components=user["address"],
     )
     checkout.verify_product_details_visible()
-    checkout.fill_comment_input_field(fake.text(max_nb_chars=200))
+    checkout.fill_comment_input_field(data_pool.text())
     checkout.click_place_order_button()
 
     payment.fill_payment(
@@ -85,26 +75,28 @@ def test_register_while_place_order(products_page, page, base_url):
     )
     payment.click_pay_button()
     payment.verify_order_placed_text(ORDER_PLACED_TITLE)
+    invoice = payment.download_invoice(
+        name=f"{user['first_name']} {user['last_name']}"
+    )
+    invoices.add("register while place order", invoice)
 
-    login.click_delete_account_in_navbar()
-    login.click_continue_button()
+    login.delete_account()
 
 
-def test_register_before_place_order(page, base_url):
+def test_register_before_place_order(page, pages, new_user, payment_data,
+                                     data_pool, invoices):
     """
     Test register new user before place order.
     """
-    products = ProductsPage(page, base_url)
-    cart = CartPage(page, base_url)
-    login = LoginPage(page, base_url)
-    home = HomePage(page, base_url)
-    checkout = CheckoutPage(page, base_url)
-    payment = PaymentPage(page, base_url)
-    user = generate_random_user()
-    payment_data = generate_random_payment()
-
-    home.goto("/")
-    home.go_to_signup_or_login()
+    products = pages.products
+    cart = pages.cart
+    login = pages.login
+    home = pages.home
+    checkout = pages.checkout
+    payment = pages.payment
+    user = new_user
+
+    pages.open("login")
     login.verify_new_user_signup_text(SIGN_UP_TITLE_TEXT)
 
     login.fill_name_email(user["first_name"], user["email"])
@@ -141,7 +133,7 @@ def test_register_before_place_order(page, base_url):
         expected_billing_components=user["address"],
     )
     checkout.verify_product_details_visible()
-    checkout.fill_comment_input_field(fake.text(max_nb_chars=200))
+    checkout.fill_comment_input_field(data_pool.text())
     checkout.click_place_order_button()
 
     payment.fill_payment(
@@ -153,49 +145,29 @@ def test_register_before_place_order(page, base_url):
     )
     payment.click_pay_button()
     payment.verify_order_placed_text(ORDER_PLACED_TITLE)
+    invoice = payment.download_invoice(
+        name=f"{user['first_name']} {user['last_name']}"
+    )
+    invoices.add("register before place order", invoice)
 
-    login.click_delete_account_in_navbar()
-    login.click_continue_button()
+    login.delete_account()
 
 
-def test_login_before_place_order(page, base_url, login_user):
+def test_login_before_place_order(page, pages, login_user, registered_user,
+                                  payment_data, data_pool, invoices):
     """
     Test login before place order.
     """
-    products = ProductsPage(page, base_url)
-    cart = CartPage(page, base_url)
-    login = LoginPage(page, base_url)
-    home = HomePage(page, base_url)
-    checkout = CheckoutPage(page, base_url)
-    payment = PaymentPage(page, base_url)
-
-    user = generate_random_user()
-    payment_data = generate_random_payment()
-
-    home.goto("/")
-    home.go_to_signup_or_login()
-    login.verify_new_user_signup_text(SIGN_UP_TITLE_TEXT)
+    products = pages.products
+    cart = pages.cart
+    login = pages.login
+    home = pages.home
+    checkout = pages.checkout
+    payment = pages.payment
 
-    login.fill_name_email(user["first_name"], user["email"])
-    login.click_signup_button()
-
-    login.select_mrs_title()
-    login.fill_account_information(
-        password=user["password"],
-        day=user["day"],
-        month=user["month"],
-        year=user["year"],
-        newsletter=True,
-        special_offer=True,
-    )
-    login.fill_address_information(**user["address"])
-    login.click_create_account_button()
-    login.wait_for_account_created()
-    login.click_continue_button()
-    login.verify_logged_in_user(user["first_name"])
+    user = registered_user
 
-    login.click_logout_button()
-    login.page.wait_for_url(endpoints["login"])
+    pages.open("login")
     login.verify_login_to_your_account_text(LOGIN_TITLE_TEXT)
 
     login_user(user["email"], user["password"], user["first_name"])
@@ -216,7 +188,7 @@ def test_login_before_place_order(page, base_url, login_user):
         expected_billing_components=user["address"],
     )
     checkout.verify_product_details_visible()
-    checkout.fill_comment_input_field(fake.text(max_nb_chars=200))
+    checkout.fill_comment_input_field(data_pool.text())
     checkout.click_place_order_button()
 
     payment.fill_payment(
@@ -228,6 +200,7 @@ def test_login_before_place_order(page, base_url, login_user):
     )
     payment.click_pay_button()
     payment.verify_order_placed_text(ORDER_PLACED_TITLE)
-
-    login.click_delete_account_in_navbar()
-    login.click_continue_button()
+    invoice = payment.download_invoice(
+        name=f"{user['first_name']} {user['last_name']}"
+    )
+    invoices.add("login before place order", invoice)
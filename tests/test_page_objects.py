@@ -0,0 +1,96 @@
+"""
+    Test the lazy locator declarations and the page object cache
+    without a browser.
+"""
+from pages.page_objects import PageObjects
+from pages.products_page import ProductsPage
+
+
+class FakeLocator:
+    """
+    Stands in for a Playwright page or locator and records the chain of
+    calls that built it.
+    """
+    created = 0
+
+    def __init__(self, chain=()):
+        self.chain = chain
+        FakeLocator.created += 1
+
+    def locator(self, selector, has_text=None):
+        return FakeLocator(self.chain + (("locator", selector, has_text),))
+
+    def nth(self, index):
+        return FakeLocator(self.chain + (("nth", index),))
+
+    def get_by_role(self, role, **options):
+        return FakeLocator(self.chain + (("role", role, options),))
+
+
+def test_locators_are_built_lazily_and_memoized():
+    """
+    Test no locator is built until accessed, and each is built once.
+    """
+    page = FakeLocator()
+    FakeLocator.created = 0
+    products = ProductsPage(page, "http://shop.local")
+
+    assert FakeLocator.created == 0
+    assert not hasattr(products, "__dict__")
+
+    button = products.first_product_add_to_cart
+    assert button is products.first_product_add_to_cart
+    assert button.chain == (
+        ("locator", "div.features_items div.col-sm-4", None),
+        ("nth", 0),
+        ("locator", "a.btn.btn-default.add-to-cart", None),
+        ("nth", 1),
+    )
+    assert products.locator("h2.title") is products.locator("h2.title")
+
+
+def test_page_objects_are_memoized_per_page():
+    """
+    Test each page object is created once per page.
+    """
+    pages = PageObjects(FakeLocator(), "http://shop.local")
+
+    assert pages.products is pages.products
+    assert pages.home.test_cases_link.chain == (
+        ("role", "link", {"name": "Test Cases", "exact": True}),
+    )
+    assert pages.login.page is pages.page
+
+
+class FakePage(FakeLocator):
+    """
+    Page that records where it navigates and the elements waited for.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.log = []
+
+    def goto(self, url, wait_until=None, timeout=None):
+        self.log.append(url)
+
+    def locator(self, selector, has_text=None):
+        locator = super().locator(selector, has_text)
+        locator.wait_for = lambda **kwargs: self.log.append(selector)
+        return locator
+
+
+def test_open_deep_links_to_route():
+    """
+    Test `open` navigates straight to a route and returns its page
+    object once the page is ready.
+    """
+    page = FakePage()
+    pages = PageObjects(page, "http://shop.local")
+
+    assert pages.open("view_cart") is pages.cart
+    assert pages.open("product_details", id=3) is pages.product_detail
+    assert page.log == [
+        "http://shop.local/view_cart", "#cart_info_table",
+        "http://shop.local/product_details/3", "div.product-information",
+    ]
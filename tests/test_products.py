@@ -1,6 +1,7 @@
 """
     Test products, product detail and cart pages.
 """
+import pytest
 from playwright.sync_api import expect
 from pages.cart_page import CartPage
 from pages.home_page import HomePage
@@ -24,6 +25,7 @@ from test_data.home_data import RECOMMENDED_ITEMS_TITLE
 from test_data.endpoints_data import endpoints
 
 
+@pytest.mark.smoke
 def test_all_products_and_product_detail_page(products_page, page, base_url):
     """
     Test all products are visible and product detail page is visible.
@@ -118,39 +120,55 @@ def test_remove_products_from_cart(products_page, page, base_url):
         cart.verify_product_removed(pid)
 
 
-def test_products_category(products_page):
+def test_products_category(tabs):
     """
     Test products category.
+    The sidebar and each subcategory are checked in their own tab.
     """
-    products = products_page
-
-    products.verify_categories_visible(
-     expected_header=CATEGORIES["main"],
-     expected_categories=list(CATEGORIES["sub"].keys())
-    )
+    def sidebar(pages):
+        pages.products.verify_categories_visible(
+         expected_header=CATEGORIES["main"],
+         expected_categories=list(CATEGORIES["sub"].keys())
+        )
 
-    products.click_category("Women")
-    products.click_subcategory("Women", CATEGORIES["sub"]["Women"][0])
-    products.verify_category_page_header(WOMEN_DRESS_SUBCATEGORY)
+    def subcategory(category, index, expected_header):
+        def check(pages):
+            products = pages.products
+            products.click_category(category)
+            products.click_subcategory(
+                category, CATEGORIES["sub"][category][index]
+            )
+            yield
+            products.verify_category_page_header(expected_header)
+        return check
 
-    products.click_category("Kids")
-    products.click_subcategory("Kids", CATEGORIES["sub"]["Kids"][1])
-    products.verify_category_page_header(KIDS_TOP_SUBCATEGORY)
+    tabs.add("sidebar", "/products", sidebar)
+    tabs.add("women", "/products",
+             subcategory("Women", 0, WOMEN_DRESS_SUBCATEGORY))
+    tabs.add("kids", "/products",
+             subcategory("Kids", 1, KIDS_TOP_SUBCATEGORY))
+    tabs.run()
 
 
-def test_products_brand(products_page):
+def test_products_brand(tabs):
     """
     Test products brand.
-    """
-    products = products_page
-
-    products.verify_brands_visible(BRANDS)
-
-    products.click_brand(BRANDS[0])
-    products.verify_brand_page_header(POLO_BRAND_TITLE)
-
-    products.click_brand(BRANDS[1])
-    products.verify_brand_page_header(HM_BRAND_TITLE)
+    The brand list and each brand page are checked in their own tab.
+    """
+    def brand_list(pages):
+        pages.products.verify_brands_visible(BRANDS)
+
+    def brand(name, expected_header):
+        def check(pages):
+            pages.products.click_brand(name)
+            yield
+            pages.products.verify_brand_page_header(expected_header)
+        return check
+
+    tabs.add("brands", "/products", brand_list)
+    tabs.add("polo", "/products", brand(BRANDS[0], POLO_BRAND_TITLE))
+    tabs.add("h&m", "/products", brand(BRANDS[1], HM_BRAND_TITLE))
+    tabs.run()
 
 
 def test_review_on_product(products_page, page, base_url):
@@ -0,0 +1,106 @@
+"""
+    Test the per-page readiness conditions of goto() without a browser.
+"""
+from contextlib import contextmanager
+from async_pages.base_page import BasePage as AsyncBasePage
+from async_pages.products_page import ProductsPage as AsyncProductsPage
+from pages.base_page import BasePage, Ready, ready_for
+from pages.product_detail_page import ProductDetailPage
+from pages.products_page import ProductsPage
+
+
+class FakeLocator:
+    """
+    Locator that logs waits for its element.
+    """
+
+    def __init__(self, log, selector):
+        self.log = log
+        self.selector = selector
+
+    def wait_for(self, state=None, timeout=None):
+        self.log.append(f"wait {self.selector} {state}")
+
+
+class FakePage:
+    """
+    Page that logs navigation, load states and expected responses.
+    """
+
+    def __init__(self):
+        self.log = []
+
+    def goto(self, url, wait_until=None, timeout=None):
+        self.log.append(f"goto {url} {wait_until}")
+
+    def wait_for_load_state(self, state, timeout=None):
+        self.log.append(f"load {state}")
+
+    def locator(self, selector, has_text=None):
+        return FakeLocator(self.log, selector)
+
+    @contextmanager
+    def expect_response(self, url, timeout=None):
+        self.log.append(f"expect {url}")
+        yield
+        self.log.append(f"response {url}")
+
+
+def test_ready_for_matches_page_paths():
+    """
+    Test paths and URLs resolve to the condition of their page object.
+    """
+    assert ready_for("/products") is ProductsPage.ready
+    assert ready_for("/product_details/1?quantity=2") is (
+        ProductDetailPage.ready
+    )
+    assert ready_for("http://shop/products#top") is ProductsPage.ready
+    assert ready_for("/product_details/abc") is None
+    assert ready_for("/brand_products/Polo") is None
+
+
+def test_page_layers_keep_their_own_conditions():
+    """
+    Test the async page objects register their conditions apart from
+    the sync ones, whichever layer is imported last.
+    """
+    assert ready_for("/products", AsyncBasePage) is AsyncProductsPage.ready
+    assert ready_for("/products", BasePage) is ProductsPage.ready
+    assert AsyncProductsPage.ready is not ProductsPage.ready
+
+
+def test_goto_waits_for_navigation_event_and_key_element():
+    """
+    Test goto() waits for `wait_until` and then for the key element,
+    and for nothing more on pages without a condition.
+    """
+    page = FakePage()
+    BasePage(page, "http://shop").goto("/products")
+    BasePage(page, "http://shop").goto("/brand_products/Polo")
+
+    assert page.log == [
+        "goto http://shop/products domcontentloaded",
+        "wait div.features_items visible",
+        "goto http://shop/brand_products/Polo domcontentloaded",
+    ]
+
+
+def test_goto_waits_for_response_and_load_state(monkeypatch):
+    """
+    Test a condition with a response and a load state waits for both.
+    """
+    ready = Ready(
+        "div.features_items", response="**/api/productsList", state="load"
+    )
+    monkeypatch.setitem(BasePage.ready_by_path, "/products", ready)
+    monkeypatch.setattr(BasePage, "wait_until", "commit")
+    page = FakePage()
+    BasePage(page, "http://shop").goto("/products")
+
+    assert page.log == [
+        "expect **/api/productsList",
+        "goto http://shop/products commit",
+        "response **/api/productsList",
+        "load load",
+        "wait div.features_items visible",
+    ]
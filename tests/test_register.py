@@ -36,8 +36,7 @@ def test_register_new_user(login_signup_page):
 
     login_signup_page.verify_logged_in_user(RANDOM_USER["name"])
 
-    login_signup_page.click_delete_account_in_navbar()
-    login_signup_page.click_continue_button()
+    login_signup_page.delete_account()
 
 
 def test_register_existing_email(login_signup_page):
@@ -0,0 +1,67 @@
+"""
+    Test the reporting modes of the page object steps without a browser.
+"""
+import allure_commons
+import pytest
+from helpers import reporting
+from helpers.reporting import step
+
+
+class StepRecorder:
+    """
+    Records the titles of the Allure steps that are started.
+    """
+
+    def __init__(self):
+        self.titles = []
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self.titles.append(title)
+
+
+@step("Fill element with text: {text}", primitive=True)
+def fill(text):
+    return text
+
+
+@step("Fill name: {name}")
+def fill_name(name):
+    return fill(name)
+
+
+@step("Fill signup form")
+def fill_signup_form(name):
+    return fill_name(name)
+
+
+@pytest.fixture
+def recorder():
+    """
+    Fixture to record started steps and restore the reporting mode.
+    """
+    mode = reporting.get_mode()
+    recorder = StepRecorder()
+    allure_commons.plugin_manager.register(recorder)
+    yield recorder
+    allure_commons.plugin_manager.unregister(recorder)
+    reporting.set_mode(mode)
+
+
+@pytest.mark.parametrize("mode, titles", [
+    ("full", [
+        "Fill signup form",
+        "Fill name: 'Jane'",
+        "Fill element with text: 'Jane'",
+    ]),
+    ("summary", ["Fill signup form"]),
+    ("off", []),
+])
+def test_reporting_mode_selects_steps(recorder, mode, titles):
+    """
+    Test each mode reports its steps and the results are unchanged.
+    """
+    reporting.set_mode(mode)
+
+    assert fill_signup_form("Jane") == "Jane"
+    assert recorder.titles == titles
@@ -0,0 +1,130 @@
+"""
+    Test the request blocking profiles without a browser.
+"""
+import pytest
+from helpers.resource_blocking import RequestBlocker, build_blocker
+
+BASE_URL = "https://automationexercise.com"
+
+
+class FakeRequest:
+    """Request of a URL and resource type."""
+
+    def __init__(self, url, resource_type):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeRoute:
+    """
+    Route that records whether it was aborted or handed on.
+    """
+
+    def __init__(self, url, resource_type="script"):
+        self.request = FakeRequest(url, resource_type)
+        self.outcome = None
+
+    def abort(self, error_code=None):
+        self.outcome = error_code
+
+    def fallback(self):
+        self.outcome = "fallback"
+
+
+class FakeContext:
+    """Context that records its route handlers in order."""
+
+    def __init__(self):
+        self.handlers = []
+
+    def route(self, url, handler):
+        self.handlers.append(handler)
+
+
+def handle(blocker, url, resource_type="script"):
+    route = FakeRoute(url, resource_type)
+    blocker._handle(route)
+    return route.outcome
+
+
+@pytest.mark.parametrize("profile, url, resource_type, allowed", [
+    ("ads", "https://www.googletagmanager.com/gtm.js", "script", False),
+    ("ads", "https://fonts.gstatic.com/s/font.woff2", "font", False),
+    ("ads", "https://cdn.example.com/lib.js", "script", True),
+    ("strict", "https://cdn.example.com/lib.js", "script", False),
+    ("strict", "https://automationexercise.com/products", "document", True),
+    ("media-off", "https://automationexercise.com/logo.png", "image", False),
+    ("media-off", "https://automationexercise.com/main.css", "stylesheet",
+     True),
+])
+def test_profiles(profile, url, resource_type, allowed):
+    """
+    Test each built-in profile blocks its domains and resource types.
+    """
+    blocker = build_blocker(profile, BASE_URL)
+    assert blocker.allows(url, resource_type) is allowed
+
+
+def test_allow_overrides_extend_a_profile():
+    """
+    Test allowed domains and types pass although the profile denies
+    them, and deny overrides add to the profile.
+    """
+    blocker = build_blocker(
+        "strict", BASE_URL, allow_domains=["cdn.example.com"],
+        deny_types=["media"]
+    )
+    assert blocker.allows("https://img.cdn.example.com/a.png", "image")
+    assert not blocker.allows("https://automationexercise.com/a.mp4",
+                              "media")
+
+    blocker = build_blocker("media-off", BASE_URL, allow_types=["image"])
+    assert blocker.allows("https://automationexercise.com/a.png", "image")
+    assert not blocker.allows("https://automationexercise.com/a.woff",
+                              "font")
+
+
+def test_build_blocker_profiles():
+    """
+    Test "off" builds no blocker unless overridden, and unknown profiles
+    are rejected.
+    """
+    assert build_blocker("off", BASE_URL) is None
+    blocker = build_blocker("off", BASE_URL, deny_types=["image"])
+    assert blocker.first_party == "automationexercise.com"
+    assert not blocker.allows("https://automationexercise.com/a.png",
+                              "image")
+    with pytest.raises(ValueError, match="Unknown blocking profile"):
+        build_blocker("none", BASE_URL)
+
+
+def test_blocked_requests_are_aborted_and_counted():
+    """
+    Test denied requests are aborted and counted by host, and allowed
+    ones are handed on to the routes installed before the blocker.
+    """
+    blocker = build_blocker("ads", BASE_URL)
+    context = FakeContext()
+    blocker.install(context)
+
+    assert context.handlers == [blocker._handle]
+    assert handle(blocker, "https://doubleclick.net/ad.js") == (
+        "blockedbyclient"
+    )
+    assert handle(blocker, "https://doubleclick.net/pixel") == (
+        "blockedbyclient"
+    )
+    assert handle(blocker, f"{BASE_URL}/products", "document") == "fallback"
+    assert (blocker.blocked, blocker.passed) == (2, 1)
+    assert blocker.summary().splitlines() == [
+        "blocked: 2, passed: 1", "  doubleclick.net: 2"
+    ]
+
+
+def test_first_party_subdomains_pass_strict_profile():
+    """
+    Test the strict profile lets subdomains of the application through.
+    """
+    blocker = RequestBlocker("shop.test", first_party_only=True)
+    assert blocker.allows("https://static.shop.test/app.js", "script")
+    assert not blocker.allows("https://shop.test.evil.com/", "document")
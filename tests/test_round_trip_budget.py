@@ -0,0 +1,106 @@
+"""
+    Test the round-trip profiler and budgets without a browser.
+"""
+from collections import Counter
+import pytest
+from helpers import reporting
+from helpers.reporting import step
+from helpers.round_trip_budget import (
+    RoundTripBudgets, RoundTripProfiler, summarize
+)
+
+
+class FakeCounter:
+    """
+    Round-trip counter driven by the test.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.by_method = Counter()
+
+    def start(self):
+        pass
+
+    def send(self, method, count=1):
+        self.total += count
+        self.by_method[method] += count
+
+
+counter = FakeCounter()
+
+
+@step("Wait for element", primitive=True)
+def wait_for():
+    counter.send("waitForSelector")
+
+
+@step("Verify products list is visible")
+def verify_products_list_visible():
+    for _ in range(3):
+        wait_for()
+    counter.send("evaluateExpression")
+
+
+@pytest.fixture
+def profiler():
+    """
+    Profiler of the page object steps, on the fake counter.
+    """
+    profiler = RoundTripProfiler(counter)
+    reporting.set_profiler(profiler)
+    yield profiler
+    reporting.set_profiler(None)
+
+
+def test_profile_counts_tests_and_nested_methods(profiler):
+    """
+    Test a profile counts every round trip by protocol method and by
+    page object method, including the methods it calls.
+    """
+    counter.send("goto")
+    profiler.start()
+    verify_products_list_visible()
+    counter.send("click", 2)
+    profile = profiler.stop()
+
+    assert profile["round_trips"] == 6
+    assert profile["protocol"] == {
+        "waitForSelector": 3, "click": 2, "evaluateExpression": 1
+    }
+    methods = {
+        name.rsplit(".", 1)[-1]: (stats["calls"], stats["round_trips"])
+        for name, stats in profile["methods"].items()
+    }
+    assert methods == {
+        "verify_products_list_visible": (1, 4),
+        "wait_for": (3, 3),
+    }
+
+
+def test_budgets_limit_and_summary(tmp_path):
+    """
+    Test the budget limit includes the margin, budgets are saved and
+    the summary sums the methods over the tests.
+    """
+    budgets = RoundTripBudgets(tmp_path / "budgets.json")
+    assert budgets.limit("test_a", 0.2) is None
+
+    budgets.record("test_a", 50)
+    budgets.save()
+    budgets = RoundTripBudgets(tmp_path / "budgets.json")
+    assert "test_a" in budgets
+    assert budgets.limit("test_a", 0.2) == 60
+
+    method = {"calls": 1, "round_trips": 4, "seconds": 0.5}
+    profiles = {
+        name: {"call": {"round_trips": 10, "methods": {"verify": method}}}
+        for name in ("test_b", "test_a")
+    }
+    summary = summarize(profiles, ["test_b"], 0.2)
+    assert summary["round_trips"] == 20
+    assert list(summary["tests"]) == ["test_a", "test_b"]
+    assert summary["over_budget"] == ["test_b"]
+    assert summary["methods"] == {
+        "verify": {"calls": 2, "round_trips": 8, "seconds": 1.0}
+    }
@@ -0,0 +1,21 @@
+"""
+    Test the driver round-trip counter without a browser.
+"""
+from playwright.sync_api import sync_playwright
+from helpers.round_trips import RoundTripCounter
+
+
+def test_round_trip_counter_counts_driver_calls():
+    """
+    Test calls are counted by protocol method only while counting.
+    """
+    with sync_playwright() as p:
+        with RoundTripCounter() as counter:
+            request_context = p.request.new_context()
+            request_context.dispose()
+
+        assert counter.total == 2
+        assert counter.by_method == {"newRequest": 1, "dispose": 1}
+
+        p.request.new_context().dispose()
+        assert counter.total == 2
@@ -0,0 +1,125 @@
+"""
+    Test the longest-first xdist scheduler without starting workers.
+"""
+from types import SimpleNamespace
+from helpers.scheduling import (
+    DEFAULT_ESTIMATE, FILE_ESTIMATES, DurationHistory, LPTScheduling,
+    LPTSchedulerPlugin, lpt_makespan
+)
+
+HISTORY = {
+    "tests/test_cases.py::test_cases_page": 5.0,
+    "tests/test_login.py::test_login": 20.0,
+    "tests/test_login.py::test_logout": 30.0,
+    "tests/test_products.py::test_search": 60.0,
+}
+
+
+class FakeConfig:
+    """
+    The options LoadScheduling reads, for two workers.
+    """
+
+    def getvalue(self, name):
+        return ["2*popen"]
+
+    def __init__(self, dist="load"):
+        self.dist = dist
+
+    def getoption(self, name):
+        return self.dist if name == "dist" else None
+
+
+class FakeNode:
+    """
+    Records the tests sent to a worker.
+    """
+
+    def __init__(self, worker_id):
+        self.gateway = SimpleNamespace(id=worker_id)
+        self.shutting_down = False
+        self.received = []
+
+    def send_runtest_some(self, indices):
+        self.received.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def test_estimate_falls_back_to_file_history(tmp_path):
+    """
+    Test unseen tests are estimated from their file, then the defaults.
+    """
+    path = tmp_path / "durations.json"
+    history = DurationHistory(path)
+    history.update(HISTORY)
+    history.save()
+    history = DurationHistory(path)
+
+    assert history.estimate("tests/test_login.py::test_logout") == 30.0
+    assert history.estimate("tests/test_login.py::test_new") == 25.0
+    assert (history.estimate("tests/test_order.py::test_new")
+            == FILE_ESTIMATES["tests/test_order.py"])
+    assert history.estimate("tests/test_new.py::test") == DEFAULT_ESTIMATE
+
+    history.update({"tests/test_login.py::test_logout": 10.0})
+    assert history.estimate("tests/test_login.py::test_logout") == 20.0
+
+
+def test_lpt_makespan():
+    """
+    Test the predicted makespan of a longest-first schedule.
+    """
+    assert lpt_makespan([3, 3, 2, 2, 2], 2) == 7
+    assert lpt_makespan([5, 1], 4) == 5
+
+
+def test_scheduler_dispatches_longest_first(tmp_path):
+    """
+    Test the workers get the longest tests first and one more test
+    for every test they finish.
+    """
+    history = DurationHistory(tmp_path / "durations.json")
+    history.update(HISTORY)
+    collection = [*HISTORY, "tests/test_order.py::test_place_order"]
+    scheduler = LPTScheduling(FakeConfig(), history=history)
+    nodes = [FakeNode("gw0"), FakeNode("gw1")]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, collection)
+
+    scheduler.schedule()
+
+    assert [collection[i] for i in nodes[0].received] == [
+        "tests/test_order.py::test_place_order",
+        "tests/test_login.py::test_logout",
+    ]
+    assert [collection[i] for i in nodes[1].received] == [
+        "tests/test_products.py::test_search",
+        "tests/test_login.py::test_login",
+    ]
+    assert scheduler.predicted_makespan == 120.0
+    assert scheduler.with_history == 4
+
+    scheduler.mark_test_complete(nodes[1], nodes[1].received[0])
+    assert collection[nodes[1].received[-1]] == (
+        "tests/test_cases.py::test_cases_page"
+    )
+    scheduler.mark_test_complete(nodes[1], nodes[1].received[1])
+    assert nodes[1].shutting_down
+    assert not nodes[0].shutting_down
+
+
+def test_plugin_only_replaces_the_load_distribution(tmp_path):
+    """
+    Test the plugin schedules the `load` distribution and leaves the
+    other --dist modes to xdist.
+    """
+    plugin = LPTSchedulerPlugin(DurationHistory(tmp_path / "durations.json"))
+    assert plugin.pytest_xdist_make_scheduler(
+        FakeConfig("loadscope"), None
+    ) is None
+    assert isinstance(
+        plugin.pytest_xdist_make_scheduler(FakeConfig(), None), LPTScheduling
+    )
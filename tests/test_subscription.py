@@ -1,28 +1,16 @@
 """
     Test the newsletter subscription.
 """
-import time
-from faker import Faker
 from pages.home_page import HomePage
 from test_data.home_data import SUBSCRIPTION_TITLE
 
-fake = Faker()
 
-
-def generate_random_email():
-    """
-    Generate a random email using a fake first name and the current timestamp.
-    """
-    timestamp = int(time.time())
-    return f"{fake.first_name().lower()}.{timestamp}@example.com"
-
-
-def test_subscription_from_home_page(page, base_url):
+def test_subscription_from_home_page(page, base_url, identity):
     """
     Test the newsletter subscription form from the home page.
     """
     home = HomePage(page, base_url)
-    random_email = generate_random_email()
+    random_email = identity.email("subscriber")
 
     home.goto("/")
     home.scroll_to_footer()
@@ -32,15 +20,13 @@ def test_subscription_from_home_page(page, base_url):
     home.verify_success_message("You have been successfully subscribed!")
 
 
-def test_subscription_from_cart_page(page, base_url):
+def test_subscription_from_cart_page(pages, cart_page, identity):
     """
     Test the newsletter subscription form from the cart page.
     """
-    home = HomePage(page, base_url)
-    random_email = generate_random_email()
+    home = pages.home
+    random_email = identity.email("subscriber")
 
-    home.goto("/")
-    home.go_to_cart_page()
     home.scroll_to_footer()
     home.verify_subscription_text(SUBSCRIPTION_TITLE)
     home.fill_subscription_form(random_email)
@@ -0,0 +1,113 @@
+"""
+    Test the multi-tab runner without a browser.
+"""
+import pytest
+from helpers.tabs import MultiTab
+
+
+class FakePage:
+    """
+    Page that logs navigation and load waits.
+    """
+
+    def __init__(self, log):
+        self.log = log
+        self.closed = False
+
+    def goto(self, url, wait_until=None, timeout=None):
+        self.log.append(f"goto {url} {wait_until}")
+
+    def wait_for_load_state(self, state):
+        self.log.append(f"load {state}")
+
+    def locator(self, selector, has_text=None):
+        return FakeLocator(self.log, selector)
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakeLocator:
+    """
+    Locator that logs waits for its element.
+    """
+
+    def __init__(self, log, selector):
+        self.log = log
+        self.selector = selector
+
+    def wait_for(self, state=None, timeout=None):
+        self.log.append(f"ready {self.selector}")
+
+
+class FakeContext:
+    """
+    Context that hands out fake pages.
+    """
+
+    def __init__(self):
+        self.log = []
+        self.pages = []
+
+    def new_page(self):
+        self.pages.append(FakePage(self.log))
+        return self.pages[-1]
+
+
+def stepped(log, name, fail=False):
+    def check(pages):
+        log.append(f"{name} click")
+        yield
+        if fail:
+            raise AssertionError(f"{name} header differs")
+        log.append(f"{name} verify")
+    return check
+
+
+def test_tabs_navigate_first_and_interleave_checks():
+    """
+    Test every tab starts navigating before any check runs, waits for
+    its page to be ready and the checks take turns at their yields.
+    """
+    context = FakeContext()
+    tabs = MultiTab(context, "http://shop")
+    tabs.add("women", "/products", stepped(context.log, "women"))
+    tabs.add("kids", "/products", stepped(context.log, "kids"))
+    tabs.add("plain", "/unknown", lambda pages: context.log.append("plain"))
+
+    tabs.run()
+
+    assert context.log == [
+        "goto http://shop/products commit",
+        "goto http://shop/products commit",
+        "goto http://shop/unknown commit",
+        "ready div.features_items", "ready div.features_items", "load load",
+        "women click", "kids click", "plain",
+        "women verify", "kids verify",
+    ]
+    assert all(page.closed for page in context.pages)
+
+
+def test_tab_failures_are_merged():
+    """
+    Test the other tabs finish when one fails and all failures are
+    raised together.
+    """
+    context = FakeContext()
+    tabs = MultiTab(context, "http://shop")
+    tabs.add("women", "/products", stepped(context.log, "women", True))
+    tabs.add("kids", "/products", stepped(context.log, "kids"))
+    tabs.add("brands", "/products", stepped(context.log, "brands", True))
+
+    with pytest.raises(AssertionError) as error:
+        tabs.run()
+
+    assert "kids verify" in context.log
+    assert str(error.value) == (
+        "2 of 3 tabs failed:\n"
+        "[women] AssertionError: women header differs\n"
+        "[brands] AssertionError: brands header differs"
+    )